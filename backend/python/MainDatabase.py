@@ -1,24 +1,54 @@
+import argparse
+
 import data_create.namespace_pop as popNameSpaces
 import data_create.entity_pop as popEntities
 import data_create.clean_table as clean
 import data_create.var_pop as popVariables
+from data_create import connection
+
+def main(full_reload=False, library=None):
+    """
+    Load every library found in ../output into the database.
 
-def main():
-    # Clean tables in proper order (children first, then parents)
-    clean.clean_table("Variables")    # Clean first (references Entities)
-    #clean.clean_table("Constants")    # Clean second (references Entities)
-    clean.clean_table("Functions")    # Clean third (references Classes and Namespaces)
-    clean.clean_table("Classes")      # Clean fourth (references Namespaces)
-    clean.clean_table("Entities")     # Clean fifth (references Namespaces)
-    clean.clean_table("Namespaces")   # Clean last (parent table)
+    By default the load is incremental: files whose hash is recorded in
+    ProcessedFiles are skipped and changed files only replace their own rows.
+    With full_reload=True all tables are truncated and everything is reloaded.
+    With library set, only that library is purged (its namespaces, classes,
+    functions, variables, aliases and file hashes) and loaded again, with or without
+    full_reload; the other libraries keep their rows.
+
+    Credentials come from data_create.connection (DYNAM_DB_DSN or the
+    DYNAM_DB_* variables, defaulting to the local development database).
+    """
+    if full_reload and not library:
+        # TRUNCATE in proper order (children first, then parents)
+        clean.reset_tables(["Variables", "Functions", "Classes", "Aliases", "Namespaces", "ProcessedFiles"])
+    elif library:
+        # Drop only this library's rows; the load below re-creates them
+        clean.purge_library(library)
     
     # Populate namespaces
-    popNameSpaces.populate_namespaces_from_output("../output")
+    popNameSpaces.populate_namespaces_from_output("../output", specific_library=library)
     
     # Populate classes and functions based on namespaces
-    popEntities.populate_entities_from_namespaces("../output")
+    # File hashes are recorded by populate_variables, once each file is fully loaded
+    reloaded = popEntities.populate_entities_from_namespaces("../output", specific_library=library,
+                                                             record_hashes=False)
+
+    # Parameters only for the files that were (re)loaded above
+    popVariables.populate_variables("../output", specific_library=library, namespaces=reloaded)
 
-    popVariables.populate_variables("../output")
+    # All stages share the pooled connection (see data_create/connection.py)
+    stats = connection.pool_stats()
+    print(f"Database connections: {stats['created']} opened, {stats['reused']} reused, "
+          f"{stats['acquire_seconds']:.3f}s acquiring")
+    connection.POOL.close_all()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Load the generated documentation into the database.")
+    parser.add_argument("--full", action="store_true",
+                        help="Wipe all tables and reload every file instead of loading incrementally")
+    parser.add_argument("--library", default=None,
+                        help="Purge and reload only this library, leaving the others untouched")
+    args = parser.parse_args()
+    main(full_reload=args.full, library=args.library)
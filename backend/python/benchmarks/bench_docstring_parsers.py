@@ -0,0 +1,331 @@
+"""
+Benchmark dos parsers de docstring e de get_function_signature do pop_general.
+
+As medições usam um corpus congelado (benchmarks/fixtures/docstring_corpus.json)
+com docstrings da biblioteca padrão e uma amostra de numpy, torch, jax e
+tensorflow (LIBRARY_MODULES), as bibliotecas para as quais os parsers foram
+escritos, para que execuções diferentes meçam exatamente o mesmo texto. O
+corpus registra o comando que o gerou e as versões das bibliotecas. Para cada parser são reportadas docstrings/s e a latência por
+docstring (p50/p95/p99/máx). Um resultado pode ser salvo como baseline e
+execuções seguintes comparadas com ele: a comparação falha (código de saída
+1) se algum parser ficar mais lento que a tolerância.
+
+Uso (a partir de backend/python):
+    pip install numpy torch "jax[cpu]" tensorflow-cpu                # só para --freeze
+    python benchmarks/bench_docstring_parsers.py --freeze           # regrava o corpus
+    python benchmarks/bench_docstring_parsers.py [--repeat N]
+    python benchmarks/bench_docstring_parsers.py --save-baseline benchmarks/baseline.json
+    python benchmarks/bench_docstring_parsers.py --compare benchmarks/baseline.json [--tolerance 0.25] [--latency-tolerance 0.5]
+    python benchmarks/bench_docstring_parsers.py --live [--modules m1,m2,...]  # sem o corpus
+"""
+import argparse
+import contextlib
+import hashlib
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import platform
+import sys
+import time
+import warnings
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pop_general
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "docstring_corpus.json")
+
+DEFAULT_MODULES = [
+    "argparse", "asyncio", "collections", "concurrent.futures", "csv", "datetime",
+    "decimal", "email", "functools", "http.client", "inspect", "json", "logging",
+    "os", "pathlib", "re", "shutil", "socket", "sqlite3", "statistics", "string",
+    "subprocess", "tarfile", "threading", "typing", "unittest", "urllib.request",
+    "xml.etree.ElementTree", "zipfile",
+]
+
+# Bibliotecas amostradas no corpus (todas precisam estar instaladas para --freeze)
+LIBRARY_MODULES = {
+    "numpy": ["numpy", "numpy.linalg", "numpy.fft", "numpy.random", "numpy.ma", "numpy.polynomial"],
+    "torch": ["torch", "torch.nn", "torch.nn.functional", "torch.linalg", "torch.fft", "torch.optim",
+              "torch.utils.data"],
+    "jax": ["jax", "jax.numpy", "jax.lax", "jax.random", "jax.nn", "jax.scipy.linalg"],
+    "tensorflow": ["tensorflow", "tensorflow.math", "tensorflow.nn", "tensorflow.linalg", "tensorflow.signal",
+                   "tensorflow.keras.layers"],
+}
+
+FREEZE_COMMAND = "python benchmarks/bench_docstring_parsers.py --freeze"
+
+PARSERS = [
+    "parse_numpy_tensorflow_style",
+    "parse_torch_docstring",
+    "parse_jax_docstring",
+    "parse_requests_docstring",
+    "parse_generic_docstring",
+]
+
+SIGNATURE_BENCHMARK = "get_function_signature"
+
+
+def _iter_module_objects(module_names):
+    """(módulo, qualname, objeto) do módulo e das suas classes, funções e métodos públicos."""
+    warnings.filterwarnings("ignore")
+    for module_name in module_names:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        yield module_name, "", module
+        for name in dir(module):
+            obj = pop_general.safe_extract(module, name)
+            if obj is None:
+                continue
+            yield module_name, name, obj
+            if inspect.isclass(obj):
+                for method_name in dir(obj):
+                    method = pop_general.safe_extract(obj, method_name)
+                    if method is not None:
+                        yield module_name, f"{name}.{method_name}", method
+
+
+def collect_docstrings(module_names):
+    """Docstrings (não vazias, sem repetição) dos módulos, classes, funções e métodos."""
+    docs = []
+    seen = set()
+    for _, _, obj in _iter_module_objects(module_names):
+        doc = getattr(obj, "__doc__", None)
+        if isinstance(doc, str) and doc and doc not in seen:
+            seen.add(doc)
+            docs.append(doc)
+    return docs
+
+
+def collect_callables(module_names):
+    """Referências "módulo:qualname" das funções e métodos públicos (sem classes)."""
+    refs = []
+    for module_name, qualname, obj in _iter_module_objects(module_names):
+        if qualname and callable(obj) and not inspect.isclass(obj) and not qualname.split(".")[-1].startswith("_"):
+            refs.append(f"{module_name}:{qualname}")
+    return refs
+
+
+def _sample(items, limit):
+    """Até `limit` itens escolhidos de forma determinística (pelo hash), na ordem original."""
+    if limit is None or len(items) <= limit:
+        return list(items)
+    ranked = sorted(items, key=lambda item: hashlib.sha1(item.encode("utf-8")).hexdigest())
+    chosen = set(ranked[:limit])
+    return [item for item in items if item in chosen]
+
+
+def freeze_corpus(path=CORPUS_PATH, libraries=None, max_stdlib_docstrings=1600, max_library_docstrings=600,
+                  max_callables=2000):
+    """
+    Coleta o corpus e o grava em `path`: até max_stdlib_docstrings
+    docstrings da biblioteca padrão e até max_library_docstrings de cada
+    biblioteca de `libraries` (padrão: LIBRARY_MODULES), que precisam estar
+    instaladas. Os callables vêm só da biblioteca padrão, para que o
+    benchmark de assinaturas rode em qualquer ambiente. Devolve o corpus.
+    """
+    if libraries is None:
+        libraries = LIBRARY_MODULES
+    missing = [library for library in libraries if importlib.util.find_spec(library) is None]
+    if missing:
+        raise RuntimeError(f"Bibliotecas do corpus não instaladas: {', '.join(missing)}")
+    docstrings = _sample(collect_docstrings(DEFAULT_MODULES), max_stdlib_docstrings)
+    counts = {"stdlib": len(docstrings)}
+    versions = {}
+    seen = set(docstrings)
+    for library, module_names in libraries.items():
+        versions[library] = str(getattr(importlib.import_module(library), "__version__", None))
+        sample = _sample([doc for doc in collect_docstrings(module_names) if doc not in seen], max_library_docstrings)
+        seen.update(sample)
+        docstrings.extend(sample)
+        counts[library] = len(sample)
+    corpus = {
+        "python": platform.python_version(),
+        "generator": FREEZE_COMMAND,
+        "versions": versions,
+        "modules": DEFAULT_MODULES + [name for module_names in libraries.values() for name in module_names],
+        "docstring_counts": counts,
+        "docstrings": docstrings,
+        "callables": _sample(collect_callables(DEFAULT_MODULES), max_callables),
+    }
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(corpus, f, indent=0, ensure_ascii=False)
+    return corpus
+
+
+def load_corpus(path=CORPUS_PATH):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve_callables(refs):
+    """Objetos das referências "módulo:qualname" que ainda existem (module_name, obj)."""
+    warnings.filterwarnings("ignore")
+    resolved = []
+    for ref in refs:
+        module_name, qualname = ref.split(":", 1)
+        try:
+            obj = importlib.import_module(module_name)
+            for part in qualname.split("."):
+                obj = getattr(obj, part)
+        except Exception:
+            continue
+        resolved.append((module_name, obj))
+    return resolved
+
+
+def _percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _summarize(per_item_ns, total_seconds):
+    latencies = sorted(per_item_ns)
+    return {
+        "items": len(latencies),
+        "per_second": len(latencies) / total_seconds if total_seconds else 0.0,
+        "p50_us": _percentile(latencies, 0.50) / 1000,
+        "p95_us": _percentile(latencies, 0.95) / 1000,
+        "p99_us": _percentile(latencies, 0.99) / 1000,
+        "max_us": latencies[-1] / 1000,
+    }
+
+
+def _measure(call, items, repeat, setup=None):
+    """
+    Executa `call` em cada item `repeat` vezes. Usa o menor tempo de cada
+    item entre as passadas (menos ruído) e a melhor passada inteira para
+    a vazão. `setup` é chamado antes de cada passada.
+    """
+    best_item = [None] * len(items)
+    best_total = None
+    clock = time.perf_counter_ns
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stderr(devnull):
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            for i, item in enumerate(items):
+                t0 = clock()
+                try:
+                    call(item)
+                except Exception:
+                    pass
+                elapsed = clock() - t0
+                if best_item[i] is None or elapsed < best_item[i]:
+                    best_item[i] = elapsed
+            total = time.perf_counter() - start
+            best_total = total if best_total is None else min(best_total, total)
+    return _summarize(best_item, best_total)
+
+
+def measure_parser(parser, docs, repeat):
+    """Vazão e latência por docstring de um parser."""
+    return _measure(parser, docs, repeat)
+
+
+def measure_signatures(resolved_callables, repeat):
+    """
+    Vazão e latência de get_function_signature sobre os callables do corpus.
+    O SIGNATURE_CACHE é limpo a cada passada: mede-se o custo de uma
+    execução, em que só os callables repetidos no corpus vêm do cache.
+    """
+    return _measure(lambda item: pop_general.get_function_signature(item[1], item[0]),
+                    resolved_callables, repeat, setup=pop_general.SIGNATURE_CACHE.clear)
+
+
+def run_suite(corpus, repeat=3, parsers=PARSERS):
+    results = {}
+    for parser_name in parsers:
+        results[parser_name] = measure_parser(getattr(pop_general, parser_name), corpus["docstrings"], repeat)
+    callables = resolve_callables(corpus.get("callables", []))
+    if callables:
+        results[SIGNATURE_BENCHMARK] = measure_signatures(callables, repeat)
+    return results
+
+
+def compare_to_baseline(results, baseline, tolerance=0.25, latency_tolerance=0.5):
+    """
+    Mensagens de regressão: benchmarks cuja vazão caiu mais que `tolerance`,
+    ou cujo p99 subiu mais que `latency_tolerance` (frações), em relação ao
+    baseline. A cauda é mais ruidosa que a vazão, daí a tolerância maior.
+    """
+    regressions = []
+    for name, base in baseline.get("results", {}).items():
+        current = results.get(name)
+        if current is None:
+            continue
+        if current["per_second"] < base["per_second"] * (1 - tolerance):
+            regressions.append(f"{name}: {current['per_second']:.0f}/s (baseline {base['per_second']:.0f}/s)")
+        if current["p99_us"] > base["p99_us"] * (1 + latency_tolerance):
+            regressions.append(f"{name}: p99 {current['p99_us']:.1f}us (baseline {base['p99_us']:.1f}us)")
+    return regressions
+
+
+def print_results(results):
+    print(f"{'benchmark':32s} {'itens/s':>10s} {'p50 us':>9s} {'p95 us':>9s} {'p99 us':>9s} {'máx us':>10s}")
+    for name, r in results.items():
+        print(f"{name:32s} {r['per_second']:10.0f} {r['p50_us']:9.1f} {r['p95_us']:9.1f} "
+              f"{r['p99_us']:9.1f} {r['max_us']:10.1f}")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Benchmark dos parsers de docstring.")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    arg_parser.add_argument("--corpus", default=CORPUS_PATH, help="Arquivo do corpus congelado")
+    arg_parser.add_argument("--freeze", action="store_true",
+                            help="Regrava o corpus (exige numpy, torch, jax e tensorflow instalados) e sai")
+    arg_parser.add_argument("--live", action="store_true",
+                            help="Coleta as docstrings de --modules em vez de usar o corpus")
+    arg_parser.add_argument("--modules", default=",".join(DEFAULT_MODULES))
+    arg_parser.add_argument("--save-baseline", metavar="PATH", help="Grava os resultados como baseline")
+    arg_parser.add_argument("--compare", metavar="PATH", help="Compara com um baseline salvo")
+    arg_parser.add_argument("--tolerance", type=float, default=0.25,
+                            help="Queda de vazão aceita em relação ao baseline (fração, padrão 0.25)")
+    arg_parser.add_argument("--latency-tolerance", type=float, default=0.5,
+                            help="Aumento de p99 aceito em relação ao baseline (fração, padrão 0.5)")
+    args = arg_parser.parse_args(argv)
+
+    if args.freeze:
+        corpus = freeze_corpus(args.corpus)
+        print(f"Corpus gravado em {args.corpus}: {len(corpus['docstrings'])} docstrings "
+              f"({corpus['docstring_counts']}), {len(corpus['callables'])} callables; versões {corpus['versions']}")
+        return 0
+
+    if args.live:
+        module_names = args.modules.split(",")
+        corpus = {"docstrings": collect_docstrings(module_names),
+                  "callables": collect_callables(module_names)}
+    else:
+        corpus = load_corpus(args.corpus)
+    print(f"{len(corpus['docstrings'])} docstrings, {len(corpus.get('callables', []))} callables")
+
+    results = run_suite(corpus, repeat=args.repeat)
+    print_results(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "repeat": args.repeat, "results": results},
+                      f, indent=2)
+        print(f"Baseline gravado em {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance, args.latency_tolerance)
+        if regressions:
+            print("Regressões em relação ao baseline:")
+            for message in regressions:
+                print(f"  {message}")
+            return 1
+        print("Sem regressões em relação ao baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+Benchmark ponta a ponta dos loaders (namespace_pop, entity_pop, var_pop).
+
+Gera uma árvore sintética output/<lib>/*.json (ou *.jsonl) com o número
+pedido de módulos, classes, métodos, funções e parâmetros e a carrega num
+SQLite local com o mesmo schema das tabelas Kotlin (data_create/sqlite_schema),
+passado aos loaders pelo pool de conexões. Não precisa de um servidor
+MariaDB (só do pacote mariadb, importado pelos loaders). Reporta tempo e
+linhas/s de cada etapa.
+
+Uso (a partir de backend/python):
+    python benchmarks/bench_pipeline.py --modules 50 --classes 20 --methods 10 --functions 40 --params 3
+    python benchmarks/bench_pipeline.py --modules 1000 --classes 40 --methods 20 --functions 200 --format jsonl
+    python benchmarks/bench_pipeline.py ... --rerun        # mede também a recarga incremental sem mudanças
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pop_general
+from data_create import connection, entity_pop, namespace_pop, var_pop
+from data_create.sqlite_schema import connect_sqlite
+
+LIBRARY_NAME = "benchlib"
+
+
+def _documentation(kind, name, params):
+    return {
+        "description": f"{kind} {name}: synthetic description used by the pipeline benchmark.",
+        "parameters": {
+            f"p{i}": {"type": f"int, default={i}", "description": f"Parameter {i} of {name}."}
+            for i in range(params)
+        },
+        "returns": "int" if kind != "class" else "",
+        "examples": f">>> {name}()",
+    }
+
+
+def synthetic_module(module_name, classes, methods, functions, params):
+    """Dados de um módulo no formato de pop_general.extract_module_api."""
+    return {
+        "description": f"Synthetic module {module_name}.",
+        "functions": [
+            {"name": f"func_{i}", "signature": f"func_{i}(" + ", ".join(f"p{j}" for j in range(params)) + ")",
+             "documentation": _documentation("function", f"func_{i}", params)}
+            for i in range(functions)
+        ],
+        "classes": [
+            {"name": f"Class{c}", "documentation": _documentation("class", f"Class{c}", params),
+             "methods": [
+                 {"name": f"method_{m}", "signature": f"method_{m}(self)",
+                  "documentation": _documentation("method", f"method_{m}", params)}
+                 for m in range(methods)
+             ]}
+            for c in range(classes)
+        ],
+    }
+
+
+def generate_output_tree(output_dir, modules, classes, methods, functions, params,
+                         output_format="json", library_name=LIBRARY_NAME):
+    """
+    Grava output_dir/<library_name>/index.json e um arquivo por módulo
+    (mesmo layout do pop_general). Devolve o total esperado de linhas por tabela.
+    """
+    library_dir = os.path.join(output_dir, library_name)
+    os.makedirs(library_dir, exist_ok=True)
+    module_names = [f"{library_name}.mod{i:05d}" for i in range(modules)]
+    extension = pop_general.OUTPUT_EXTENSIONS[output_format]
+    for module_name in module_names:
+        data = synthetic_module(module_name, classes, methods, functions, params)
+        path = os.path.join(library_dir, pop_general.module_output_filename(module_name, library_name, extension))
+        with open(path, "w", encoding="utf-8") as f:
+            if output_format == "jsonl":
+                for record in pop_general.records_from_module_data(module_name, data):
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write("\n")
+            else:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+    with open(os.path.join(library_dir, "index.json"), "w", encoding="utf-8") as f:
+        json.dump({"library": library_name, "modules": module_names}, f, indent=2)
+    callables = modules * (classes * methods + functions)
+    return {
+        "Namespaces": modules,
+        "Classes": modules * classes,
+        "Functions": callables,
+        "Variables": (modules * classes + callables) * params,
+        "Aliases": 0,
+    }
+
+
+def _count(conn, tables):
+    return sum(conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0] for table in tables)
+
+
+# Cada etapa recebe o diretório e o resultado da anterior (os namespaces
+# recarregados pelo entity_pop, como no MainDatabase)
+STAGES = [
+    ("namespaces", ("Namespaces",), lambda out, previous: namespace_pop.populate_namespaces_from_output(out)),
+    ("entities", ("Classes", "Functions"), lambda out, previous: entity_pop.populate_entities_from_namespaces(out, record_hashes=False)),
+    ("variables", ("Variables",), lambda out, reloaded: var_pop.populate_variables(out, namespaces=reloaded)),
+]
+
+
+def run_stages(conn, output_dir, quiet=True, label=""):
+    """Executa as três etapas e devolve [(etapa, segundos, linhas inseridas)]."""
+    results = []
+    previous = None
+    for stage, tables, run in STAGES:
+        before = _count(conn, tables)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()) if quiet else contextlib.nullcontext():
+            previous = run(output_dir, previous)
+        elapsed = time.perf_counter() - start
+        results.append((f"{label}{stage}", elapsed, _count(conn, tables) - before))
+    return results
+
+
+def print_results(results):
+    print(f"{'etapa':24s} {'tempo (s)':>10s} {'linhas':>10s} {'linhas/s':>12s}")
+    for stage, elapsed, rows in results:
+        rate = rows / elapsed if elapsed else 0.0
+        print(f"{stage:24s} {elapsed:10.3f} {rows:10d} {rate:12.0f}")
+    total = sum(elapsed for _, elapsed, _ in results)
+    print(f"{'total':24s} {total:10.3f}")
+
+
+def main(argv=None):
+    arg_parser = argparse.ArgumentParser(description="Benchmark ponta a ponta dos loaders com SQLite.")
+    arg_parser.add_argument("--modules", type=int, default=50)
+    arg_parser.add_argument("--classes", type=int, default=20, help="Classes por módulo")
+    arg_parser.add_argument("--methods", type=int, default=10, help="Métodos por classe")
+    arg_parser.add_argument("--functions", type=int, default=40, help="Funções por módulo")
+    arg_parser.add_argument("--params", type=int, default=3, help="Parâmetros por classe/função/método")
+    arg_parser.add_argument("--format", choices=sorted(pop_general.OUTPUT_EXTENSIONS), default="json")
+    arg_parser.add_argument("--db", default=None,
+                            help="Arquivo SQLite (padrão: um arquivo temporário, apagado no final)")
+    arg_parser.add_argument("--rerun", action="store_true",
+                            help="Roda as etapas de novo sem mudanças (recarga incremental)")
+    arg_parser.add_argument("--verbose", action="store_true", help="Mostra a saída dos loaders")
+    args = arg_parser.parse_args(argv)
+
+    workdir = tempfile.mkdtemp(prefix="bench_pipeline_")
+    try:
+        output_dir = os.path.join(workdir, "output")
+        start = time.perf_counter()
+        expected = generate_output_tree(output_dir, args.modules, args.classes, args.methods,
+                                        args.functions, args.params, args.format)
+        entities = expected["Classes"] + expected["Functions"]
+        print(f"Árvore sintética ({args.format}): {args.modules} módulos, {entities} entidades, "
+              f"{expected['Variables']} parâmetros, gerada em {time.perf_counter() - start:.2f}s")
+
+        conn = connect_sqlite(args.db or os.path.join(workdir, "bench.db"))
+        connection.configure(config={}, connect=lambda **kwargs: conn)
+        results = run_stages(conn, output_dir, quiet=not args.verbose)
+        if args.rerun:
+            results += run_stages(conn, output_dir, quiet=not args.verbose, label="rerun ")
+        print_results(results)
+
+        for table, rows in expected.items():
+            loaded = _count(conn, (table,))
+            if loaded != rows:
+                print(f"Aviso: {table} tem {loaded} linhas, esperado {rows}")
+        connection.POOL.close_all()
+        conn.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
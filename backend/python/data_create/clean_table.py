@@ -1,26 +1,33 @@
+import os
 import mariadb
+from data_create import connection
+from data_create.processed_files import like_prefix
+
+def _rollback(conn):
+    """Roll back after a failed statement; a dropped connection is left to the pool's ping."""
+    try:
+        conn.rollback()
+    except mariadb.Error:
+        pass
 
 def clean_table(table_name):
     """
     Delete all rows from a table and reset AUTO_INCREMENT to 1.
     Skips tables that don't exist.
     """
-    config = {
-        "user": "dynam",
-        "password": "1234",
-        "host": "localhost",
-        "port": 3306,
-        "database": "dynam"
-    }
     try:
-        conn = mariadb.connect(**config)
+        conn = connection.get_connection()
+    except mariadb.Error as e:
+        print(f"Error cleaning table {table_name}: {e}")
+        return
+    try:
         cur = conn.cursor()
         
         # Check if the table exists first
         cur.execute(f"SHOW TABLES LIKE '{table_name}'")
         if not cur.fetchone():
             print(f"Table '{table_name}' doesn't exist, skipping clean operation.")
-            conn.close()
+            cur.close()
             return
         
         # If we get here, the table exists, so we can clean it
@@ -28,7 +35,91 @@ def clean_table(table_name):
         cur.execute(f"ALTER TABLE {table_name} AUTO_INCREMENT = 1;")
         conn.commit()
         cur.close()
-        conn.close()
         print(f"Table {table_name} cleaned and AUTO_INCREMENT reset.")
     except mariadb.Error as e:
-        print(f"Error cleaning table {table_name}: {e}")
\ No newline at end of file
+        _rollback(conn)
+        print(f"Error cleaning table {table_name}: {e}")
+    finally:
+        connection.release_connection(conn)
+
+# Tables of the documentation database, children first
+DOCUMENTATION_TABLES = ["Variables", "Functions", "Classes", "Aliases", "Namespaces", "ProcessedFiles"]
+
+def reset_tables(table_names=DOCUMENTATION_TABLES):
+    """
+    Empty tables with TRUNCATE (which also resets AUTO_INCREMENT) for a
+    full rebuild, using a single connection. Foreign key checks are
+    suspended meanwhile, since InnoDB refuses to TRUNCATE a referenced
+    table. Skips tables that don't exist.
+    """
+    try:
+        conn = connection.get_connection()
+    except mariadb.Error as e:
+        print(f"Error resetting tables: {e}")
+        return
+    try:
+        cur = conn.cursor()
+        cur.execute("SHOW TABLES")
+        existing = {row[0].lower() for row in cur.fetchall()}
+        
+        cur.execute("SET FOREIGN_KEY_CHECKS = 0")
+        try:
+            for table_name in table_names:
+                if table_name.lower() not in existing:
+                    print(f"Table '{table_name}' doesn't exist, skipping reset.")
+                    continue
+                cur.execute(f"TRUNCATE TABLE {table_name}")
+                print(f"Table {table_name} truncated.")
+        finally:
+            cur.execute("SET FOREIGN_KEY_CHECKS = 1")
+        conn.commit()
+        cur.close()
+    except mariadb.Error as e:
+        _rollback(conn)
+        print(f"Error resetting tables: {e}")
+    finally:
+        connection.release_connection(conn)
+
+def purge_library(library_name):
+    """
+    Delete one library: its Namespaces subtree (the library and every
+    '<library>.*' namespace) with their Classes, Functions, Variables and
+    Aliases, plus its ProcessedFiles entries, in set-based statements. Other
+    libraries are left untouched.
+    """
+    namespace_ids = "SELECT id FROM Namespaces WHERE name = ? OR name LIKE ? ESCAPE '!'"
+    class_ids = f"SELECT id FROM Classes WHERE namespace_id IN ({namespace_ids})"
+    function_ids = (
+        f"SELECT id FROM Functions WHERE parent_namespace_id IN ({namespace_ids}) "
+        f"OR parent_class_id IN ({class_ids})"
+    )
+    scope = (library_name, like_prefix(f"{library_name}."))
+    try:
+        conn = connection.get_connection()
+    except mariadb.Error as e:
+        print(f"Error purging library {library_name}: {e}")
+        return
+    try:
+        cur = conn.cursor()
+        cur.execute(f"DELETE FROM Variables WHERE class_id IN ({class_ids})", scope)
+        cur.execute(f"DELETE FROM Variables WHERE function_id IN ({function_ids})", scope * 2)
+        cur.execute(
+            f"DELETE FROM Functions WHERE parent_namespace_id IN ({namespace_ids}) "
+            f"OR parent_class_id IN ({class_ids})",
+            scope * 2
+        )
+        cur.execute(f"DELETE FROM Classes WHERE namespace_id IN ({namespace_ids})", scope)
+        cur.execute(f"DELETE FROM Aliases WHERE namespace_id IN ({namespace_ids})", scope)
+        # MariaDB refuses a subquery on the table being deleted from
+        cur.execute("DELETE FROM Namespaces WHERE name = ? OR name LIKE ? ESCAPE '!'", scope)
+        cur.execute("DELETE FROM ProcessedFiles WHERE file_path LIKE ? ESCAPE '!'",
+                    (like_prefix(f"{library_name}{os.sep}"),))
+        conn.commit()
+        cur.close()
+        print(f"Library {library_name} purged.")
+    except mariadb.Error as e:
+        # Nothing is deleted unless the whole library is
+        _rollback(conn)
+        print(f"Error purging library {library_name}: {e}")
+    finally:
+        connection.release_connection(conn)
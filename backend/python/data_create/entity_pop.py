@@ -1,24 +1,25 @@
 import os
 import json
 import mariadb
+from data_create import connection
+from data_create.module_rows import insert_module_entities, insert_module_records
+from data_create.processed_files import (file_hash, module_file, iter_jsonl_records, get_processed_hash,
+                                         mark_processed, delete_namespace_entities)
 
-# Database connection configuration
-config = {
-    "user": "dynam",
-    "password": "1234",
-    "host": "localhost",
-    "port": 3306,
-    "database": "dynam"
-}
-
-def populate_entities_from_namespaces(output_dir="../output", specific_library=None):
+def populate_entities_from_namespaces(output_dir="../output", specific_library=None, incremental=True,
+                                      record_hashes=True):
     """
     Populate Classes and Functions tables based on namespace entries.
     
     1. Reads all namespaces from the database
-    2. For each namespace, finds the corresponding JSON file
-    3. Extracts classes and functions
-    4. Inserts them into the database with proper relationships
+    2. For each namespace, finds the corresponding JSON file (or JSON Lines
+       file, which is streamed, see insert_module_records)
+    3. Skips files whose hash matches the one recorded in ProcessedFiles
+    4. Replaces the rows previously loaded from changed files
+    5. Extracts classes, functions and aliases (stored as references to the
+       owner's class or function, see module_rows.alias_row)
+    6. Inserts them into the database with proper relationships, in batches
+       (see insert_module_entities)
     
     Parameters:
     -----------
@@ -26,9 +27,20 @@ def populate_entities_from_namespaces(output_dir="../output", specific_library=N
         Path to the output directory containing the JSON files
     specific_library : str, optional
         If specified, only process namespaces for this library
+    incremental : bool, optional
+        If False, reload every file even when its hash is unchanged
+    record_hashes : bool, optional
+        If False, the hashes of the loaded files are not written to
+        ProcessedFiles; var_pop.populate_variables(namespaces=...) records
+        each one with the file's Variables, so a failed variables stage
+        leaves the file to be reloaded on the next run.
+
+    Returns the (namespace_id, namespace_name, file_key, digest) of the
+    namespaces whose file was loaded, for var_pop.populate_variables(namespaces=...).
     """
+    reloaded = []
     try:
-        conn = mariadb.connect(**config)
+        conn = connection.get_connection()
         cur = conn.cursor()
         print("Successfully connected to MariaDB database")
         
@@ -42,83 +54,40 @@ def populate_entities_from_namespaces(output_dir="../output", specific_library=N
         
         # Process each namespace
         for namespace_id, namespace_name in namespaces:
-            # Split namespace to determine path to JSON file
-            parts = namespace_name.split('.')
-            if len(parts) < 2:
+            # Determine path to JSON file from the namespace
+            file_key, json_path = module_file(output_dir, namespace_name)
+            if file_key is None:
                 # Skip namespaces that don't have module structure
                 continue
-                
-            library = parts[0]
-            module = parts[-1]  # Get last part as module name
-            
-            # Build path to JSON file
-            json_path = os.path.join(output_dir, library, f"{module}.json")
             
             if os.path.isfile(json_path):
+                digest = file_hash(json_path)
+                if incremental and get_processed_hash(cur, file_key) == digest:
+                    print(f"Skipping unchanged {json_path} for namespace {namespace_name}")
+                    continue
                 print(f"Processing {json_path} for namespace {namespace_name} (ID: {namespace_id})")
                 
-                with open(json_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    
-                    # Process classes
-                    if "classes" in data:
-                        for class_data in data["classes"]:
-                            if "name" in class_data:
-                                class_name = class_data["name"]
-                                documentation = class_data.get("documentation", {})
-                                class_description = documentation.get("description", None)
-                                class_example = documentation.get("examples", None)
-                                
-                                # Insert class with example field
-                                cur.execute(
-                                    "INSERT INTO Classes (namespace_id, name, description, example) VALUES (?, ?, ?, ?)",
-                                    (namespace_id, class_name, class_description, class_example)
-                                )
-                                class_id = cur.lastrowid
-                                # print(f"  Added class: {class_name} (ID: {class_id})")
-                                
-                                # Process methods (functions that belong to a class)
-                                if "methods" in class_data:
-                                    for method_data in class_data["methods"]:
-                                        if "name" in method_data:
-                                            method_name = method_data["name"]
-                                            method_signature = method_data.get("signature", None)
-                                            method_doc = method_data.get("documentation", {})
-                                            method_description = method_doc.get("description", None)
-                                            method_returns = method_doc.get("returns", None)
-                                            method_example = method_doc.get("examples", None)
-                                            
-                                            # Insert method with return_type and example fields
-                                            cur.execute(
-                                                "INSERT INTO Functions (parent_class_id, name, signature, description, return_type, example) VALUES (?, ?, ?, ?, ?, ?)",
-                                                (class_id, method_name, method_signature, method_description, method_returns, method_example)
-                                            )
-                                            # print(f"    Added method: {method_name}")
+                # Replace only the rows that came from this file
+                delete_namespace_entities(cur, namespace_id)
+                
+                if json_path.endswith(".jsonl"):
+                    insert_module_records(cur, namespace_id, iter_jsonl_records(json_path))
+                else:
+                    with open(json_path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
                     
-                    # Process top-level functions
-                    if "functions" in data:
-                        for function_data in data["functions"]:
-                            if "name" in function_data:
-                                function_name = function_data["name"]
-                                function_signature = function_data.get("signature", None)
-                                function_doc = function_data.get("documentation", {})
-                                function_description = function_doc.get("description", None)
-                                function_returns = function_doc.get("returns", None)
-                                function_example = function_doc.get("examples", None)
-                                
-                                # Insert function with return_type and example fields
-                                cur.execute(
-                                    "INSERT INTO Functions (parent_namespace_id, name, signature, description, return_type, example) VALUES (?, ?, ?, ?, ?, ?)",
-                                    (namespace_id, function_name, function_signature, function_description, function_returns, function_example)
-                                )
-                                # print(f"  Added function: {function_name}")
+                    insert_module_entities(cur, namespace_id, data)
+                if record_hashes:
+                    mark_processed(cur, file_key, digest)
+                reloaded.append((namespace_id, namespace_name, file_key, digest))
             else:
                 print(f"JSON file not found for namespace {namespace_name}: {json_path}")
                 
         conn.commit()
         cur.close()
-        conn.close()
+        connection.release_connection(conn)
         print("Database population completed successfully")
+        return reloaded
         
     except mariadb.Error as e:
         print(f"Error connecting to MariaDB: {e}")
@@ -127,6 +96,7 @@ def populate_entities_from_namespaces(output_dir="../output", specific_library=N
                 conn.close()
         except:
             pass
+        return []
 
 if __name__ == "__main__":
     populate_entities_from_namespaces()
\ No newline at end of file
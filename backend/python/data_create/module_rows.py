@@ -0,0 +1,342 @@
+import os
+import json
+from data_create.processed_files import namespace_file_key, iter_jsonl_records, alias_target
+
+# Loading of the module files (JSON or JSON Lines) through any DB-API cursor
+# with "?" placeholders. Nothing here imports mariadb, so sqlite_snapshot
+# works without the driver; entity_pop, var_pop, namespace_pop and the
+# pipeline call them for their MariaDB runs.
+
+CLASS_INSERT = "INSERT INTO Classes (namespace_id, name, description, example) VALUES (?, ?, ?, ?)"
+FUNCTION_INSERT = (
+    "INSERT INTO Functions (parent_class_id, parent_namespace_id, name, signature, description, return_type, example) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+ALIAS_INSERT = (
+    "INSERT INTO Aliases (namespace_id, name, type, target_namespace, target_name) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+# Functions rows buffered before each multi-row INSERT when streaming JSON Lines
+RECORD_BATCH_SIZE = 1000
+
+def function_row(parent_class_id, parent_namespace_id, function_data):
+    """Build the Functions row for a method (parent_class_id) or a top-level function (parent_namespace_id)"""
+    documentation = function_data.get("documentation", {})
+    return (
+        parent_class_id,
+        parent_namespace_id,
+        function_data["name"],
+        function_data.get("signature", None),
+        documentation.get("description", None),
+        documentation.get("returns", None),
+        documentation.get("examples", None)
+    )
+
+def alias_row(namespace_id, alias_data):
+    """
+    Build the Aliases row of a re-exported class or function: a reference
+    by name to the entity in its owner namespace, which is stored only there.
+    """
+    target_namespace, target_name = alias_target(alias_data)
+    return (
+        namespace_id,
+        alias_data["name"],
+        alias_data.get("type", "function"),
+        target_namespace,
+        target_name
+    )
+
+def insert_module_entities(cur, namespace_id, data):
+    """
+    Insert the classes, methods and functions of one module JSON using
+    batched statements: one multi-row INSERT for the classes, one lookup
+    of the new class IDs by their natural key (namespace_id, name) and
+    one multi-row INSERT for all methods and functions.
+
+    Alias entries ("aliases", written with pop_general --alias-reexports)
+    are stored as Aliases rows pointing at the owner's entity (see
+    alias_row), without copying its classes, functions or variables.
+
+    Returns the number of (classes, functions) inserted.
+    """
+    classes = [class_data for class_data in data.get("classes", []) if "name" in class_data]
+    class_ids = {}
+    if classes:
+        class_rows = []
+        for class_data in classes:
+            documentation = class_data.get("documentation", {})
+            class_rows.append((
+                namespace_id,
+                class_data["name"],
+                documentation.get("description", None),
+                documentation.get("examples", None)
+            ))
+        cur.executemany(CLASS_INSERT, class_rows)
+        
+        # Resolve class IDs in bulk instead of reading lastrowid after every insert
+        cur.execute("SELECT id, name FROM Classes WHERE namespace_id = ?", (namespace_id,))
+        class_ids = {name: class_id for class_id, name in cur.fetchall()}
+    
+    function_rows = []
+    # Methods (functions that belong to a class)
+    for class_data in classes:
+        class_id = class_ids.get(class_data["name"])
+        for method_data in class_data.get("methods", []):
+            if "name" in method_data:
+                function_rows.append(function_row(class_id, None, method_data))
+    # Top-level functions
+    for function_data in data.get("functions", []):
+        if "name" in function_data:
+            function_rows.append(function_row(None, namespace_id, function_data))
+    if function_rows:
+        cur.executemany(FUNCTION_INSERT, function_rows)
+    alias_rows = [alias_row(namespace_id, alias_data) for alias_data in data.get("aliases", [])]
+    if alias_rows:
+        cur.executemany(ALIAS_INSERT, alias_rows)
+    
+    return len(classes), len(function_rows)
+
+def insert_module_records(cur, namespace_id, records, batch_size=RECORD_BATCH_SIZE):
+    """
+    Insert the classes, methods and functions of a JSON Lines module file
+    while it is being read. Each class is inserted as soon as its record
+    arrives (its ID is needed by the methods that follow it); methods and
+    functions are sent in multi-row INSERTs of up to `batch_size` rows, so
+    memory does not grow with the size of the module. Alias records (which
+    come last) are stored as Aliases rows, as in insert_module_entities;
+    namespace and parameter records are skipped.
+
+    Returns the number of (classes, functions) inserted.
+    """
+    class_ids = {}
+    function_rows = []
+    alias_rows = []
+    n_classes = n_functions = 0
+    for record in records:
+        kind = record.get("kind")
+        if kind == "class":
+            documentation = record.get("documentation", {})
+            cur.execute(CLASS_INSERT, (
+                namespace_id,
+                record["name"],
+                documentation.get("description", None),
+                documentation.get("examples", None)
+            ))
+            class_ids[record["name"]] = cur.lastrowid
+            n_classes += 1
+        elif kind == "method":
+            function_rows.append(function_row(class_ids.get(record.get("class")), None, record))
+        elif kind == "function":
+            function_rows.append(function_row(None, namespace_id, record))
+        elif kind == "alias":
+            alias_rows.append(alias_row(namespace_id, record))
+        if len(function_rows) >= batch_size:
+            cur.executemany(FUNCTION_INSERT, function_rows)
+            n_functions += len(function_rows)
+            function_rows = []
+    if function_rows:
+        cur.executemany(FUNCTION_INSERT, function_rows)
+        n_functions += len(function_rows)
+    if alias_rows:
+        cur.executemany(ALIAS_INSERT, alias_rows)
+    return n_classes, n_functions
+
+def build_module_index(data):
+    """
+    Index a module JSON by name: first class per name, and every method
+    (per class name and method name) and function per name, in file order.
+    """
+    classes = {}
+    methods = {}
+    functions = {}
+    for class_data in data.get("classes", []):
+        class_name = class_data.get("name")
+        if class_name is not None and class_name not in classes:
+            classes[class_name] = class_data
+        for method_data in class_data.get("methods", []):
+            methods.setdefault((class_name, method_data.get("name")), []).append(method_data)
+    for function_data in data.get("functions", []):
+        functions.setdefault(function_data.get("name"), []).append(function_data)
+    return {"classes": classes, "methods": methods, "functions": functions}
+
+def load_module_index(output_dir, namespace_name, module_cache=None):
+    """
+    Load and index the JSON file of a namespace, reusing `module_cache`
+    (file key -> index) so each file is read at most once per run.
+    Returns None if the namespace has no module file.
+    """
+    file_key = namespace_file_key(namespace_name) if namespace_name else None
+    if file_key is None:
+        return None
+    if module_cache is not None and file_key in module_cache:
+        return module_cache[file_key]
+    
+    # Build path to JSON file
+    json_path = os.path.join(output_dir, file_key)
+    module_index = None
+    if os.path.isfile(json_path):
+        with open(json_path, "r", encoding="utf-8") as f:
+            module_index = build_module_index(json.load(f))
+    else:
+        print(f"JSON file not found for namespace {namespace_name}: {json_path}")
+    
+    if module_cache is not None:
+        module_cache[file_key] = module_index
+    return module_index
+
+def process_class_parameters(cur, output_dir, class_id, class_name, namespace_name, module_cache=None):
+    """Process parameters for a class and insert them into the Variables table"""
+    module_index = load_module_index(output_dir, namespace_name, module_cache)
+    if module_index is None:
+        return
+    
+    # Find the matching class
+    class_data = module_index["classes"].get(class_name)
+    if class_data is None:
+        return
+    
+    # Extract parameters
+    parameters = class_data.get("documentation", {}).get("parameters", {})
+    add_parameters_to_db(cur, parameters, class_id, None, class_name)
+
+def process_function_parameters(cur, output_dir, func_id, func_name, parent_class_id, parent_class_name, parent_class_namespace, parent_namespace_id, parent_namespace_name, module_cache=None):
+    """Process parameters for a function and insert them into the Variables table"""
+    # Determine JSON file location
+    if parent_class_id is not None:
+        # This is a method within a class
+        module_index = load_module_index(output_dir, parent_class_namespace, module_cache)
+        matches = module_index["methods"].get((parent_class_name, func_name), []) if module_index else []
+    else:
+        # This is a standalone function
+        module_index = load_module_index(output_dir, parent_namespace_name, module_cache)
+        matches = module_index["functions"].get(func_name, []) if module_index else []
+    
+    for function_data in matches:
+        parameters = function_data.get("documentation", {}).get("parameters", {})
+        add_parameters_to_db(cur, parameters, None, func_id, func_name)
+
+def namespace_entity_rows(cur, namespace_id, namespace_name):
+    """
+    Class and function rows of one namespace, in the shape selected by
+    populate_variables (methods included, through their class).
+    """
+    cur.execute("SELECT id, name FROM Classes WHERE namespace_id = ?", (namespace_id,))
+    class_rows = [(class_id, class_name, namespace_name) for class_id, class_name in cur.fetchall()]
+    
+    # Two indexed lookups instead of an OR across the join
+    cur.execute(
+        """
+        SELECT f.id, f.name, f.parent_class_id, NULL
+        FROM Functions f
+        WHERE f.parent_namespace_id = ?
+        UNION ALL
+        SELECT f.id, f.name, f.parent_class_id, c.name
+        FROM Functions f
+        JOIN Classes c ON f.parent_class_id = c.id
+        WHERE c.namespace_id = ?
+        """,
+        (namespace_id, namespace_id)
+    )
+    function_rows = [
+        (func_id, func_name, parent_class_id, parent_class_name, namespace_name, namespace_id, namespace_name)
+        for func_id, func_name, parent_class_id, parent_class_name in cur.fetchall()
+    ]
+    return class_rows, function_rows
+
+def load_module_variables(cur, namespace_id, namespace_name, data):
+    """
+    Insert the parameters of every class, method and function already loaded
+    for one namespace, reading them from the module data in memory instead
+    of its JSON file.
+    """
+    file_key = namespace_file_key(namespace_name)
+    if file_key is None:
+        return
+    module_cache = {file_key: build_module_index(data)}
+    
+    class_rows, function_rows = namespace_entity_rows(cur, namespace_id, namespace_name)
+    for class_id, class_name, _ in class_rows:
+        process_class_parameters(cur, None, class_id, class_name, namespace_name, module_cache)
+    for func_id, func_name, parent_class_id, parent_class_name, *_ in function_rows:
+        process_function_parameters(cur, None, func_id, func_name, parent_class_id, parent_class_name,
+                                    namespace_name, namespace_id, namespace_name, module_cache)
+
+def load_jsonl_module_variables(cur, namespace_id, namespace_name, jsonl_path):
+    """Like load_module_variables, streaming the parameters from a JSON Lines file."""
+    class_rows, function_rows = namespace_entity_rows(cur, namespace_id, namespace_name)
+    process_jsonl_parameters(cur, jsonl_path, class_rows, function_rows)
+
+def process_jsonl_parameters(cur, jsonl_path, class_rows, function_rows):
+    """
+    Insert the parameters of a JSON Lines module file while reading it.
+    `class_rows` and `function_rows` are the rows (as selected in
+    populate_variables) of the entities of this module that still need
+    their parameters; each "parameter" record goes to the entities matching
+    its class/function names, as with the JSON layout.
+    """
+    class_ids = {}
+    for class_id, class_name, _ in class_rows:
+        class_ids.setdefault(class_name, []).append(class_id)
+    method_ids = {}
+    function_ids = {}
+    for func_id, func_name, parent_class_id, parent_class_name, *_ in function_rows:
+        if parent_class_id is not None:
+            method_ids.setdefault((parent_class_name, func_name), []).append(func_id)
+        else:
+            function_ids.setdefault(func_name, []).append(func_id)
+    
+    for record in iter_jsonl_records(jsonl_path):
+        if record.get("kind") != "parameter":
+            continue
+        parameters = {record["name"]: record.get("info")}
+        class_name = record.get("class")
+        func_name = record.get("function")
+        if func_name is None:
+            for class_id in class_ids.get(class_name, []):
+                add_parameters_to_db(cur, parameters, class_id, None, class_name)
+        elif class_name is not None:
+            for func_id in method_ids.get((class_name, func_name), []):
+                add_parameters_to_db(cur, parameters, None, func_id, func_name)
+        else:
+            for func_id in function_ids.get(func_name, []):
+                add_parameters_to_db(cur, parameters, None, func_id, func_name)
+
+def add_parameters_to_db(cur, parameters, class_id, func_id, entity_name):
+    """Helper function to add parameters to the database"""
+    for param_name, param_info in parameters.items():
+        if isinstance(param_info, dict):
+            param_type = param_info.get("type", "")
+            param_desc = param_info.get("description", "")
+            
+            # Extract default value if present in type
+            default_value = None
+            if "default=" in param_type:
+                default_parts = param_type.split("default=", 1)
+                if len(default_parts) > 1:
+                    default_value = default_parts[1].split(",", 1)[0].strip()
+            
+            cur.execute(
+                "INSERT INTO Variables (class_id, function_id, type, name, data_type, description, default_value) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (class_id, func_id, "PARAMETER", param_name, param_type, param_desc, default_value)
+            )
+            # print(f"  Added parameter '{param_name}' to {'class' if class_id else 'function'} '{entity_name}'")
+
+def read_namespace_names(data):
+    """Extrai a lista de namespaces de um index.json (nos formatos aceitos)."""
+    names = []
+    # Se for dict com chave "modules", insere cada módulo
+    if isinstance(data, dict) and "modules" in data:
+        names.extend(data["modules"])
+    # (mantém os outros casos se quiser)
+    elif isinstance(data, dict) and "name" in data:
+        names.append(data["name"])
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, dict) and "name" in item:
+                names.append(item["name"])
+            elif isinstance(item, str):
+                names.append(item)
+    elif isinstance(data, str):
+        names.append(data)
+    return names
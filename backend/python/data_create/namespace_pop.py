@@ -1,19 +1,50 @@
 import mariadb
 import os
 import json
+from data_create import connection
+from data_create.module_rows import read_namespace_names
+from data_create.processed_files import (file_hash, namespace_file_key, get_processed_hash, like_prefix,
+                                         mark_processed, forget_processed, delete_namespace_entities)
 
-# Configurações de conexão
-config = {
-    "user": "dynam",
-    "password": "1234",
-    "host": "localhost",
-    "port": 3306,
-    "database": "dynam"
-}
+def sync_library_namespaces(cur, library, names):
+    """
+    Deixa a tabela Namespaces da biblioteca igual à lista `names`:
+    insere os que faltam e remove (com suas entidades) os que sumiram.
+    Namespaces já existentes mantêm o id, preservando as entidades ligadas a eles.
+    """
+    cur.execute(
+        "SELECT id, name FROM Namespaces WHERE name = ? OR name LIKE ? ESCAPE '!'",
+        (library, like_prefix(f"{library}."))
+    )
+    existing = {name: namespace_id for namespace_id, name in cur.fetchall()}
 
-def populate_namespaces_from_output(output_dir="output", specific_library=None):
+    for name in names:
+        if name in existing:
+            continue
+        cur.execute("INSERT INTO Namespaces (name) VALUES (?)", (name,))
+        existing[name] = None
+        print(f"Adicionado namespace: {name}")
+
+    for name, namespace_id in existing.items():
+        if name in names or namespace_id is None:
+            continue
+        delete_namespace_entities(cur, namespace_id)
+        for extension in (".json", ".jsonl"):
+            file_key = namespace_file_key(name, extension)
+            if file_key:
+                forget_processed(cur, file_key)
+        cur.execute("DELETE FROM Namespaces WHERE id = ?", (namespace_id,))
+        print(f"Removido namespace: {name}")
+
+def populate_namespaces_from_output(output_dir="output", specific_library=None, incremental=True):
+    """
+    Popula a tabela Namespaces a partir dos index.json de cada biblioteca.
+
+    Com incremental=True, um index.json cujo hash não mudou desde a última
+    carga (tabela ProcessedFiles) é ignorado.
+    """
     try:
-        conn = mariadb.connect(**config)
+        conn = connection.get_connection()
         cur = conn.cursor()
         print("Conexão bem-sucedida com o banco de dados MariaDB!")
 
@@ -21,6 +52,7 @@ def populate_namespaces_from_output(output_dir="output", specific_library=None):
         base_path = os.path.abspath(output_dir)
         if not os.path.isdir(base_path):
             print(f"Pasta '{base_path}' não encontrada.")
+            connection.release_connection(conn)
             return
 
         # If a specific library is provided, only process that library
@@ -30,35 +62,20 @@ def populate_namespaces_from_output(output_dir="output", specific_library=None):
             folder_path = os.path.join(base_path, folder)
             index_path = os.path.join(folder_path, "index.json")
             if os.path.isdir(folder_path) and os.path.isfile(index_path):
+                index_key = os.path.join(folder, "index.json")
+                digest = file_hash(index_path)
+                if incremental and get_processed_hash(cur, index_key) == digest:
+                    print(f"Sem alterações em {index_path}, ignorando.")
+                    continue
                 print(f"Lendo arquivo: {index_path}")
                 with open(index_path, "r", encoding="utf-8") as f:
                     data = json.load(f)
                     print(data)  # Exibe o conteúdo do JSON para depuração
-                    # Se for dict com chave "modules", insere cada módulo
-                    if isinstance(data, dict) and "modules" in data:
-                        for module in data["modules"]:
-                            cur.execute("INSERT INTO Namespaces (name) VALUES (?)", (module,))
-                            print(f"Adicionado namespace: {module}")
-                    # (mantém os outros casos se quiser)
-                    elif isinstance(data, dict) and "name" in data:
-                        name = data["name"]
-                        cur.execute("INSERT INTO Namespaces (name) VALUES (?)", (name,))
-                        print(f"Adicionado namespace: {name}")
-                    elif isinstance(data, list):
-                        for item in data:
-                            if isinstance(item, dict) and "name" in item:
-                                name = item["name"]
-                                cur.execute("INSERT INTO Namespaces (name) VALUES (?)", (name,))
-                                print(f"Adicionado namespace: {name}")
-                            elif isinstance(item, str):
-                                cur.execute("INSERT INTO Namespaces (name) VALUES (?)", (item,))
-                                print(f"Adicionado namespace: {item}")
-                    elif isinstance(data, str):
-                        cur.execute("INSERT INTO Namespaces (name) VALUES (?)", (data,))
-                        print(f"Adicionado namespace: {data}")
+                sync_library_namespaces(cur, folder, read_namespace_names(data))
+                mark_processed(cur, index_key, digest)
         conn.commit()
         cur.close()
-        conn.close()
+        connection.release_connection(conn)
     except mariadb.Error as e:
         print(f"Erro ao conectar ao MariaDB: {e}")
 
@@ -0,0 +1,126 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+
+def file_hash(path, chunk_size=1 << 16):
+    """Return the SHA-256 hex digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def json_hash(data):
+    """
+    SHA-256 of `data` serialized exactly as pop_general writes its JSON files,
+    so it equals file_hash() of the file that would be written for it.
+    """
+    text = json.dumps(data, indent=2, ensure_ascii=False)
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+# Escape character of the LIKE patterns built by like_prefix. '!' reads the
+# same in MariaDB and SQLite string literals (a backslash does not).
+LIKE_ESCAPE = "!"
+
+
+def like_prefix(prefix):
+    """
+    LIKE pattern matching the strings that start with `prefix`, with its
+    '%' and '_' taken literally. Use it with "LIKE ? ESCAPE '!'".
+    """
+    for char in (LIKE_ESCAPE, "%", "_"):
+        prefix = prefix.replace(char, LIKE_ESCAPE + char)
+    return prefix + "%"
+
+
+def namespace_file_key(namespace_name, extension=".json"):
+    """
+    Path of a namespace's JSON file relative to the output directory
+    (e.g. 'torch.nn.functional' -> 'torch/nn.functional.json').
+    Returns None for namespaces without a module part.
+    """
+    parts = namespace_name.split('.')
+    if len(parts) < 2:
+        return None
+    return os.path.join(parts[0], f"{'.'.join(parts[1:])}{extension}")
+
+
+def module_file(output_dir, namespace_name):
+    """
+    (file_key, path) of the module file of a namespace: the .json file, or
+    the JSON Lines (.jsonl) one when only that layout was written. If
+    neither exists the .json location is returned. (None, None) for
+    namespaces without a module part.
+    """
+    file_key = namespace_file_key(namespace_name)
+    if file_key is None:
+        return None, None
+    path = os.path.join(output_dir, file_key)
+    if not os.path.isfile(path):
+        jsonl_key = namespace_file_key(namespace_name, ".jsonl")
+        jsonl_path = os.path.join(output_dir, jsonl_key)
+        if os.path.isfile(jsonl_path):
+            return jsonl_key, jsonl_path
+    return file_key, path
+
+
+def iter_jsonl_records(path):
+    """Yield the records of a JSON Lines module file one at a time."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def alias_target(alias):
+    """(owner module, name in the owner) of an alias entry ('lib.core.Engine' -> ('lib.core', 'Engine'))."""
+    owner, name = alias["alias_of"].rsplit(".", 1)
+    return owner, name
+
+
+def get_processed_hash(cur, file_key):
+    """Hash stored in ProcessedFiles for a file, or None if it was never loaded."""
+    cur.execute("SELECT hash FROM ProcessedFiles WHERE file_path = ?", (file_key,))
+    row = cur.fetchone()
+    return row[0] if row else None
+
+
+def mark_processed(cur, file_key, digest):
+    """Record (or refresh) the hash of a file that has just been loaded."""
+    cur.execute("DELETE FROM ProcessedFiles WHERE file_path = ?", (file_key,))
+    cur.execute(
+        "INSERT INTO ProcessedFiles (file_path, hash, processed_at) VALUES (?, ?, ?)",
+        (file_key, digest, datetime.now())
+    )
+
+
+def forget_processed(cur, file_key):
+    """Drop the ProcessedFiles entry of a file so it is reloaded next time."""
+    cur.execute("DELETE FROM ProcessedFiles WHERE file_path = ?", (file_key,))
+
+
+def delete_namespace_entities(cur, namespace_id):
+    """
+    Delete the Classes, Functions, Variables and Aliases that were loaded
+    for one namespace, children first.
+    """
+    class_ids = "SELECT id FROM Classes WHERE namespace_id = ?"
+    cur.execute(
+        f"DELETE FROM Variables WHERE class_id IN ({class_ids})",
+        (namespace_id,)
+    )
+    cur.execute(
+        "DELETE FROM Variables WHERE function_id IN ("
+        f"SELECT id FROM Functions WHERE parent_namespace_id = ? OR parent_class_id IN ({class_ids}))",
+        (namespace_id, namespace_id)
+    )
+    cur.execute(
+        f"DELETE FROM Functions WHERE parent_namespace_id = ? OR parent_class_id IN ({class_ids})",
+        (namespace_id, namespace_id)
+    )
+    cur.execute("DELETE FROM Classes WHERE namespace_id = ?", (namespace_id,))
+    cur.execute("DELETE FROM Aliases WHERE namespace_id = ?", (namespace_id,))
@@ -0,0 +1,113 @@
+import sqlite3
+
+# SQLite version of the Exposed tables in
+# src/main/kotlin/com/dynam/database/tables (same table and column names),
+# so the loaders can run unchanged against a local SQLite database.
+# Table name -> CREATE statement, parents first.
+TABLES = {
+    "Namespaces": """
+    CREATE TABLE IF NOT EXISTS Namespaces (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL
+    )
+    """,
+    "Classes": """
+    CREATE TABLE IF NOT EXISTS Classes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        namespace_id INTEGER NOT NULL REFERENCES Namespaces(id),
+        name TEXT NOT NULL,
+        description TEXT,
+        signature TEXT,
+        return_type TEXT,
+        example TEXT
+    )
+    """,
+    "Functions": """
+    CREATE TABLE IF NOT EXISTS Functions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        parent_class_id INTEGER REFERENCES Classes(id),
+        parent_namespace_id INTEGER REFERENCES Namespaces(id),
+        name TEXT NOT NULL,
+        signature TEXT,
+        description TEXT,
+        return_type TEXT,
+        example TEXT
+    )
+    """,
+    "Variables": """
+    CREATE TABLE IF NOT EXISTS Variables (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        class_id INTEGER REFERENCES Classes(id),
+        function_id INTEGER REFERENCES Functions(id),
+        type VARCHAR(255) NOT NULL,
+        name TEXT NOT NULL,
+        data_type TEXT,
+        description TEXT,
+        default_value TEXT
+    )
+    """,
+    "Aliases": """
+    CREATE TABLE IF NOT EXISTS Aliases (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        namespace_id INTEGER NOT NULL REFERENCES Namespaces(id),
+        name TEXT NOT NULL,
+        type VARCHAR(255) NOT NULL,
+        target_namespace TEXT NOT NULL,
+        target_name TEXT NOT NULL
+    )
+    """,
+    "ProcessedFiles": """
+    CREATE TABLE IF NOT EXISTS ProcessedFiles (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_path TEXT NOT NULL UNIQUE,
+        hash TEXT NOT NULL,
+        processed_at TIMESTAMP NOT NULL
+    )
+    """,
+}
+
+# Documentation tables (everything except the loaders' bookkeeping)
+DOCUMENTATION_TABLES = ["Namespaces", "Classes", "Functions", "Variables", "Aliases"]
+
+# MariaDB (InnoDB) creates an index for every foreign key; SQLite does not,
+# so they are created explicitly to keep the loaders' lookups comparable.
+FOREIGN_KEY_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_classes_namespace_id ON Classes(namespace_id)",
+    "CREATE INDEX IF NOT EXISTS idx_functions_parent_class_id ON Functions(parent_class_id)",
+    "CREATE INDEX IF NOT EXISTS idx_functions_parent_namespace_id ON Functions(parent_namespace_id)",
+    "CREATE INDEX IF NOT EXISTS idx_variables_class_id ON Variables(class_id)",
+    "CREATE INDEX IF NOT EXISTS idx_variables_function_id ON Variables(function_id)",
+    "CREATE INDEX IF NOT EXISTS idx_aliases_namespace_id ON Aliases(namespace_id)",
+]
+
+# Lookups done by the Kotlin repositories (NamespaceRepository.findByName,
+# VariableRepository.findBy*AndType, ...) on top of the foreign key indexes
+READ_PATH_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_namespaces_name ON Namespaces(name)",
+    "CREATE INDEX IF NOT EXISTS idx_variables_class_id_type ON Variables(class_id, type)",
+    "CREATE INDEX IF NOT EXISTS idx_variables_function_id_type ON Variables(function_id, type)",
+]
+
+def create_schema(conn, tables=None, indexes=True):
+    """
+    Create the tables (all of TABLES, or only `tables`) if missing, with
+    their foreign key indexes unless indexes=False.
+    """
+    cur = conn.cursor()
+    for table in tables or TABLES:
+        cur.execute(TABLES[table])
+    if indexes:
+        for statement in FOREIGN_KEY_INDEXES:
+            cur.execute(statement)
+    conn.commit()
+    cur.close()
+
+def connect_sqlite(path=":memory:"):
+    """
+    Open a SQLite database with the documentation schema. It accepts the
+    same '?' placeholders as the MariaDB connector, so it can be handed to
+    the loaders through connection.configure(connect=...).
+    """
+    conn = sqlite3.connect(path)
+    create_schema(conn)
+    return conn
@@ -0,0 +1,118 @@
+import argparse
+import json
+import os
+import sqlite3
+
+from data_create.module_rows import (insert_module_entities, insert_module_records, read_namespace_names,
+                                     load_module_variables, load_jsonl_module_variables)
+from data_create.processed_files import like_prefix, module_file, iter_jsonl_records
+from data_create.sqlite_schema import (DOCUMENTATION_TABLES, READ_PATH_INDEXES, create_schema)
+
+# Default location (backend/docs_snapshot.db when run from backend/python).
+# backend/kls_database.db is not used: it is a different database.
+DEFAULT_SNAPSHOT_PATH = "../docs_snapshot.db"
+
+def is_snapshot(path):
+    """True if `path` is a SQLite file with the documentation tables (safe to replace)."""
+    try:
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        finally:
+            conn.close()
+    except sqlite3.DatabaseError:
+        return False
+    # Snapshots built before the Aliases table was added are recognized too
+    return set(DOCUMENTATION_TABLES) - {"Aliases"} <= tables
+
+def load_library_snapshot(cur, output_dir, library):
+    """
+    Insert one library of the output directory (index.json plus one JSON or
+    JSON Lines file per module) through `cur`. Returns the number of
+    namespaces inserted.
+    """
+    with open(os.path.join(output_dir, library, "index.json"), "r", encoding="utf-8") as f:
+        names = read_namespace_names(json.load(f))
+    cur.executemany("INSERT INTO Namespaces (name) VALUES (?)", [(name,) for name in names])
+    cur.execute("SELECT id, name FROM Namespaces WHERE name = ? OR name LIKE ? ESCAPE '!'",
+                (library, like_prefix(f"{library}.")))
+    # Only the modules of this index.json (another library may share the prefix)
+    wanted = set(names)
+    for namespace_id, namespace_name in cur.fetchall():
+        if namespace_name not in wanted:
+            continue
+        file_key, path = module_file(output_dir, namespace_name)
+        if file_key is None or not os.path.isfile(path):
+            continue
+        if path.endswith(".jsonl"):
+            insert_module_records(cur, namespace_id, iter_jsonl_records(path))
+            load_jsonl_module_variables(cur, namespace_id, namespace_name, path)
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            insert_module_entities(cur, namespace_id, data)
+            load_module_variables(cur, namespace_id, namespace_name, data)
+    return len(names)
+
+def build_snapshot(output_dir="../output", snapshot_path=DEFAULT_SNAPSHOT_PATH, libraries=None, force=False):
+    """
+    Build a self-contained, read-only SQLite snapshot of the documentation
+    (Namespaces, Classes, Functions, Variables and Aliases) from the output
+    directory.
+
+    Everything is inserted in a single transaction with journaling and
+    syncing off, into a temporary file; then the read-path indexes are
+    created, statistics are gathered (ANALYZE) and the file is compacted
+    (VACUUM) before it atomically replaces `snapshot_path`.
+
+    An existing file that is not a snapshot is only replaced with force=True.
+    Returns the row count of each table.
+    """
+    if os.path.exists(snapshot_path) and not force and not is_snapshot(snapshot_path):
+        raise ValueError(f"{snapshot_path} exists and is not a documentation snapshot (use force=True to replace it)")
+    if libraries is None:
+        libraries = sorted(folder for folder in os.listdir(output_dir)
+                           if os.path.isfile(os.path.join(output_dir, folder, "index.json")))
+
+    tmp_path = snapshot_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        # Foreign key indexes first: the loaders look rows up by parent while inserting
+        create_schema(conn, DOCUMENTATION_TABLES)
+        cur = conn.cursor()
+        for library in libraries:
+            print(f"Adding {library} to the snapshot")
+            load_library_snapshot(cur, output_dir, library)
+        conn.commit()
+
+        for statement in READ_PATH_INDEXES:
+            cur.execute(statement)
+        cur.execute("ANALYZE")
+        conn.commit()
+        counts = {table: cur.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+                  for table in DOCUMENTATION_TABLES}
+        cur.close()
+        conn.execute("VACUUM")
+        conn.close()
+    except BaseException:
+        conn.close()
+        os.remove(tmp_path)
+        raise
+    os.replace(tmp_path, snapshot_path)
+    print(f"Snapshot written to {snapshot_path}: " + ", ".join(f"{t}={n}" for t, n in counts.items()))
+    return counts
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a read-only SQLite snapshot of the documentation.")
+    parser.add_argument("--output", default="../output", help="Output directory with the extracted libraries")
+    parser.add_argument("--snapshot", default=DEFAULT_SNAPSHOT_PATH, help="SQLite file to write")
+    parser.add_argument("--library", action="append", dest="libraries",
+                        help="Only include this library (can be repeated)")
+    parser.add_argument("--force", action="store_true",
+                        help="Replace the target file even if it is not a documentation snapshot")
+    args = parser.parse_args()
+    build_snapshot(args.output, args.snapshot, libraries=args.libraries, force=args.force)
@@ -0,0 +1,135 @@
+import argparse
+import os
+import time
+
+import mariadb
+
+import pop_general
+import data_create.namespace_pop as popNameSpaces
+from data_create import connection
+from data_create.module_rows import insert_module_entities, load_module_variables
+from data_create.processed_files import (json_hash, like_prefix, namespace_file_key, get_processed_hash, mark_processed,
+                                         delete_namespace_entities)
+
+def load_library(cur, library_name, modules, incremental=True):
+    """
+    Load the extracted modules of one library (module name -> data, as
+    returned by pop_general.build_module_structure) through an open cursor:
+    namespaces, then classes/functions, then variables, module by module.
+
+    ProcessedFiles is keyed and hashed exactly like the JSON files the
+    standalone loaders read, so both paths can be mixed. With
+    incremental=True modules whose data did not change are skipped.
+
+    Returns the number of modules (re)loaded.
+    """
+    index = {"library": library_name, "modules": list(modules.keys())}
+    popNameSpaces.sync_library_namespaces(cur, library_name, index["modules"])
+    mark_processed(cur, os.path.join(library_name, "index.json"), json_hash(index))
+
+    cur.execute(
+        "SELECT id, name FROM Namespaces WHERE name = ? OR name LIKE ? ESCAPE '!'",
+        (library_name, like_prefix(f"{library_name}."))
+    )
+    namespace_ids = {name: namespace_id for namespace_id, name in cur.fetchall()}
+
+    loaded = 0
+    for module_name, data in modules.items():
+        file_key = namespace_file_key(module_name)
+        namespace_id = namespace_ids.get(module_name)
+        if file_key is None or namespace_id is None:
+            # Same as the standalone loaders: the root namespace has no module file
+            continue
+        digest = json_hash(data)
+        if incremental and get_processed_hash(cur, file_key) == digest:
+            print(f"Skipping unchanged module {module_name}")
+            continue
+        print(f"Loading module {module_name} (ID: {namespace_id})")
+
+        # Replace only the rows that came from this module
+        delete_namespace_entities(cur, namespace_id)
+        insert_module_entities(cur, namespace_id, data)
+        load_module_variables(cur, namespace_id, module_name, data)
+        mark_processed(cur, file_key, digest)
+        loaded += 1
+    return loaded
+
+def run_pipeline(library_name, output_root="output", write_json=False, workers=None,
+                 mro_aware=False, incremental=True, module_timeout=None, module_memory_mb=None,
+                 alias_reexports=False, public_policy="dir"):
+    """
+    Extract a library and load it into the database in a single interpreter
+    with a single connection: extract -> namespaces -> entities -> variables.
+
+    The extracted structures are handed to the loaders in memory; the JSON
+    files under <output_root>/<library_name> are only written when
+    write_json=True. With module_timeout (seconds) or module_memory_mb each
+    submodule is extracted in a supervised child process with that budget;
+    submodules that exceed it or crash are skipped. With alias_reexports=True
+    re-exported functions and classes are only extracted once, for the
+    module that defines them, and copied from it into the modules that
+    re-export them when loading. public_policy selects the public members of
+    each module (see pop_general.public_surface).
+
+    Returns True if the library was extracted and loaded. A root module
+    that cannot be imported returns False; one whose extraction fails
+    raises (see pop_general.build_module_structure), so the process exits
+    with an error either way.
+    """
+    start = time.perf_counter()
+    modules = pop_general.build_module_structure(
+        library_name, workers=workers, mro_aware=mro_aware,
+        write_json=write_json, output_root=output_root,
+        module_timeout=module_timeout, module_memory_mb=module_memory_mb,
+        alias_reexports=alias_reexports, public_policy=public_policy
+    )
+    if "error" in modules:
+        print(modules["error"])
+        return False
+    extracted = time.perf_counter()
+    print(f"Extracted {len(modules)} modules in {extracted - start:.2f}s")
+
+    conn = None
+    try:
+        conn = connection.get_connection()
+        cur = conn.cursor()
+        print("Successfully connected to MariaDB database")
+        loaded = load_library(cur, library_name, modules, incremental=incremental)
+        conn.commit()
+        cur.close()
+        connection.release_connection(conn)
+    except mariadb.Error as e:
+        print(f"Error loading {library_name} into MariaDB: {e}")
+        if conn is not None:
+            conn.close()
+        return False
+    print(f"Loaded {loaded} modules in {time.perf_counter() - extracted:.2f}s")
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Extract a library and load it into the database in one process.")
+    parser.add_argument("library_name", help="Library to document and load")
+    parser.add_argument("--write-json", action="store_true",
+                        help="Also write the per-module JSON files and index.json to the output directory")
+    parser.add_argument("--output", default="output",
+                        help="Output directory for --write-json (default: output)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Processes used to extract submodules (default: number of CPUs)")
+    parser.add_argument("--mro-methods", action="store_true",
+                        help="Store each inherited method only on the class that defines it")
+    parser.add_argument("--alias-reexports", action="store_true",
+                        help="Extract and load re-exported functions and classes only once, in their defining module")
+    parser.add_argument("--public", choices=pop_general.PUBLIC_POLICIES, default="dir",
+                        help="Public members of each module: dir (default), module or all (see pop_general.py --help)")
+    parser.add_argument("--full", action="store_true",
+                        help="Reload every module even if its data did not change")
+    parser.add_argument("--module-timeout", type=float, default=None,
+                        help="Seconds each submodule may take to import and extract (runs each in a supervised child)")
+    parser.add_argument("--module-memory-mb", type=int, default=None,
+                        help="Memory budget in MB for each submodule's child process")
+    args = parser.parse_args()
+    ok = run_pipeline(args.library_name, output_root=args.output, write_json=args.write_json,
+                      workers=args.workers, mro_aware=args.mro_methods, incremental=not args.full,
+                      module_timeout=args.module_timeout, module_memory_mb=args.module_memory_mb,
+                      alias_reexports=args.alias_reexports, public_policy=args.public)
+    raise SystemExit(0 if ok else 1)
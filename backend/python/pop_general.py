@@ -1,11 +1,36 @@
 import inspect
 import importlib
 import json
+import logging
 import os
 import sys
 import re
+import time
+import types
 import warnings
-from typing import Dict, List, Optional, Union, Any, Tuple
+from collections import OrderedDict
+from functools import cached_property
+from typing import Dict, List, Optional, Union, Any, Tuple, Collection
+
+# Rodando como script (python pop_general.py, ou o __mp_main__ dos workers
+# com spawn), este módulo também responde por "pop_general": static_api o
+# importa por esse nome e precisa ver os mesmos EXTRACTION_STATS,
+# DOCSTRING_CACHE e parsers, não uma segunda cópia.
+if __name__ in ("__main__", "__mp_main__"):
+    sys.modules.setdefault("pop_general", sys.modules[__name__])
+
+# Log de diagnóstico dos parsers: desligado por padrão (nível WARNING) e
+# habilitado com --verbose. Mensagens caras só são montadas quando o nível
+# DEBUG está ativo.
+logger = logging.getLogger("pop_general")
+
+def configure_logging(verbose: bool = False) -> None:
+    """Configura o log em stderr; com verbose=True inclui as mensagens DEBUG dos parsers."""
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format="[%(levelname)s] %(message)s",
+        stream=sys.stderr,
+    )
 
 # Library detection functions
 def is_torch_module(module_name: str) -> bool:
@@ -41,39 +66,327 @@ def is_sklearn_module(module_name: str) -> bool:
     """Verifica se estamos processando o scikit-learn ou Seaborn."""
     return module_name.startswith('sklearn') or module_name.startswith('seaborn')
 
-def get_function_signature(func, library_type: str = "") -> str:
+# ---------------------------------------------------------------------------
+# Registro de regex pré-compiladas compartilhado por todos os parsers.
+# Os parsers rodam uma vez por função, método e classe, então os padrões são
+# compilados uma única vez na importação do módulo.
+# ---------------------------------------------------------------------------
+
+_NUMPY_SECTION_HEADERS = [
+    "Parameters", "Returns", "Yields", "Raises", "Warns", "See Also", "Notes", "Examples", "Attributes", "Methods", "References", "Warnings", "Deprecated", "Versionadded", "Versionchanged", "Other Parameters"
+]
+_SPHINX_DIRECTIVES = [
+    ".. note::", ".. warning::", ".. versionadded::", ".. versionchanged::", ".. deprecated::", ".. seealso::", ".. rubric::", ".. admonition::"
+]
+_NUMPY_UNDERLINED_SECTIONS = [
+    "Parameters", "Returns", "Yields", "Raises", "Warns", "See Also", "Notes", "Examples", "Attributes", "Methods", "References", "Warnings", "Deprecated", "Other Parameters"
+]
+_GENERIC_SECTIONS = ["Parameters", "Args", "Arguments", "Returns", "Return", "Raises", "Exceptions",
+                     "See Also", "Notes", "Note", "Examples", "Example"]
+
+# get_function_signature
+# func(args), func (args), module.func(args) e module.func (args): as quatro
+# formas devolviam sempre os mesmos argumentos, então uma regex basta
+_SIGNATURE_DOC_RE = re.compile(r'^[a-zA-Z0-9_\.]+\s*\((.*?)\)')
+# Callables em C para os quais inspect.signature só usa __text_signature__
+# (e levanta ValueError quando ele não existe)
+_BUILTIN_CALLABLE_TYPES = (types.BuiltinFunctionType, types.MethodDescriptorType,
+                           types.WrapperDescriptorType, types.MethodWrapperType,
+                           types.ClassMethodDescriptorType)
+# Parâmetros de um __text_signature__ separados por vírgula, sem quebrar
+# defaults entre aspas (ex.: sep=', ')
+_TEXT_SIGNATURE_SPLIT_RE = re.compile(r"""(?:[^,'"]|'[^']*'|"[^"]*")+""")
+# Tipos de default que inspect aceita num __text_signature__
+_TEXT_SIGNATURE_DEFAULT_TYPES = (str, int, float, bytes, bool, type(None))
+_TF_SIGNATURE_RE = re.compile(r'tf\.(?:[a-zA-Z0-9_\.]+\.)?([a-zA-Z0-9_]+)\((.*?)\)')
+
+# Padrões comuns de parâmetros
+_PARAM_NAME_TYPE_RE = re.compile(r'^([a-zA-Z0-9_]+)\s*:\s*(.*)$')  # name : type
+_PARAM_GOOGLE_RE = re.compile(r'^([a-zA-Z0-9_]+)(?:\s*\(([^)]*)\))?(?:\s*:)?\s*(.*)$')  # name (type): desc
+
+# parse_torch_docstring
+_TORCH_DESCRIPTION_RE = re.compile(
+    r'^(.*?)(?:\n\s*(?:Args|Arguments|Parameters|Returns|Raises|Examples|Note|Warning):|$)', re.DOTALL)
+_TORCH_ARGS_RE = re.compile(
+    r'(?:Args|Arguments|Parameters):\s*\n(.*?)(?:\n\s*(?:Returns|Raises|Examples|Note|Warning):|$)', re.DOTALL)
+_TORCH_RETURNS_RE = re.compile(r'Returns:\s*\n(.*?)(?:\n\s*(?:Raises|Examples|Note|Warning):|$)', re.DOTALL)
+_TORCH_RAISES_RE = re.compile(r'Raises:\s*\n(.*?)(?:\n\s*(?:Examples|Note|Warning):|$)', re.DOTALL)
+_TORCH_EXAMPLES_RE = re.compile(r'(?:Example|Examples):\s*\n(.*?)(?:\n\s*(?:Note|Warning):|$)', re.DOTALL)
+_TORCH_NOTES_RE = re.compile(r'(?:Note|Notes):\s*\n(.*?)(?:\n\s*(?:Warning|Example|Examples):|$)', re.DOTALL)
+
+# parse_numpy_tensorflow_style
+# Corte do resumo: qualquer número de linhas em branco, seguido de um cabeçalho de
+# seção (com ':' e sublinhado opcionais) ou de uma diretiva Sphinx. Cabeçalhos e
+# diretivas ficam numa única alternância, então uma busca encontra o primeiro.
+_NUMPY_SUMMARY_CUT_RE = re.compile(
+    r"(?im)^(\s*\n)*(?:((%s)\s*:?\s*(\n\s*[-=~`']{3,}\s*)?\n)|((%s)\s*))" % (
+        '|'.join([re.escape(h) for h in _NUMPY_SECTION_HEADERS]),
+        '|'.join([re.escape(d) for d in _SPHINX_DIRECTIVES])))
+# Cabeçalhos sublinhados ou diretiva Sphinx (com qualquer indentação) dentro da descrição
+_NUMPY_DESCRIPTION_SPLIT_RE = re.compile(
+    r"^\s*(?:%s)\s*\n[-=~`']{3,}\n|^[ \t]*\.\. [a-zA-Z]+::.*$" % '|'.join(_NUMPY_UNDERLINED_SECTIONS),
+    re.MULTILINE)
+_NUMPY_PARAMS_HEADER_RE = re.compile(r'\n\s*Parameters\s*\n\s*[-]+\s*\n')
+_NUMPY_SECTION_SPLIT_RE = re.compile(r'\n\s*([A-Za-z][A-Za-z\s]*)\s*\n\s*[-]+\s*\n')
+_NUMPY_GOOGLE_SECTIONS = [
+    ("parameters", re.compile(r'Parameters\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)', re.DOTALL)),
+    ("returns", re.compile(r'Returns\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)', re.DOTALL)),
+    ("raises", re.compile(r'Raises\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)', re.DOTALL)),
+    ("see_also", re.compile(r'See Also\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)', re.DOTALL)),
+    ("notes", re.compile(r'Notes\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)', re.DOTALL)),
+    ("examples", re.compile(r'Examples\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)', re.DOTALL))
+]
+_NUMPY_PARAMS_BLOCK_RE = re.compile(
+    r'Parameters\s*\n\s*[-]+\s*\n(.*?)(?:\n\s*[A-Z][a-z]+\s*\n\s*[-]+\s*\n|\Z)', re.DOTALL)
+_UNINDENTED_LINE_SPLIT_RE = re.compile(r'\n(?=\S)')
+
+# parse_jax_docstring
+_JAX_DESCRIPTION_SPLIT_RE = re.compile(r'\n\s*(?:Args|Arguments|Parameters|Returns|Raises|Examples|Notes|See Also):')
+_JAX_PARAMS_RE = re.compile(
+    r'(?:Args|Arguments|Parameters):(.*?)(?:\n\s*(?:Returns|Raises|Examples|Notes|See Also):|$)', re.DOTALL)
+_JAX_PARAM_TYPE_RE = re.compile(r'^([a-zA-Z0-9_]+)\s*:\s*([^-\s][^-]*?)(?:\s*-\s*(.*))?$')
+_JAX_PARAM_PAREN_RE = re.compile(r'^([a-zA-Z0-9_]+)\s*\(([^)]*)\)(?:\s*:)?\s*(.*)$')
+_JAX_PARAM_DASHES_RE = re.compile(r'^([a-zA-Z0-9_]+)\s*--\s*(.*)$')
+_JAX_RETURNS_RE = re.compile(r'Returns:(.*?)(?:\n\s*(?:Raises|Examples|Notes|See Also):|$)', re.DOTALL)
+_JAX_RAISES_RE = re.compile(r'Raises:(.*?)(?:\n\s*(?:Examples|Notes|See Also):|$)', re.DOTALL)
+_JAX_EXAMPLES_RE = re.compile(r'Examples:(.*?)(?:\n\s*(?:Notes|See Also):|$)', re.DOTALL)
+_JAX_NOTES_RE = re.compile(r'Notes:(.*?)(?:\n\s*(?:Examples|See Also):|$)', re.DOTALL)
+_JAX_SEE_ALSO_RE = re.compile(r'See Also:(.*?)(?:\n\s*(?:Examples|Notes):|$)', re.DOTALL)
+
+# parse_requests_docstring
+_REQUESTS_FIELD_LINE_RE = re.compile(r':(?:param|return|returns|raises|rtype).*$', re.MULTILINE)
+_REQUESTS_PARAM_RE = re.compile(
+    r':param\s+([^:]+):\s*(.*?)(?=\n\s*:(?:param|return|returns|raises|rtype)|$)', re.DOTALL)
+_REQUESTS_TYPED_NAME_RE = re.compile(r'^([^\s]+)\s+(.+)$')
+_REQUESTS_RETURN_RE = re.compile(r':(?:return|returns):\s*(.*?)(?=\n\s*:(?:param|raises|rtype)|$)', re.DOTALL)
+_REQUESTS_RTYPE_RE = re.compile(r':rtype:\s*(.*?)(?=\n\s*:(?:param|return|returns|raises)|$)', re.DOTALL)
+_REQUESTS_RAISES_RE = re.compile(r':raises:\s*(.*?)(?=\n\s*:(?:param|return|returns|raises|rtype)|$)', re.DOTALL)
+
+# parse_generic_docstring: nome de seção no início de uma linha (o mais longo
+# primeiro, para que "Notes" não seja lido como "Note")
+_GENERIC_HEADER_RE = re.compile(
+    '|'.join(re.escape(section) for section in sorted(_GENERIC_SECTIONS, key=len, reverse=True)),
+    re.IGNORECASE)
+_GENERIC_SECTION_BY_LOWER = {section.lower(): section for section in _GENERIC_SECTIONS}
+_WHITESPACE_RE = re.compile(r'\s*')
+_DASHES_RE = re.compile(r'-+')
+_GENERIC_PARAM_DASHES_RE = re.compile(r'^([a-zA-Z0-9_]+)\s+--\s+(.*)$')  # name -- desc
+_GENERIC_PARAM_PATTERNS = [
+    re.compile(r'^([a-zA-Z0-9_]+)\s*:\s*([^-]*)(?:\s*-\s*(.*))?$'),  # name: type - desc
+    re.compile(r'^([a-zA-Z0-9_]+)\s*\(([^)]*)\)(?:\s*:)?\s*(.*)$'),  # name(type): desc
+    _GENERIC_PARAM_DASHES_RE,
+    re.compile(r'^([a-zA-Z0-9_]+)\s+(.*)$')  # name desc
+]
+
+def _text_signature_parameters(text_signature: str, drop_self: bool) -> Optional[List[str]]:
     """
-    Tenta extrair assinatura, mesmo para funções geradas em C/Cython.
-    Se não encontrar, retorna um fallback.
+    Parâmetros de um __text_signature__ (ex.: "($module, obj, /)") já no
+    formato de str(inspect.signature(...)), sem passar pelo ast como o
+    inspect faz. Devolve None para tudo que não for o caso simples (defaults
+    que não são literais, anotações, grupos opcionais...), e aí quem chama
+    usa o inspect.
+    """
+    import ast
+
+    if not (text_signature.startswith("(") and text_signature.endswith(")")):
+        return None
+    body = text_signature[1:-1].strip()
+    if any(char in body for char in "[]{}:\\"):
+        return None
+    params = []
+    for index, token in enumerate(part.strip() for part in _TEXT_SIGNATURE_SPLIT_RE.findall(body)):
+        if index == 0 and token.startswith("$"):
+            if drop_self:
+                continue
+            token = token[1:]
+        name, sep, default = token.partition("=")
+        name = name.strip()
+        if not (name in ("/", "*") or name.lstrip("*").isidentifier()):
+            return None
+        if sep:
+            try:
+                value = ast.literal_eval(default.strip())
+            except (ValueError, SyntaxError):
+                return None
+            if type(value) not in _TEXT_SIGNATURE_DEFAULT_TYPES:
+                return None
+            params.append(f"{name}={value!r}")
+        else:
+            params.append(name)
+    # "/" sem nenhum parâmetro antes (o self removido) não aparece no inspect
+    if params and params[0] == "/":
+        params.pop(0)
+    return params
+
+def _builtin_signature(func) -> Optional[str]:
+    """
+    Caminho rápido para funções e métodos em C (builtins, descritores de
+    métodos): lê __text_signature__ direto. Devolve None se o inspect ou o
+    fallback pela docstring precisam ser usados.
+    """
+    text_signature = getattr(func, "__text_signature__", None)
+    if not isinstance(text_signature, str):
+        return None
+    # O inspect remove o primeiro parâmetro ($module, $self, $type) quando
+    # o callable está ligado a um objeto
+    params = _text_signature_parameters(text_signature, getattr(func, "__self__", None) is not None)
+    if params is None:
+        return None
+    return f"{func.__name__}({', '.join(params)})"
+
+def _signature_from_doc(func, library_type: str) -> str:
+    """Assinatura a partir da docstring (wrappers C/C++ sem assinatura introspectável)."""
+    doc = getattr(func, "__doc__", "") or ""
+    first_line = doc.split('\n', 1)[0].strip()
+    
+    # Formas func(args) / module.func (args) na primeira linha (ex.: ufuncs do numpy)
+    if "(" in first_line:
+        match = _SIGNATURE_DOC_RE.search(first_line)
+        if match:
+            return f"{func.__name__}({match.group(1)})"
+    
+    # Fallback específico para bibliotecas com formatos conhecidos
+    if is_tensorflow_module(library_type):
+        match = _TF_SIGNATURE_RE.search(doc)
+        if match:
+            return f"{func.__name__}({match.group(2)})"
+    
+    return f"{func.__name__}(...)"
+
+# Provider de assinaturas dos stubs .pyi (stub_signatures.StubSignatureProvider),
+# consultado antes da docstring quando não há assinatura introspectável.
+# Desligado por padrão; ver configure_stub_signatures.
+STUB_SIGNATURES = None
+
+def configure_stub_signatures(extra_paths: Optional[List[str]] = None, cache_dir: Optional[str] = None,
+                              enabled: bool = True) -> None:
+    """
+    Liga (ou desliga, com enabled=False) as assinaturas vindas de stubs
+    .pyi: os do próprio pacote, pacotes <pacote>-stubs e os diretórios de
+    `extra_paths` e da variável DYNAM_STUB_PATH (ex.: um checkout do
+    typeshed). Os índices ficam em cache em `cache_dir`.
+    """
+    global STUB_SIGNATURES
+    if enabled:
+        from stub_signatures import provider_from_environment
+        STUB_SIGNATURES = provider_from_environment(extra_paths, cache_dir)
+    else:
+        STUB_SIGNATURES = None
+    # Assinaturas já calculadas podem ter vindo do fallback antigo
+    SIGNATURE_CACHE.clear()
+
+def worker_settings() -> Dict:
+    """
+    Configuração global deste processo que os processos filhos precisam
+    repetir (ver configure_worker): o tamanho do DOCSTRING_CACHE e os
+    diretórios e o cache dos stubs, se ligados. Passada explicitamente ao
+    filho, vale também quando ele não herda os globais (método "spawn").
+    """
+    stub_paths = stub_cache_dir = None
+    if STUB_SIGNATURES is not None:
+        stub_paths, stub_cache_dir = list(STUB_SIGNATURES.extra_paths), STUB_SIGNATURES.cache_dir
+    return {"doc_cache_size": DOCSTRING_CACHE.maxsize, "stub_paths": stub_paths, "stub_cache_dir": stub_cache_dir}
+
+def configure_worker(doc_cache_size: int, stub_paths: Optional[List[str]] = None,
+                     stub_cache_dir: Optional[str] = None) -> None:
+    """
+    Aplica num processo filho a configuração de worker_settings. Os
+    diretórios de stub já incluem os de DYNAM_STUB_PATH, por isso o
+    provider é montado direto, sem provider_from_environment.
     """
+    global STUB_SIGNATURES
+    DOCSTRING_CACHE.maxsize = doc_cache_size
+    current = None if STUB_SIGNATURES is None else (STUB_SIGNATURES.extra_paths, STUB_SIGNATURES.cache_dir)
+    wanted = None if stub_paths is None else (list(stub_paths), stub_cache_dir)
+    if current == wanted:
+        # Filho criado com fork: o provider herdado (e os índices já lidos) serve
+        return
+    if wanted is None:
+        STUB_SIGNATURES = None
+    else:
+        from stub_signatures import StubSignatureProvider
+        STUB_SIGNATURES = StubSignatureProvider(stub_paths, stub_cache_dir)
+    SIGNATURE_CACHE.clear()
+
+def _fallback_signature(func, library_type: str) -> str:
+    if STUB_SIGNATURES is not None:
+        signature = STUB_SIGNATURES.signature_for(func, library_type)
+        if signature is not None:
+            return signature
+    return _signature_from_doc(func, library_type)
+
+def _compute_function_signature(func, library_type: str) -> str:
+    if isinstance(func, _BUILTIN_CALLABLE_TYPES):
+        signature = _builtin_signature(func)
+        if signature is not None:
+            return signature
+        if getattr(func, "__text_signature__", None) is None:
+            # Sem __text_signature__ o inspect.signature só levantaria ValueError
+            return _fallback_signature(func, library_type)
     try:
         sig = inspect.signature(func)
         return f"{func.__name__}{sig}"
     except (ValueError, TypeError):
-        # Para wrappers C/C++, tentamos extrair da docstring (às vezes há algo ali)
-        doc = getattr(func, "__doc__", "") or ""
-        first_line = doc.split('\n', 1)[0].strip()
-        
-        # Pattern melhorado para capturar várias formas de assinaturas em docstrings
-        patterns = [
-            r'^([a-zA-Z0-9_\.]+)\((.*?)\)',  # func(args)
-            r'^([a-zA-Z0-9_\.]+)\s*\((.*?)\)',  # func (args)
-            r'^(?:[a-zA-Z0-9_\.]+\.)?([a-zA-Z0-9_]+)\((.*?)\)',  # module.func(args)
-            r'^(?:[a-zA-Z0-9_\.]+\.)?([a-zA-Z0-9_]+)\s*\((.*?)\)'  # module.func (args)
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, first_line)
-            if match:
-                return f"{func.__name__}({match.group(2)})"
-        
-        # Fallback específico para bibliotecas com formatos conhecidos
-        if is_tensorflow_module(library_type):
-            match = re.search(r'tf\.(?:[a-zA-Z0-9_\.]+\.)?([a-zA-Z0-9_]+)\((.*?)\)', doc)
-            if match:
-                return f"{func.__name__}({match.group(2)})"
-        
-        return f"{func.__name__}(...)"
+        # Para wrappers C/C++, tentamos os stubs e depois a docstring (às vezes há algo ali)
+        return _fallback_signature(func, library_type)
+
+class SignatureCache:
+    """
+    Cache LRU de assinaturas por identidade do callable. O mesmo builtin ou
+    função é alcançado a partir de vários namespaces (reexportações,
+    métodos herdados), então a assinatura é calculada uma vez só.
+
+    A chave é id(func) (nem todo callable é hashable); cada entrada guarda
+    também o próprio objeto, o que impede que o id seja reaproveitado por
+    outro objeto enquanto a entrada existir.
+    """
+
+    def __init__(self, maxsize: int = 50000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get_or_compute(self, func, library_type: str) -> str:
+        # Métodos ligados são objetos novos a cada getattr: não compensa guardar
+        if self.maxsize <= 0 or isinstance(func, types.MethodType):
+            return _compute_function_signature(func, library_type)
+        # O resultado só depende do módulo quando cai no fallback do TensorFlow
+        key = (id(func), is_tensorflow_module(library_type))
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is func:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+        self.misses += 1
+        signature = _compute_function_signature(func, library_type)
+        self._entries[key] = (func, signature)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return signature
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+SIGNATURE_CACHE = SignatureCache()
+
+def get_function_signature(func, library_type: str = "") -> str:
+    """
+    Tenta extrair assinatura, mesmo para funções geradas em C/Cython.
+    Se não encontrar, retorna um fallback.
+
+    Funções em C usam o __text_signature__ direto (ou vão direto para o
+    fallback quando não o têm), e os resultados ficam no SIGNATURE_CACHE.
+    O fallback consulta os stubs .pyi, se ligados (configure_stub_signatures),
+    e depois a docstring.
+    """
+    return SIGNATURE_CACHE.get_or_compute(func, library_type)
 
 def parse_torch_docstring(doc: str) -> Dict[str, Any]:
     """Parser especializado para docstrings do PyTorch."""
@@ -98,16 +411,12 @@ def parse_torch_docstring(doc: str) -> Dict[str, Any]:
         "examples": ""
     }
     
-    desc_match = re.search(
-        r'^(.*?)(?:\n\s*(?:Args|Arguments|Parameters|Returns|Raises|Examples|Note|Warning):|$)',
-        doc, re.DOTALL)
+    desc_match = _TORCH_DESCRIPTION_RE.search(doc)
     if desc_match:
         result["description"] = desc_match.group(1).strip()
     
     # Args/Parameters
-    args_match = re.search(
-        r'(?:Args|Arguments|Parameters):\s*\n(.*?)(?:\n\s*(?:Returns|Raises|Examples|Note|Warning):|$)',
-        doc, re.DOTALL)
+    args_match = _TORCH_ARGS_RE.search(doc)
     if args_match:
         args_text = args_match.group(1)
         current_param = None
@@ -119,7 +428,7 @@ def parse_torch_docstring(doc: str) -> Dict[str, Any]:
             if not line:
                 continue
             
-            param_match = re.match(r'^([a-zA-Z0-9_]+)(?:\s*\(([^)]*)\))?(?:\s*:)?\s*(.*)$', line)
+            param_match = _PARAM_GOOGLE_RE.match(line)
             if param_match:
                 if current_param:
                     result["parameters"][current_param] = {
@@ -139,22 +448,22 @@ def parse_torch_docstring(doc: str) -> Dict[str, Any]:
             }
     
     # Returns
-    returns_match = re.search(r'Returns:\s*\n(.*?)(?:\n\s*(?:Raises|Examples|Note|Warning):|$)', doc, re.DOTALL)
+    returns_match = _TORCH_RETURNS_RE.search(doc)
     if returns_match:
         result["returns"] = returns_match.group(1).strip()
     
     # Raises
-    raises_match = re.search(r'Raises:\s*\n(.*?)(?:\n\s*(?:Examples|Note|Warning):|$)', doc, re.DOTALL)
+    raises_match = _TORCH_RAISES_RE.search(doc)
     if raises_match:
         result["raises"] = raises_match.group(1).strip()
     
     # Examples
-    examples_match = re.search(r'(?:Example|Examples):\s*\n(.*?)(?:\n\s*(?:Note|Warning):|$)', doc, re.DOTALL)
+    examples_match = _TORCH_EXAMPLES_RE.search(doc)
     if examples_match:
         result["examples"] = examples_match.group(1).strip()
     
     # Notes
-    notes_match = re.search(r'(?:Note|Notes):\s*\n(.*?)(?:\n\s*(?:Warning|Example|Examples):|$)', doc, re.DOTALL)
+    notes_match = _TORCH_NOTES_RE.search(doc)
     if notes_match:
         result["notes"] = notes_match.group(1).strip()
     
@@ -212,69 +521,32 @@ def parse_numpy_tensorflow_style(doc: str) -> Dict[str, Any]:
         "examples": ""
     }
 
-    section_headers = [
-        "Parameters", "Returns", "Yields", "Raises", "Warns", "See Also", "Notes", "Examples", "Attributes", "Methods", "References", "Warnings", "Deprecated", "Versionadded", "Versionchanged", "Other Parameters"
-    ]
-    sphinx_directives = [
-        ".. note::", ".. warning::", ".. versionadded::", ".. versionchanged::", ".. deprecated::", ".. seealso::", ".. rubric::", ".. admonition::"
-    ]
-    # Build a regex pattern for all section headers and Sphinx directives
-    # Match: any number of blank lines, header, optional colon, optional blank lines, optional underline
-    header_pattern = r"(?im)^(\s*\n)*((%s)\s*:?\s*(\n\s*[-=~`']{3,}\s*)?\n)" % '|'.join([re.escape(h) for h in section_headers])
-    directive_pattern = r"(?im)^(\s*\n)*((%s)\s*)" % '|'.join([re.escape(d) for d in sphinx_directives])
-    # Find the earliest match
-    match1 = re.search(header_pattern, doc)
-    match2 = re.search(directive_pattern, doc)
-    cut = None
-    if match1 and match2:
-        cut = min(match1.start(), match2.start())
-    elif match1:
-        cut = match1.start()
-    elif match2:
-        cut = match2.start()
+    # Corta o resumo no primeiro cabeçalho de seção ou diretiva Sphinx
+    match = _NUMPY_SUMMARY_CUT_RE.search(doc)
+    cut = match.start() if match else None
     if cut is not None and cut > 0:
         summary = doc[:cut]
     else:
         summary = doc
     result["description"] = dedent_doc(summary.strip())
 
-    # DEBUG: Print the first 1000 characters before truncation
-    sys.stderr.write("[DEBUG] Description before truncation:\n" + result["description"][:1000].replace("\n", "\\n") + "\n")
-    sys.stderr.flush()
-
-    split_patterns = [
-        r"^\s*Parameters\s*\n[-=~`']{3,}\n",
-        r"^\s*Returns\s*\n[-=~`']{3,}\n",
-        r"^\s*Yields\s*\n[-=~`']{3,}\n",
-        r"^\s*Raises\s*\n[-=~`']{3,}\n",
-        r"^\s*Warns\s*\n[-=~`']{3,}\n",
-        r"^\s*See Also\s*\n[-=~`']{3,}\n",
-        r"^\s*Notes\s*\n[-=~`']{3,}\n",
-        r"^\s*Examples\s*\n[-=~`']{3,}\n",
-        r"^\s*Attributes\s*\n[-=~`']{3,}\n",
-        r"^\s*Methods\s*\n[-=~`']{3,}\n",
-        r"^\s*References\s*\n[-=~`']{3,}\n",
-        r"^\s*Warnings\s*\n[-=~`']{3,}\n",
-        r"^\s*Deprecated\s*\n[-=~`']{3,}\n",
-        r"^\s*Other Parameters\s*\n[-=~`']{3,}\n",
-        r"^[ \t]*\.\. [a-zA-Z]+::.*$"  # Sphinx directive, allow for any indentation
-    ]
-    earliest = None
-    for pat in split_patterns:
-        m = re.search(pat, result["description"], re.MULTILINE)
-        if m:
-            if earliest is None or m.start() < earliest:
-                earliest = m.start()
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        # Primeiros 1000 caracteres antes do corte
+        logger.debug("Description before truncation:\n%s", result["description"][:1000].replace("\n", "\\n"))
+
+    m = _NUMPY_DESCRIPTION_SPLIT_RE.search(result["description"])
+    earliest = m.start() if m else None
     if earliest is not None and earliest > 0:
         result["description"] = result["description"][:earliest].strip()
 
-    # DEBUG: Print the first 1000 characters after truncation
-    sys.stderr.write("[DEBUG] Description after truncation:\n" + result["description"][:1000].replace("\n", "\\n") + "\n")
-    sys.stderr.flush()
+    if debug:
+        # Primeiros 1000 caracteres depois do corte
+        logger.debug("Description after truncation:\n%s", result["description"][:1000].replace("\n", "\\n"))
     # Args/Parameters
-    params_match = re.search(r'\n\s*Parameters\s*\n\s*[-]+\s*\n', doc)
+    params_match = _NUMPY_PARAMS_HEADER_RE.search(doc)
     if params_match:
-        sections = re.split(r'\n\s*([A-Za-z][A-Za-z\s]*)\s*\n\s*[-]+\s*\n', doc[params_match.start():])
+        sections = _NUMPY_SECTION_SPLIT_RE.split(doc[params_match.start():])
         current_section = None
         for i, section in enumerate(sections):
             if i % 2 == 0 and current_section:
@@ -284,7 +556,7 @@ def parse_numpy_tensorflow_style(doc: str) -> Dict[str, Any]:
                     current_type = ""
                     current_desc = []
                     for line in lines:
-                        param_match = re.match(r'^([a-zA-Z0-9_]+)\s*:\s*(.*)$', line.strip())
+                        param_match = _PARAM_NAME_TYPE_RE.match(line.strip())
                         if param_match:
                             if current_param:
                                 result["parameters"][current_param] = {
@@ -309,15 +581,8 @@ def parse_numpy_tensorflow_style(doc: str) -> Dict[str, Any]:
                 current_section = section
     else:
         # Tente encontrar outras seções com formato diferente (estilo Google)
-        for section_name, pattern in [
-            ("parameters", r'Parameters\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)'),
-            ("returns", r'Returns\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)'),
-            ("raises", r'Raises\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)'),
-            ("see_also", r'See Also\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)'),
-            ("notes", r'Notes\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)'),
-            ("examples", r'Examples\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)')
-        ]:
-            match = re.search(pattern, doc, re.DOTALL)
+        for section_name, pattern in _NUMPY_GOOGLE_SECTIONS:
+            match = pattern.search(doc)
             if match:
                 if section_name == "parameters":
                     param_text = match.group(1)
@@ -351,20 +616,20 @@ def parse_numpy_tensorflow_style(doc: str) -> Dict[str, Any]:
                     result[section_name] = dedent_doc(match.group(1).strip())
     # Limpeza final: se a seção de descrição contiver uma seção de Parâmetros, trunque-a
     if result["description"]:
-        param_start = re.search(r'\n\s*Parameters\s*\n\s*[-]+\s*\n', result["description"])
+        param_start = _NUMPY_PARAMS_HEADER_RE.search(result["description"])
         if param_start:
             result["description"] = dedent_doc(result["description"][:param_start.start()].strip())
     if not result["parameters"]:
-        params_match = re.search(r'Parameters\s*\n\s*[-]+\s*\n(.*?)(?:\n\s*[A-Z][a-z]+\s*\n\s*[-]+\s*\n|\Z)', doc, re.DOTALL)
+        params_match = _NUMPY_PARAMS_BLOCK_RE.search(doc)
         if params_match:
             param_section = params_match.group(1)
-            param_blocks = re.split(r'\n(?=\S)', param_section)
+            param_blocks = _UNINDENTED_LINE_SPLIT_RE.split(param_section)
             for block in param_blocks:
                 lines = block.split('\n')
                 if not lines:
                     continue
                 first_line = lines[0].strip()
-                param_match = re.match(r'^([a-zA-Z0-9_]+)\s*:\s*(.*)$', first_line)
+                param_match = _PARAM_NAME_TYPE_RE.match(first_line)
                 if param_match:
                     param_name = param_match.group(1)
                     param_type = param_match.group(2)
@@ -377,64 +642,6 @@ def parse_numpy_tensorflow_style(doc: str) -> Dict[str, Any]:
                         "description": dedent_doc(param_desc)
                     }
     return result
-    
-    # Extract other sections
-    for section_name, section_key in [
-        ("Returns", "returns"),
-        ("Raises", "raises"),
-        ("See Also", "see_also"),
-        ("Notes", "notes"),
-        ("Examples", "examples")
-    ]:
-        for pattern in [
-            fr'{section_name}\s*\n\s*[-]+\s*\n(.*?)(?=\n\s*[A-Z][a-z]+\s*\n\s*[-]+\s*\n|\Z)',
-            fr'{section_name}\s*:(.*?)(?=\n\s*[A-Z][a-z]+\s*:|\Z)'
-        ]:
-            match = re.search(pattern, doc, re.DOTALL)
-            if match:
-                result[section_key] = match.group(1).strip()
-                break
-    
-    # If we still don't have parameters, try Google-style parsing as fallback
-    if not result["parameters"]:
-        args_match = re.search(r'(?:Args|Arguments|Parameters):\s*\n(.*?)(?:\n\s*(?:Returns|Raises|Examples|Notes):|$)', doc, re.DOTALL)
-        if args_match:
-            args_text = args_match.group(1)
-            current_param = None
-            current_type = ""
-            current_desc = []
-            
-            for line in args_text.split('\n'):
-                line = line.strip()
-                if not line:
-                    continue
-                
-                # Match parameter definition lines
-                param_match = re.match(r'^([a-zA-Z0-9_]+)(?:\s*\(([^)]*)\))?(?:\s*:)?\s*(.*)$', line)
-                if param_match:
-                    # Save previous parameter if exists
-                    if current_param:
-                        result["parameters"][current_param] = {
-                            "type": current_type.strip(),
-                            "description": "\n".join(current_desc).strip()
-                        }
-                    
-                    # Start new parameter
-                    current_param = param_match.group(1)
-                    current_type = param_match.group(2) or ""
-                    current_desc = [param_match.group(3) or ""]
-                elif current_param:
-                    # Continue with previous parameter description
-                    current_desc.append(line)
-            
-            # Save last parameter
-            if current_param:
-                result["parameters"][current_param] = {
-                    "type": current_type.strip(),
-                    "description": "\n".join(current_desc).strip()
-                }
-    
-    return result
 
 def parse_jax_docstring(doc: str) -> Dict[str, Any]:
     """
@@ -462,12 +669,12 @@ def parse_jax_docstring(doc: str) -> Dict[str, Any]:
     }
     
     # Extrai descrição (até a primeira seção)
-    sections = re.split(r'\n\s*(?:Args|Arguments|Parameters|Returns|Raises|Examples|Notes|See Also):', doc)
+    sections = _JAX_DESCRIPTION_SPLIT_RE.split(doc)
     if sections:
         result["description"] = sections[0].strip()
     
     # Parâmetros no formato JAX
-    params_match = re.search(r'(?:Args|Arguments|Parameters):(.*?)(?:\n\s*(?:Returns|Raises|Examples|Notes|See Also):|$)', doc, re.DOTALL)
+    params_match = _JAX_PARAMS_RE.search(doc)
     if params_match:
         params_text = params_match.group(1)
         # JAX usa diversos formatos para parâmetros
@@ -484,15 +691,15 @@ def parse_jax_docstring(doc: str) -> Dict[str, Any]:
             indent = len(line) - len(line.lstrip())
             
             # Pattern mais comum no JAX: parameter_name: parameter_type
-            param_match = re.match(r'^([a-zA-Z0-9_]+)\s*:\s*([^-\s][^-]*?)(?:\s*-\s*(.*))?$', stripped_line)
+            param_match = _JAX_PARAM_TYPE_RE.match(stripped_line)
             
             # Alternativa: parameter_name (param_type): description
             if not param_match:
-                param_match = re.match(r'^([a-zA-Z0-9_]+)\s*\(([^)]*)\)(?:\s*:)?\s*(.*)$', stripped_line)
+                param_match = _JAX_PARAM_PAREN_RE.match(stripped_line)
             
             # Alternativa: parameter_name -- description
             if not param_match:
-                param_match = re.match(r'^([a-zA-Z0-9_]+)\s*--\s*(.*)$', stripped_line)
+                param_match = _JAX_PARAM_DASHES_RE.match(stripped_line)
                 if param_match:
                     param_match = (param_match.group(1), "", param_match.group(2))
             
@@ -526,27 +733,27 @@ def parse_jax_docstring(doc: str) -> Dict[str, Any]:
             }
     
     # Returns
-    returns_match = re.search(r'Returns:(.*?)(?:\n\s*(?:Raises|Examples|Notes|See Also):|$)', doc, re.DOTALL)
+    returns_match = _JAX_RETURNS_RE.search(doc)
     if returns_match:
         result["returns"] = returns_match.group(1).strip()
     
     # Raises
-    raises_match = re.search(r'Raises:(.*?)(?:\n\s*(?:Examples|Notes|See Also):|$)', doc, re.DOTALL)
+    raises_match = _JAX_RAISES_RE.search(doc)
     if raises_match:
         result["raises"] = raises_match.group(1).strip()
     
     # Examples
-    examples_match = re.search(r'Examples:(.*?)(?:\n\s*(?:Notes|See Also):|$)', doc, re.DOTALL)
+    examples_match = _JAX_EXAMPLES_RE.search(doc)
     if examples_match:
         result["examples"] = examples_match.group(1).strip()
     
     # Notes
-    notes_match = re.search(r'Notes:(.*?)(?:\n\s*(?:Examples|See Also):|$)', doc, re.DOTALL)
+    notes_match = _JAX_NOTES_RE.search(doc)
     if notes_match:
         result["notes"] = notes_match.group(1).strip()
     
     # See Also
-    see_also_match = re.search(r'See Also:(.*?)(?:\n\s*(?:Examples|Notes):|$)', doc, re.DOTALL)
+    see_also_match = _JAX_SEE_ALSO_RE.search(doc)
     if see_also_match:
         result["see_also"] = see_also_match.group(1).strip()
     
@@ -578,16 +785,16 @@ def parse_requests_docstring(doc: str) -> Dict[str, Any]:
     }
     
     # Requests usa muitos docstrings no formato :param param_name: description
-    result["description"] = re.sub(r':(?:param|return|returns|raises|rtype).*$', '', doc, flags=re.MULTILINE).strip()
+    result["description"] = _REQUESTS_FIELD_LINE_RE.sub('', doc).strip()
     
     # Extrai parâmetros no formato :param name: description
-    param_matches = re.finditer(r':param\s+([^:]+):\s*(.*?)(?=\n\s*:(?:param|return|returns|raises|rtype)|$)', doc, re.DOTALL)
+    param_matches = _REQUESTS_PARAM_RE.finditer(doc)
     for match in param_matches:
         param_name = match.group(1).strip()
         param_desc = match.group(2).strip()
         
         # Tenta extrair tipo se estiver presente no nome do parâmetro
-        type_match = re.match(r'^([^\s]+)\s+(.+)$', param_name)
+        type_match = _REQUESTS_TYPED_NAME_RE.match(param_name)
         if type_match:
             param_type = type_match.group(1)
             param_name = type_match.group(2)
@@ -600,22 +807,89 @@ def parse_requests_docstring(doc: str) -> Dict[str, Any]:
         }
     
     # Return
-    return_match = re.search(r':(?:return|returns):\s*(.*?)(?=\n\s*:(?:param|raises|rtype)|$)', doc, re.DOTALL)
+    return_match = _REQUESTS_RETURN_RE.search(doc)
     if return_match:
         result["returns"] = return_match.group(1).strip()
     
     # Return type
-    rtype_match = re.search(r':rtype:\s*(.*?)(?=\n\s*:(?:param|return|returns|raises)|$)', doc, re.DOTALL)
+    rtype_match = _REQUESTS_RTYPE_RE.search(doc)
     if rtype_match and "returns" in result:
         result["returns"] = f"{result['returns']} (tipo: {rtype_match.group(1).strip()})"
     
     # Raises
-    raises_match = re.search(r':raises:\s*(.*?)(?=\n\s*:(?:param|return|returns|raises|rtype)|$)', doc, re.DOTALL)
+    raises_match = _REQUESTS_RAISES_RE.search(doc)
     if raises_match:
         result["raises"] = raises_match.group(1).strip()
     
     return result
 
+# Formatos de cabeçalho reconhecidos por parse_generic_docstring, na ordem em que são avaliados
+_GENERIC_HEADER_FORMATS = 4  # 0: "Section:\n", 1: "Section\n----\n", 2: "Section:", 3: "Section " (seguido de espaço)
+
+def _tokenize_generic_sections(doc: str) -> Dict[str, List[Tuple[int, int, Dict[int, Tuple[int, int]]]]]:
+    """
+    Percorre a docstring uma única vez, linha a linha, e localiza os
+    cabeçalhos das seções conhecidas (exceto na primeira linha).
+
+    Devolve, para cada seção, a lista em ordem das ocorrências como
+    (início da linha, início do espaço em branco antes do nome,
+    {formato do cabeçalho: (início do conteúdo, fim mínimo do cabeçalho)}).
+    O início do conteúdo depende do formato: logo após ":" no estilo Google,
+    e na linha seguinte ao cabeçalho/sublinhado nos estilos NumPy.
+    """
+    occurrences = {}
+    lines = doc.split('\n')
+    line_start = len(lines[0]) + 1
+    for line in lines[1:]:
+        stripped = line.lstrip()
+        match = _GENERIC_HEADER_RE.match(stripped)
+        section = _GENERIC_SECTION_BY_LOWER.get(match.group(0).lower()) if match else None
+        if section is not None:
+            name_start = line_start + len(line) - len(stripped)
+            after = name_start + match.end()
+            next_char = doc[after:after + 1]
+            formats = {}
+            if next_char == ':':
+                formats[2] = (after + 1, after + 1)
+                run_end = _WHITESPACE_RE.match(doc, after + 1).end()
+                first_newline = doc.find('\n', after + 1, run_end)
+                if first_newline != -1:
+                    formats[0] = (doc.rfind('\n', after + 1, run_end) + 1, first_newline + 1)
+            elif next_char.isspace():
+                run_end = _WHITESPACE_RE.match(doc, after).end()
+                formats[3] = (run_end, after + 1)
+                if doc.find('\n', after, run_end) != -1 and doc.startswith('-', run_end):
+                    dashes_end = _DASHES_RE.match(doc, run_end).end()
+                    underline_end = _WHITESPACE_RE.match(doc, dashes_end).end()
+                    first_newline = doc.find('\n', dashes_end, underline_end)
+                    if first_newline != -1:
+                        formats[1] = (doc.rfind('\n', dashes_end, underline_end) + 1, first_newline + 1)
+            if formats:
+                run_start = name_start
+                while run_start > 0 and doc[run_start - 1].isspace():
+                    run_start -= 1
+                occurrences.setdefault(section, []).append((line_start, run_start, formats))
+        line_start += len(line) + 1
+    return occurrences
+
+def _generic_section_end(doc: str, section_occurrences, header_format: int, content_start: int) -> int:
+    """
+    Fim do conteúdo de uma seção: o próximo cabeçalho da mesma seção (em
+    qualquer formato) que caiba antes da próxima ocorrência no mesmo formato.
+    """
+    following = [occ for occ in section_occurrences if occ[0] > content_start]
+    limit = len(doc)
+    for line_start, run_start, formats in following:
+        if header_format in formats:
+            limit = doc.find('\n', max(run_start, content_start))
+            break
+    for line_start, run_start, formats in following:
+        if line_start > limit:
+            break
+        if any(min_end <= limit for _, min_end in formats.values()):
+            return line_start
+    return limit
+
 def parse_generic_docstring(doc: str) -> Dict[str, Any]:
     """
     Parser genérico que tenta lidar com vários estilos de docstrings
@@ -641,44 +915,24 @@ def parse_generic_docstring(doc: str) -> Dict[str, Any]:
         "examples": ""
     }
     
-    # Primeiro, tenta encontrar seções principais
-    known_sections = ["Parameters", "Args", "Arguments", "Returns", "Return", "Raises", "Exceptions", 
-                      "See Also", "Notes", "Note", "Examples", "Example"]
-    
     # Divide a docstring em seções
-    current_section = "description"
     result["description"] = doc.strip()
+    occurrences = _tokenize_generic_sections(doc)
     
-    for section in known_sections:
-        # Diferentes formatos de seções
-        patterns = [
-            fr'\n\s*{section}:\s*\n',  # NumPy style: Section:\n
-            fr'\n\s*{section}\s*\n\s*-+\s*\n',  # NumPy style: Section\n------\n
-            fr'\n\s*{section}:',  # Google style: Section:
-            fr'\n\s*{section}\s+'  # Section seguido de espaço
-        ]
-        
-        for pattern in patterns:
-            section_parts = re.split(pattern, doc, flags=re.IGNORECASE)
-            if len(section_parts) > 1:
+    # Primeiro, tenta encontrar seções principais (diferentes formatos de cabeçalho)
+    for section in _GENERIC_SECTIONS:
+        section_occurrences = occurrences.get(section, ())
+        for header_format in range(_GENERIC_HEADER_FORMATS):
+            first = next((occ for occ in section_occurrences if header_format in occ[2]), None)
+            if first is not None:
+                line_start, _, formats = first
                 # Atualiza a descrição para ser apenas a parte antes da primeira seção
-                if current_section == "description":
-                    result["description"] = section_parts[0].strip()
-                
-                # Trata o conteúdo desta seção
-                section_content = section_parts[1]
-                next_section_match = None
-                
-                # Encontra onde começa a próxima seção
-                for next_section in known_sections:
-                    for next_pattern in patterns:
-                        match = re.search(next_pattern, section_content, re.IGNORECASE)
-                        if match and (next_section_match is None or match.start() < next_section_match.start()):
-                            next_section_match = match
+                result["description"] = doc[:line_start].strip()
                 
-                # Extrai o conteúdo até a próxima seção
-                if next_section_match:
-                    section_content = section_content[:next_section_match.start()]
+                # O conteúdo vai até o próximo cabeçalho da mesma seção
+                content_start = formats[header_format][0]
+                content_end = _generic_section_end(doc, section_occurrences, header_format, content_start)
+                section_content = doc[content_start:content_end]
                 
                 section_key = section.lower().replace(' ', '_')
                 
@@ -696,16 +950,9 @@ def parse_generic_docstring(doc: str) -> Dict[str, Any]:
                             continue
                         
                         # Diversos padrões para definição de parâmetros
-                        param_patterns = [
-                            r'^([a-zA-Z0-9_]+)\s*:\s*([^-]*)(?:\s*-\s*(.*))?$',  # name: type - desc
-                            r'^([a-zA-Z0-9_]+)\s*\(([^)]*)\)(?:\s*:)?\s*(.*)$',  # name(type): desc
-                            r'^([a-zA-Z0-9_]+)\s+--\s+(.*)$',  # name -- desc
-                            r'^([a-zA-Z0-9_]+)\s+(.*)$'  # name desc
-                        ]
-                        
                         matched = False
-                        for param_pattern in param_patterns:
-                            param_match = re.match(param_pattern, line)
+                        for param_pattern in _GENERIC_PARAM_PATTERNS:
+                            param_match = param_pattern.match(line)
                             if param_match:
                                 if current_param:  # Finaliza o parâmetro anterior
                                     result["parameters"][current_param] = {
@@ -715,7 +962,7 @@ def parse_generic_docstring(doc: str) -> Dict[str, Any]:
                                 
                                 current_param = param_match.group(1)
                                 if len(param_match.groups()) > 1:
-                                    if param_pattern == r'^([a-zA-Z0-9_]+)\s+--\s+(.*)$':
+                                    if param_pattern is _GENERIC_PARAM_DASHES_RE:
                                         current_type = ""
                                         current_desc = [param_match.group(2)]
                                     else:
@@ -759,12 +1006,93 @@ def parse_generic_docstring(doc: str) -> Dict[str, Any]:
     
     return result
 
+class DocstringCache:
+    """
+    Cache LRU limitado para os resultados de parse_docstring.
+
+    A chave é (parser escolhido, conteúdo da docstring), então docstrings
+    idênticas (ex.: métodos herdados como get_params/set_params) são
+    parseadas uma única vez. Os dicionários devolvidos são compartilhados
+    entre as entradas e não devem ser modificados.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get_or_parse(self, parser, doc: str) -> Dict[str, Any]:
+        key = (parser.__name__, doc)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = parser(doc)
+        if self.maxsize > 0:
+            self._entries[key] = entry
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+DOCSTRING_CACHE = DocstringCache()
+
+class ExtractionStats:
+    """
+    Tempos e contagens da extração acumulados no processo atual. Como o
+    DOCSTRING_CACHE, cada worker tem o seu: as tarefas devolvem a diferença
+    (since) entre o início e o fim de cada módulo.
+
+    enumeration_seconds é o tempo gasto percorrendo os membros (dir,
+    getattr, inspeção das classes e MRO) incluindo o parse das docstrings e
+    as assinaturas, que também são medidos à parte.
+    """
+
+    FIELDS = ("import_seconds", "enumeration_seconds", "parse_seconds", "signature_seconds",
+              "functions", "classes", "methods", "parameters", "aliases", "lazy_skipped")
+
+    def __init__(self):
+        self.reset()
+
+    def snapshot(self) -> Dict[str, float]:
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def since(self, snapshot: Dict[str, float]) -> Dict[str, float]:
+        return {field: getattr(self, field) - snapshot[field] for field in self.FIELDS}
+
+    def reset(self) -> None:
+        for field in self.FIELDS:
+            setattr(self, field, 0)
+
+EXTRACTION_STATS = ExtractionStats()
+
+def select_docstring_parser(module_name: str):
+    """Escolhe o parser especializado com base no módulo, com fallback para o genérico."""
+    if is_torch_module(module_name):
+        return parse_torch_docstring
+    elif is_jax_module(module_name):
+        return parse_jax_docstring
+    elif is_requests_module(module_name):
+        return parse_requests_docstring
+    elif is_numpy_module(module_name) or is_tensorflow_module(module_name) or is_sklearn_module(module_name):
+        return parse_numpy_tensorflow_style
+    else:
+        return parse_generic_docstring
+
 def parse_docstring(doc: Optional[str], module_name: str) -> dict:
-    import sys
-    sys.stderr.write(f"[DEBUG] parse_docstring called for module: {module_name}\n")
-    sys.stderr.flush()
     """
     Decide o parser com base na biblioteca, com fallback para parser genérico.
+    Resultados repetidos vêm do DOCSTRING_CACHE.
     """
     if not doc:
         return {
@@ -777,22 +1105,20 @@ def parse_docstring(doc: Optional[str], module_name: str) -> dict:
             "examples": ""
         }
     
-    # Escolhe o parser especializado com base no módulo
-    if is_torch_module(module_name):
-        sys.stderr.write("[DEBUG] Using parse_torch_docstring\n"); sys.stderr.flush()
-        return parse_torch_docstring(doc)
-    elif is_jax_module(module_name):
-        sys.stderr.write("[DEBUG] Using parse_jax_docstring\n"); sys.stderr.flush()
-        return parse_jax_docstring(doc)
-    elif is_requests_module(module_name):
-        sys.stderr.write("[DEBUG] Using parse_requests_docstring\n"); sys.stderr.flush()
-        return parse_requests_docstring(doc)
-    elif is_numpy_module(module_name) or is_tensorflow_module(module_name) or is_sklearn_module(module_name):
-        sys.stderr.write("[DEBUG] Using parse_numpy_tensorflow_style\n"); sys.stderr.flush()
-        return parse_numpy_tensorflow_style(doc)
-    else:
-        sys.stderr.write("[DEBUG] Using parse_generic_docstring\n"); sys.stderr.flush()
-        return parse_generic_docstring(doc)
+    parser = select_docstring_parser(module_name)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("parse_docstring for module %s using %s", module_name, parser.__name__)
+    start = time.perf_counter()
+    parsed = DOCSTRING_CACHE.get_or_parse(parser, doc)
+    EXTRACTION_STATS.parse_seconds += time.perf_counter() - start
+    return parsed
+
+def _timed_signature(func, module_name: str) -> str:
+    """get_function_signature contabilizando o tempo em EXTRACTION_STATS."""
+    start = time.perf_counter()
+    signature = get_function_signature(func, module_name)
+    EXTRACTION_STATS.signature_seconds += time.perf_counter() - start
+    return signature
 
 def safe_extract(module, name):
     """Tenta acessar o atributo de forma segura."""
@@ -804,46 +1130,258 @@ def safe_extract(module, name):
         warnings.warn(f"Erro ao acessar {name} em {module.__name__}: {str(e)}")
         return None
 
-def extract_functions(module, module_name: str) -> List[Dict]:
-    """Extrai todas as funções públicas do módulo com docstrings parseadas."""
-    import inspect  # Import local para não quebrar se não for usado
-    functions = []
-    for name in dir(module):
-        if name.startswith('_'):
+# Propriedades de classe: o getattr na classe devolve o próprio descritor,
+# então não há o que resolver (e nenhum código do getter roda)
+_PROPERTY_TYPES = (property, cached_property)
+
+def static_member(owner, name: str, resolve_lazy: bool = True):
+    """
+    Lê um membro de um módulo ou classe sem disparar carregamentos
+    preguiçosos: inspect.getattr_static não chama o __getattr__ de módulos
+    (tensorflow, scipy e jax importam subpacotes inteiros por ele) nem o
+    getter de propriedades.
+
+    Nomes que só existem pelo __getattr__ do módulo (PEP 562, como o
+    ThreadPoolExecutor de concurrent.futures) são lidos com o getattr normal
+    (safe_extract), que os resolve; com resolve_lazy=False devolvem None,
+    contados em EXTRACTION_STATS.lazy_skipped. Os outros descritores de classe
+    (métodos, classmethod, descritores de bibliotecas como o available_if do
+    sklearn) são resolvidos com __get__(None, classe), como o getattr faria.
+    """
+    try:
+        raw = inspect.getattr_static(owner, name)
+    except AttributeError:
+        if resolve_lazy:
+            return safe_extract(owner, name)
+        EXTRACTION_STATS.lazy_skipped += 1
+        logger.debug("Membro preguiçoso %s de %s ignorado (--skip-lazy)",
+                     name, getattr(owner, "__name__", owner))
+        return None
+    if not inspect.isclass(owner) or inspect.isclass(raw) or isinstance(raw, _PROPERTY_TYPES):
+        # No __dict__ de um módulo os descritores não são executados pelo getattr
+        return raw
+    if not hasattr(type(raw), "__get__"):
+        return raw
+    try:
+        return raw.__get__(None, owner)
+    except Exception as e:
+        warnings.warn(f"Erro ao acessar {name} em {owner.__name__}: {str(e)}")
+        return None
+
+# Políticas de superfície pública (ver public_surface)
+PUBLIC_POLICIES = ("dir", "module", "all")
+
+def declared_public_names(module) -> Optional[List[str]]:
+    """Nomes do __all__ do módulo, ordenados, ou None se ele não define um __all__ válido."""
+    declared = vars(module).get("__all__")
+    if not isinstance(declared, (list, tuple)) or not all(isinstance(name, str) for name in declared):
+        return None
+    return sorted(set(declared))
+
+def is_library_member(obj, module_name: str) -> bool:
+    """
+    Indica se `obj` foi definido na biblioteca de `module_name` (pelo
+    __module__). Objetos sem __module__ (comuns em extensões em C) contam
+    como da biblioteca, já que não há como saber.
+    """
+    defining_module = getattr(obj, "__module__", None)
+    if not isinstance(defining_module, str):
+        return True
+    library_root = module_name.split('.')[0]
+    return defining_module == library_root or defining_module.startswith(library_root + ".")
+
+def public_surface(module, policy: str = "dir") -> Tuple[List[str], bool]:
+    """
+    Nomes a extrair de um módulo, em ordem, e se os membros ainda devem
+    ser filtrados com is_library_member. Políticas:
+      - "dir": todo nome do dir() que não começa com "_" (o comportamento
+        original, que inclui os módulos e nomes importados, como os, warnings
+        e typing.*);
+      - "module": os mesmos nomes, mas só os membros definidos na biblioteca;
+      - "all": o __all__ do módulo quando existe, sem outro filtro; sem
+        __all__, o mesmo que "module".
+    """
+    if policy not in PUBLIC_POLICIES:
+        raise ValueError(f"Política de superfície pública desconhecida: {policy}")
+    if policy == "all":
+        declared = declared_public_names(module)
+        if declared is not None:
+            return declared, False
+    return [name for name in dir(module) if not name.startswith('_')], policy != "dir"
+
+def canonical_module(obj, module_name: str) -> Optional[str]:
+    """
+    Módulo da biblioteca de `module_name` em que `obj` (função ou classe) é
+    documentado: o próprio __module__ ou, se ele for privado ou não expuser
+    o objeto pelo nome, o ancestral público mais próximo que o expõe (como
+    sklearn.linear_model para sklearn.linear_model._logistic). None se o
+    objeto não for da biblioteca ou não estiver em nenhum módulo extraído.
+
+    A regra só depende do objeto, então todos os workers chegam ao mesmo
+    módulo sem compartilhar estado: é o registro de identidade da execução.
+    """
+    name = getattr(obj, "__name__", None)
+    defining_module = getattr(obj, "__module__", None)
+    if not isinstance(name, str) or not isinstance(defining_module, str):
+        return None
+    library_root = module_name.split('.')[0]
+    if defining_module != library_root and not defining_module.startswith(library_root + "."):
+        return None
+    parts = defining_module.split('.')
+    for end in range(len(parts), 0, -1):
+        if any(part.startswith('_') for part in parts[:end]):
             continue
+        candidate = sys.modules.get(".".join(parts[:end]))
+        if getattr(candidate, "__file__", None) and vars(candidate).get(name) is obj:
+            return candidate.__name__
+    return None
+
+# (módulo, política) -> (módulo, nomes públicos), para não refazer o dir()
+# do dono a cada alias; o módulo guardado invalida a entrada se ele for recarregado
+_OWNER_SURFACES: Dict[Tuple[str, str], Tuple[Any, frozenset]] = {}
+
+def emits_member(owner: str, name: str, public_policy: str = "dir") -> bool:
+    """
+    Indica se a extração do módulo `owner` grava o membro `name`: o nome
+    está na superfície pública do módulo (ver public_surface) com a mesma
+    política. canonical_module já garante que o membro é da biblioteca.
+    """
+    module = sys.modules[owner]
+    cached = _OWNER_SURFACES.get((owner, public_policy))
+    if cached is None or cached[0] is not module:
+        cached = (module, frozenset(public_surface(module, public_policy)[0]))
+        _OWNER_SURFACES[(owner, public_policy)] = cached
+    return name in cached[1]
+
+def _alias_record(obj, name: str, kind: str, module_name: str, aliases: Optional[List[Dict]],
+                  alias_modules: Optional[Collection[str]] = None, public_policy: str = "dir") -> Optional[Dict]:
+    """
+    Registro de alias de `obj` se ele for documentado em outro módulo (ver
+    canonical_module) e `aliases` não for None; guarda-o em `aliases`.
+
+    O alias só é emitido se o dono grava o objeto: ele está entre os
+    módulos extraídos (`alias_modules`, quando dado) e o nome do objeto
+    está na sua superfície pública (ver emits_member). Senão o objeto é
+    extraído por inteiro aqui, como sem alias_reexports.
+    """
+    if aliases is None:
+        return None
+    owner = canonical_module(obj, module_name)
+    if owner is None or owner == module_name:
+        return None
+    if alias_modules is not None and owner not in alias_modules:
+        return None
+    if not emits_member(owner, obj.__name__, public_policy):
+        return None
+    record = {"name": name, "type": kind, "alias_of": f"{owner}.{obj.__name__}"}
+    aliases.append(record)
+    EXTRACTION_STATS.aliases += 1
+    return record
+
+def iter_functions(module, module_name: str, resolve_lazy: bool = True, aliases: Optional[List[Dict]] = None,
+                   public_policy: str = "dir", alias_modules: Optional[Collection[str]] = None):
+    """
+    Gera, uma a uma, as funções públicas do módulo com docstrings parseadas,
+    já em ordem de nome (dir() devolve os nomes ordenados). Os membros são
+    lidos com static_member; resolve_lazy=False ignora os preguiçosos.
+
+    Com uma lista `aliases`, as funções reexportadas de outro módulo da
+    biblioteca não são extraídas de novo: viram registros de alias
+    ({"name", "type", "alias_of"}) acrescentados a essa lista, desde que o
+    dono esteja em `alias_modules` e grave a função (ver _alias_record).
+
+    Os nomes considerados públicos dependem de `public_policy` (ver
+    public_surface).
+    """
+    import inspect  # Import local para não quebrar se não for usado
+    names, library_only = public_surface(module, public_policy)
+    for name in names:
+        record = None
+        start = time.perf_counter()
         try:
-            obj = safe_extract(module, name)
-            if obj is None:
+            obj = static_member(module, name, resolve_lazy)
+            if obj is None or (library_only and not is_library_member(obj, module_name)):
                 continue
             if inspect.isfunction(obj) or inspect.isbuiltin(obj) or callable(obj):
-                if inspect.isclass(obj):
+                if inspect.isclass(obj) or _alias_record(obj, name, "function", module_name, aliases,
+                                                         alias_modules, public_policy):
                     continue
                 doc = getattr(obj, "__doc__", "") or ""
-                signature = get_function_signature(obj, module_name)
+                signature = _timed_signature(obj, module_name)
                 parsed_doc = parse_docstring(doc, module_name)
-                functions.append({
+                record = {
                     "name": name,
                     "signature": signature,
                     "documentation": parsed_doc
-                })
+                }
         except Exception as e:
             warnings.warn(f"Erro ao processar função {name} no módulo {module_name}: {str(e)}")
-    return sorted(functions, key=lambda x: x["name"])
+        finally:
+            EXTRACTION_STATS.enumeration_seconds += time.perf_counter() - start
+        if record is not None:
+            EXTRACTION_STATS.functions += 1
+            EXTRACTION_STATS.parameters += len(record["documentation"].get("parameters", {}))
+            yield record
+
+def extract_functions(module, module_name: str, resolve_lazy: bool = True, public_policy: str = "dir") -> List[Dict]:
+    """Extrai todas as funções públicas do módulo com docstrings parseadas."""
+    return list(iter_functions(module, module_name, resolve_lazy=resolve_lazy, public_policy=public_policy))
+
+def find_defining_class(cls, name: str):
+    """Primeira classe do MRO de `cls` que define `name` no próprio __dict__."""
+    for klass in inspect.getmro(cls):
+        if name in getattr(klass, "__dict__", {}):
+            return klass
+    return None
+
+def is_documented_separately(klass, module_name: str) -> bool:
+    """
+    Indica se `klass` é extraída por conta própria na mesma biblioteca: está
+    num módulo público da biblioteca de `module_name` e é acessível pelo nome
+    nesse módulo. Só os métodos dessas classes podem deixar de ser repetidos
+    nas subclasses sem se perder da documentação.
+    """
+    library_root = module_name.split('.')[0]
+    defining_module = getattr(klass, "__module__", None) or ""
+    if defining_module != library_root and not defining_module.startswith(library_root + "."):
+        return False
+    if klass.__name__.startswith('_') or any(part.startswith('_') for part in defining_module.split('.')):
+        return False
+    module = sys.modules.get(defining_module)
+    return module is not None and getattr(module, "__dict__", {}).get(klass.__name__) is klass
+
+def class_reference(klass) -> str:
+    """Referência qualificada de uma classe (módulo.qualname)."""
+    return f"{klass.__module__}.{klass.__qualname__}"
 
-def extract_methods(cls, module_name: str) -> List[Dict]:
-    import inspect
+def inherited_class_references(cls, module_name: str) -> List[str]:
+    """Ancestrais documentados separadamente, na ordem do MRO (o "inherits from" da classe)."""
+    return [class_reference(klass) for klass in inspect.getmro(cls)[1:]
+            if is_documented_separately(klass, module_name)]
+
+def extract_methods(cls, module_name: str, mro_aware: bool = False, resolve_lazy: bool = True) -> List[Dict]:
+    """
+    Extrai os métodos públicos de uma classe. Com mro_aware=True, métodos
+    herdados de uma classe que é documentada separadamente são omitidos:
+    ficam registrados apenas na classe que os define.
+    """
     methods = []
     for name in dir(cls):
         if name.startswith('_'):
             continue
         try:
-            method = safe_extract(cls, name)
+            if mro_aware:
+                owner = find_defining_class(cls, name)
+                if owner is not None and owner is not cls and is_documented_separately(owner, module_name):
+                    continue
+            method = static_member(cls, name, resolve_lazy)
             if method is None:
                 continue
             if inspect.isfunction(method) or inspect.ismethod(method) or inspect.isbuiltin(method) or callable(method):
                 doc = getattr(method, "__doc__", "") or ""
-                signature = get_function_signature(method, module_name)
+                signature = _timed_signature(method, module_name)
                 parsed_doc = parse_docstring(doc, module_name)
+                EXTRACTION_STATS.parameters += len(parsed_doc.get("parameters", {}))
                 methods.append({
                     "name": name,
                     "signature": signature,
@@ -853,101 +1391,846 @@ def extract_methods(cls, module_name: str) -> List[Dict]:
             warnings.warn(f"Erro ao processar método {name} em {cls}: {str(e)}")
     return sorted(methods, key=lambda x: x["name"])
 
-def extract_classes(module, module_name: str) -> List[Dict]:
-    import inspect
-    classes = []
-    for name in dir(module):
-        if name.startswith('_'):
-            continue
+def iter_classes(module, module_name: str, mro_aware: bool = False, resolve_lazy: bool = True,
+                 aliases: Optional[List[Dict]] = None, public_policy: str = "dir",
+                 alias_modules: Optional[Collection[str]] = None):
+    """
+    Gera, uma a uma e em ordem de nome, as classes públicas do módulo com
+    seus métodos. Com mro_aware=True cada classe recebe também
+    "inherits_from", a lista de ancestrais cujos métodos estão documentados
+    neles mesmos. `aliases`, `public_policy` e `alias_modules` funcionam
+    como em iter_functions.
+    """
+    names, library_only = public_surface(module, public_policy)
+    for name in names:
+        class_data = None
+        start = time.perf_counter()
         try:
-            obj = safe_extract(module, name)
-            if obj is None:
+            obj = static_member(module, name, resolve_lazy)
+            if obj is None or (library_only and not is_library_member(obj, module_name)):
                 continue
-            if inspect.isclass(obj):
+            if inspect.isclass(obj) and not _alias_record(obj, name, "class", module_name, aliases,
+                                                          alias_modules, public_policy):
                 doc = getattr(obj, "__doc__", "") or ""
                 parsed_doc = parse_docstring(doc, module_name)
-                methods = extract_methods(obj, module_name)
-                classes.append({
+                methods = extract_methods(obj, module_name, mro_aware=mro_aware, resolve_lazy=resolve_lazy)
+                class_data = {
                     "name": name,
                     "documentation": parsed_doc,
                     "methods": methods
-                })
+                }
+                if mro_aware:
+                    class_data["inherits_from"] = inherited_class_references(obj, module_name)
         except Exception as e:
             warnings.warn(f"Erro ao processar classe {name} em {module_name}: {str(e)}")
-    return sorted(classes, key=lambda x: x["name"])
+        finally:
+            EXTRACTION_STATS.enumeration_seconds += time.perf_counter() - start
+        if class_data is not None:
+            EXTRACTION_STATS.classes += 1
+            EXTRACTION_STATS.methods += len(class_data["methods"])
+            EXTRACTION_STATS.parameters += len(class_data["documentation"].get("parameters", {}))
+            yield class_data
 
-def extract_module_api(module_name: str) -> Dict:
+def extract_classes(module, module_name: str, mro_aware: bool = False, resolve_lazy: bool = True,
+                    public_policy: str = "dir") -> List[Dict]:
     """
-    Retorna as informações de API de um módulo, 
-    tentando lidar com codegen e wrappers em C++.
+    Extrai as classes públicas do módulo (ver iter_classes).
     """
+    return list(iter_classes(module, module_name, mro_aware=mro_aware, resolve_lazy=resolve_lazy,
+                             public_policy=public_policy))
+
+def import_api_module(module_name: str):
+    """Importa um módulo para extração; devolve (módulo, None) ou (None, dicionário de erro)."""
     print(f"Extraindo API de {module_name}...")
+    start = time.perf_counter()
     try:
-        module = importlib.import_module(module_name)
+        return importlib.import_module(module_name), None
     except ImportError as e:
-        return {"error": f"Não foi possível importar {module_name}: {str(e)}"}
-    
+        return None, {"error": f"Não foi possível importar {module_name}: {str(e)}"}
+    finally:
+        EXTRACTION_STATS.import_seconds += time.perf_counter() - start
+
+def open_module_api(module_name: str, mro_aware: bool = False, sources: Optional[Dict[str, Optional[str]]] = None,
+                    resolve_lazy: bool = True, alias_reexports: bool = False, public_policy: str = "dir",
+                    alias_modules: Optional[Collection[str]] = None):
+    """
+    Ponto de partida comum dos extratores: (erro, descrição, funções,
+    classes, aliases), com funções e classes como geradores (iter_functions /
+    iter_classes). Com `sources` (módulo -> arquivo .py/.pyi) o módulo é
+    lido do código-fonte com ast, sem importá-lo (ver static_api).
+    resolve_lazy e public_policy são repassados a iter_functions /
+    iter_classes.
+
+    Com alias_reexports=True, aliases é a lista dos objetos reexportados,
+    preenchida à medida que os geradores são consumidos; senão é None.
+    `alias_modules` são os módulos extraídos na execução: só eles podem ser
+    donos de um alias (ver _alias_record). O modo estático só lê as
+    definições do próprio arquivo (como a política "module") e nunca tem
+    aliases.
+    """
+    aliases = [] if alias_reexports else None
+    if sources is not None:
+        from static_api import load_static_module
+        static_module, error = load_static_module(module_name, sources.get(module_name))
+        if error is not None:
+            return error, None, iter(()), iter(()), None
+        return (None, static_module.description(), static_module.iter_functions(),
+                static_module.iter_classes(mro_aware=mro_aware), aliases)
+    module, error = import_api_module(module_name)
+    if error is not None:
+        return error, None, iter(()), iter(()), None
     description = getattr(module, "__doc__", "") or "No description available"
-    functions = extract_functions(module, module_name)
-    classes = extract_classes(module, module_name)
-    return {
-        "description": description.strip(),
-        "functions": functions,
-        "classes": classes
+    return (None, description.strip(),
+            iter_functions(module, module_name, resolve_lazy=resolve_lazy, aliases=aliases,
+                           public_policy=public_policy, alias_modules=alias_modules),
+            iter_classes(module, module_name, mro_aware=mro_aware, resolve_lazy=resolve_lazy, aliases=aliases,
+                         public_policy=public_policy, alias_modules=alias_modules),
+            aliases)
+
+def extract_module_api(module_name: str, mro_aware: bool = False,
+                       sources: Optional[Dict[str, Optional[str]]] = None, resolve_lazy: bool = True,
+                       alias_reexports: bool = False, public_policy: str = "dir",
+                       alias_modules: Optional[Collection[str]] = None) -> Dict:
+    """
+    Retorna as informações de API de um módulo, 
+    tentando lidar com codegen e wrappers em C++.
+    Com mro_aware=True os métodos herdados ficam só na classe que os define.
+    Com `sources` a extração é estática (ver open_module_api).
+    Com alias_reexports=True as funções e classes reexportadas de outro
+    módulo da biblioteca ficam só em "aliases" (ver canonical_module e
+    alias_modules em open_module_api).
+    public_policy escolhe os membros públicos (ver public_surface).
+    """
+    error, description, functions, classes, aliases = open_module_api(
+        module_name, mro_aware, sources, resolve_lazy, alias_reexports, public_policy, alias_modules)
+    if error is not None:
+        return error
+    
+    module_data = {
+        "description": description,
+        "functions": list(functions),
+        "classes": list(classes)
     }
+    if aliases is not None:
+        module_data["aliases"] = aliases
+    return module_data
+
+def _write_json_records(f, records) -> None:
+    """
+    Grava uma lista JSON (valor de uma chave de primeiro nível) registro a
+    registro, no mesmo formato de json.dump(indent=2).
+    """
+    first = True
+    for record in records:
+        f.write("[\n    " if first else ",\n    ")
+        # json.dumps escapa quebras de linha dentro de strings, então as
+        # únicas quebras são as da indentação
+        f.write(json.dumps(record, indent=2, ensure_ascii=False).replace("\n", "\n    "))
+        first = False
+    f.write("[]" if first else "\n  ]")
+
+def write_module_api(module_name: str, path: str, mro_aware: bool = False,
+                     sources: Optional[Dict[str, Optional[str]]] = None, resolve_lazy: bool = True,
+                     alias_reexports: bool = False, public_policy: str = "dir",
+                     alias_modules: Optional[Collection[str]] = None) -> Tuple[Optional[Dict], Optional[List[Dict]]]:
+    """
+    Extrai a API de um módulo gravando cada função e classe em `path` assim
+    que é extraída, sem montar o dicionário do módulo inteiro. O arquivo é
+    idêntico, byte a byte, ao json.dump(extract_module_api(...), indent=2,
+    ensure_ascii=False). A escrita vai para um arquivo temporário que só
+    substitui `path` no final, então uma falha não deixa JSON incompleto.
+    Devolve (erro, aliases): o dicionário de erro gravado quando o módulo
+    não pôde ser importado (ou None) e os aliases gravados (None sem
+    alias_reexports).
+    """
+    error, description, functions, classes, aliases = open_module_api(
+        module_name, mro_aware, sources, resolve_lazy, alias_reexports, public_policy, alias_modules)
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            if error is not None:
+                json.dump(error, f, indent=2, ensure_ascii=False)
+            else:
+                f.write('{\n  "description": ')
+                f.write(json.dumps(description, ensure_ascii=False))
+                f.write(',\n  "functions": ')
+                _write_json_records(f, functions)
+                f.write(',\n  "classes": ')
+                _write_json_records(f, classes)
+                if aliases is not None:
+                    f.write(',\n  "aliases": ')
+                    _write_json_records(f, aliases)
+                f.write('\n}')
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return error, aliases
+
+def module_output_filename(module_name: str, library_name: str, extension: str = ".json") -> str:
+    """
+    Nome do arquivo JSON de um módulo dentro de output/<library_name>.
+    O módulo raiz vira <library>.json e os submódulos usam o caminho
+    relativo com pontos (ex.: torch.nn.functional -> nn.functional.json),
+    o que mantém o nome antigo para submódulos de primeiro nível.
+    """
+    if module_name == library_name:
+        return f"{library_name}{extension}"
+    return f"{module_name[len(library_name) + 1:]}{extension}"
 
-def build_module_structure(library_name: str) -> Dict[str, Dict]:
+def iter_submodule_names(package_name: str, package_path) -> List[str]:
+    """
+    Percorre recursivamente os submódulos públicos de um pacote a partir
+    do sistema de arquivos, sem importar os subpacotes no processo atual.
+    """
     import pkgutil
-    
+
+    names = []
+    for module_info in pkgutil.iter_modules(package_path):
+        if module_info.name.startswith('_'):
+            continue
+        full_name = f"{package_name}.{module_info.name}"
+        names.append(full_name)
+        finder_path = getattr(module_info.module_finder, "path", None)
+        if module_info.ispkg and finder_path:
+            sub_path = [os.path.join(finder_path, module_info.name)]
+            names.extend(iter_submodule_names(full_name, sub_path))
+    return sorted(names)
+
+# Extensão do arquivo de cada formato de saída
+OUTPUT_EXTENSIONS = {"json": ".json", "jsonl": ".jsonl"}
+
+def _record_documentation(documentation: Dict) -> Dict:
+    """Documentação de um registro JSON Lines: os parâmetros viram registros próprios."""
+    return {key: value for key, value in documentation.items() if key != "parameters"}
+
+def _parameter_records(module_name: str, class_name: Optional[str], function_name: Optional[str],
+                       documentation: Dict):
+    for param_name, info in documentation.get("parameters", {}).items():
+        yield {"kind": "parameter", "namespace": module_name, "class": class_name,
+               "function": function_name, "name": param_name, "info": info}
+
+def _callable_records(kind: str, module_name: str, class_name: Optional[str], function_data: Dict):
+    documentation = function_data.get("documentation", {})
+    record = {"kind": kind, "namespace": module_name}
+    if class_name is not None:
+        record["class"] = class_name
+    record.update(name=function_data["name"], signature=function_data.get("signature"),
+                  documentation=_record_documentation(documentation))
+    yield record
+    yield from _parameter_records(module_name, class_name, function_data["name"], documentation)
+
+def _class_records(module_name: str, class_data: Dict):
+    documentation = class_data["documentation"]
+    record = {"kind": "class", "namespace": module_name, "name": class_data["name"],
+              "documentation": _record_documentation(documentation)}
+    if "inherits_from" in class_data:
+        record["inherits_from"] = class_data["inherits_from"]
+    yield record
+    yield from _parameter_records(module_name, class_data["name"], None, documentation)
+    for method_data in class_data["methods"]:
+        yield from _callable_records("method", module_name, class_data["name"], method_data)
+
+def _alias_records(module_name: str, aliases: Optional[List[Dict]]):
+    for alias in aliases or ():
+        yield {"kind": "alias", "namespace": module_name, **alias}
+
+def iter_module_records(module_name: str, mro_aware: bool = False,
+                        sources: Optional[Dict[str, Optional[str]]] = None, resolve_lazy: bool = True,
+                        alias_reexports: bool = False, public_policy: str = "dir",
+                        alias_modules: Optional[Collection[str]] = None):
+    """
+    Gera a API de um módulo no formato JSON Lines: um registro plano por
+    namespace, função, classe, método ou parâmetro, marcado com "kind" e com
+    as chaves do pai ("namespace", "class", "function"). Cada classe vem
+    antes dos seus parâmetros e métodos, e cada função/método antes dos seus
+    parâmetros, então um leitor pode inserir tudo enquanto lê. Os aliases
+    (alias_reexports=True) vêm por último, com kind "alias".
+    """
+    error, description, functions, classes, aliases = open_module_api(
+        module_name, mro_aware, sources, resolve_lazy, alias_reexports, public_policy, alias_modules)
+    if error is not None:
+        yield {"kind": "namespace", "namespace": module_name, **error}
+        return
+    yield {"kind": "namespace", "namespace": module_name, "description": description}
+    for function_data in functions:
+        yield from _callable_records("function", module_name, None, function_data)
+    for class_data in classes:
+        yield from _class_records(module_name, class_data)
+    yield from _alias_records(module_name, aliases)
+
+def records_from_module_data(module_name: str, data: Dict):
+    """
+    Registros JSON Lines (os mesmos de iter_module_records) de um módulo já
+    extraído no formato de extract_module_api.
+    """
+    if "error" in data:
+        yield {"kind": "namespace", "namespace": module_name, "error": data["error"]}
+        return
+    yield {"kind": "namespace", "namespace": module_name, "description": data.get("description", "")}
+    for function_data in data.get("functions", []):
+        yield from _callable_records("function", module_name, None, function_data)
+    for class_data in data.get("classes", []):
+        yield from _class_records(module_name, class_data)
+    yield from _alias_records(module_name, data.get("aliases"))
+
+def write_module_records(module_name: str, path: str, mro_aware: bool = False,
+                         sources: Optional[Dict[str, Optional[str]]] = None, resolve_lazy: bool = True,
+                         alias_reexports: bool = False, public_policy: str = "dir",
+                         alias_modules: Optional[Collection[str]] = None) -> Tuple[Optional[Dict], Optional[List[Dict]]]:
+    """
+    Grava a API de um módulo em JSON Lines (ver iter_module_records), uma
+    linha por registro assim que ele é extraído. Como write_module_api, usa
+    um arquivo temporário que só substitui `path` no final. Devolve
+    (erro, aliases) como ele: o erro do registro "namespace" (ou None) e
+    os registros de alias gravados (None sem alias_reexports).
+    """
+    error = None
+    aliases = [] if alias_reexports else None
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            for record in iter_module_records(module_name, mro_aware=mro_aware, sources=sources,
+                                              resolve_lazy=resolve_lazy, alias_reexports=alias_reexports,
+                                              public_policy=public_policy, alias_modules=alias_modules):
+                f.write(json.dumps(record, ensure_ascii=False))
+                f.write("\n")
+                if record["kind"] == "alias":
+                    aliases.append(record)
+                elif record["kind"] == "namespace" and "error" in record:
+                    error = {"error": record["error"]}
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return error, aliases
+
+def _remove_other_formats(output_dir: str, module_name: str, library_name: str, output_format: str) -> None:
+    """Apaga o arquivo do módulo em outro formato, para os loaders não lerem uma versão antiga."""
+    for other_format, extension in OUTPUT_EXTENSIONS.items():
+        if other_format == output_format:
+            continue
+        stale_path = os.path.join(output_dir, module_output_filename(module_name, library_name, extension))
+        if os.path.exists(stale_path):
+            os.remove(stale_path)
+
+def alias_owners(aliases: Optional[List[Dict]]) -> List[str]:
+    """Módulos donos (ver canonical_module) dos registros de alias, em ordem."""
+    return sorted({alias["alias_of"].rsplit(".", 1)[0] for alias in aliases or ()})
+
+def _extract_submodule(module_name: str, mro_aware: bool = False,
+                       raise_errors: bool = False, sources: Optional[Dict[str, Optional[str]]] = None,
+                       resolve_lazy: bool = True, alias_reexports: bool = False,
+                       public_policy: str = "dir", alias_modules: Optional[Collection[str]] = None,
+                       library_name: Optional[str] = None) -> Tuple[str, Optional[Dict], Tuple[int, int], Dict]:
+    """
+    Executa extract_module_api isolando exceções (usado pelos workers).
+    Devolve também os acertos/falhas do cache de docstrings gerados por
+    este módulo, para que o processo principal possa somá-los, e as
+    estatísticas do módulo (EXTRACTION_STATS) para o manifesto.
+    Com alias_reexports=True as estatísticas levam ainda "alias_owners"
+    (ver alias_owners), que o processo principal retira antes do manifesto.
+    Com raise_errors=True as exceções são propagadas (no processo
+    supervisionado, que as registra como falha do módulo). As do módulo
+    raiz (`library_name`) sempre são, assim como a falha ao importá-lo:
+    sem ele a execução não tem resultado.
+    """
+    hits, misses = DOCSTRING_CACHE.hits, DOCSTRING_CACHE.misses
+    stats = EXTRACTION_STATS.snapshot()
+    try:
+        module_data = extract_module_api(module_name, mro_aware=mro_aware, sources=sources,
+                                         resolve_lazy=resolve_lazy, alias_reexports=alias_reexports,
+                                         public_policy=public_policy, alias_modules=alias_modules)
+        if module_name == library_name and "error" in module_data:
+            raise ImportError(module_data["error"])
+    except Exception as e:
+        if raise_errors or module_name == library_name:
+            raise
+        print(f"Erro ao processar submódulo {module_name}: {str(e)}")
+        module_data = None
+    cache_delta = (DOCSTRING_CACHE.hits - hits, DOCSTRING_CACHE.misses - misses)
+    module_stats = EXTRACTION_STATS.since(stats)
+    if alias_reexports and module_data is not None:
+        module_stats["alias_owners"] = alias_owners(module_data.get("aliases"))
+    return module_name, module_data, cache_delta, module_stats
+
+def _stream_submodule(module_name: str, output_dir: str, library_name: str,
+                      mro_aware: bool = False, output_format: str = "json",
+                      raise_errors: bool = False,
+                      sources: Optional[Dict[str, Optional[str]]] = None,
+                      resolve_lazy: bool = True, alias_reexports: bool = False,
+                      public_policy: str = "dir",
+                      alias_modules: Optional[Collection[str]] = None) -> Tuple[str, Optional[str], Tuple[int, int], Dict]:
+    """
+    Como _extract_submodule, mas grava o arquivo do módulo em streaming no
+    próprio worker (write_module_api, ou write_module_records no formato
+    "jsonl") e devolve só o nome do arquivo, em vez dos dados, ao processo
+    principal. As falhas do módulo raiz (library_name) também são propagadas.
+    """
+    hits, misses = DOCSTRING_CACHE.hits, DOCSTRING_CACHE.misses
+    stats = EXTRACTION_STATS.snapshot()
+    filename = module_output_filename(module_name, library_name, OUTPUT_EXTENSIONS[output_format])
+    writer = write_module_records if output_format == "jsonl" else write_module_api
+    aliases = None
+    try:
+        path = os.path.join(output_dir, filename)
+        error, aliases = writer(module_name, path, mro_aware=mro_aware, sources=sources,
+                                resolve_lazy=resolve_lazy, alias_reexports=alias_reexports,
+                                public_policy=public_policy, alias_modules=alias_modules)
+        if module_name == library_name and error is not None:
+            raise ImportError(error["error"])
+        _remove_other_formats(output_dir, module_name, library_name, output_format)
+        output_bytes = os.path.getsize(path)
+    except Exception as e:
+        if raise_errors or module_name == library_name:
+            raise
+        print(f"Erro ao processar submódulo {module_name}: {str(e)}")
+        filename = None
+        output_bytes = 0
+    cache_delta = (DOCSTRING_CACHE.hits - hits, DOCSTRING_CACHE.misses - misses)
+    module_stats = dict(EXTRACTION_STATS.since(stats), output_bytes=output_bytes)
+    if alias_reexports and filename is not None:
+        module_stats["alias_owners"] = alias_owners(aliases)
+    return module_name, filename, cache_delta, module_stats
+
+def _apply_memory_budget(memory_mb: int) -> None:
+    """Limita o espaço de endereçamento do processo atual a `memory_mb` MB (RLIMIT_AS)."""
+    try:
+        import resource
+    except ImportError:
+        logger.warning("Limite de memória por módulo não suportado nesta plataforma")
+        return
+    limit = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+def _supervised_child(conn, task, module_name: str, memory_mb: Optional[int], settings: Dict) -> None:
+    """
+    Corpo do processo filho: aplica o limite de memória e a configuração do
+    processo principal (`settings`, ver worker_settings), executa a tarefa
+    e envia ("ok", resultado) ou ("failed", motivo) pelo pipe.
+    """
+    if memory_mb is not None:
+        _apply_memory_budget(memory_mb)
+    try:
+        configure_worker(**settings)
+        message = ("ok", task(module_name))
+    except MemoryError:
+        message = ("failed", f"excedeu o limite de memória de {memory_mb} MB")
+    except BaseException as e:
+        message = ("failed", f"{type(e).__name__}: {e}")
+    conn.send(message)
+    conn.close()
+
+def _exit_reason(exitcode: Optional[int]) -> str:
+    """Descrição do término de um filho que não enviou resultado (ex.: segfault)."""
+    if exitcode is not None and exitcode < 0:
+        import signal
+        try:
+            return f"encerrado pelo sinal {signal.Signals(-exitcode).name}"
+        except ValueError:
+            return f"encerrado pelo sinal {-exitcode}"
+    return f"terminou sem resultado (código de saída {exitcode})"
+
+def _stop_process(process) -> None:
+    process.terminate()
+    process.join(1)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+def _supervise_submodules(task, module_names: List[str], workers: int, failures: Dict[str, str],
+                          timeout: Optional[float] = None, memory_mb: Optional[int] = None):
+    """
+    Executa `task` para cada módulo num processo filho próprio, com até
+    `workers` filhos ao mesmo tempo, e gera os resultados na ordem de
+    module_names. Um filho que passa de `timeout` segundos é encerrado, e
+    cada filho tem o espaço de endereçamento limitado a `memory_mb` MB.
+    Um import que trava, estoura a memória ou derruba o interpretador
+    (segfault) custa no máximo o seu limite: o módulo entra em `failures`
+    (nome -> motivo) e é gerado como (nome, None, (0, 0), {}). Os filhos
+    recebem a configuração deste processo (worker_settings) como argumento.
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    context = multiprocessing.get_context()
+    settings = worker_settings()
+    queue = list(reversed(module_names))
+    running = {}
+    finished = {}
+    try:
+        for module_name in module_names:
+            while module_name not in finished:
+                while queue and len(running) < workers:
+                    name = queue.pop()
+                    receiver, sender = context.Pipe(duplex=False)
+                    process = context.Process(target=_supervised_child, args=(sender, task, name, memory_mb, settings))
+                    process.start()
+                    sender.close()
+                    deadline = time.monotonic() + timeout if timeout is not None else None
+                    running[name] = (process, receiver, deadline)
+
+                deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+                wait_time = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                ready = wait([receiver for _, receiver, _ in running.values()], timeout=wait_time)
+                now = time.monotonic()
+                for name, (process, receiver, deadline) in list(running.items()):
+                    if receiver in ready:
+                        try:
+                            status, payload = receiver.recv()
+                        except EOFError:
+                            process.join()
+                            status, payload = "failed", _exit_reason(process.exitcode)
+                    elif deadline is not None and now >= deadline:
+                        _stop_process(process)
+                        status, payload = "failed", f"excedeu o tempo limite de {timeout:g}s"
+                    else:
+                        continue
+                    receiver.close()
+                    process.join()
+                    del running[name]
+                    if status != "ok":
+                        print(f"Erro ao processar submódulo {name}: {payload}")
+                        failures[name] = payload
+                        payload = (name, None, (0, 0), {})
+                    finished[name] = payload
+            yield finished.pop(module_name)
+    finally:
+        for process, receiver, _ in running.values():
+            _stop_process(process)
+            receiver.close()
+
+# Manifesto da execução, ao lado do index.json. O "_" evita colisão com o
+# arquivo de um submódulo (submódulos privados não são extraídos).
+MANIFEST_FILENAME = "_manifest.json"
+
+def peak_rss_kb() -> Dict[str, Optional[int]]:
+    """
+    Pico de memória residente, em KB, do processo atual e do maior dos
+    filhos já encerrados (workers e processos supervisionados). None onde
+    o módulo resource não existe.
+    """
+    try:
+        import resource
+    except ImportError:
+        return {"self": None, "children": None}
+    # ru_maxrss vem em bytes no macOS e em KB no Linux
+    divisor = 1024 if sys.platform == "darwin" else 1
+    return {
+        "self": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // divisor,
+        "children": resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss // divisor,
+    }
+
+def _round_stats(stats: Dict[str, float]) -> Dict[str, float]:
+    return {key: round(value, 6) if isinstance(value, float) else value for key, value in stats.items()}
+
+def build_run_manifest(library_name: str, library_version: Optional[str], module_stats: Dict[str, Dict],
+                       failures: Dict[str, str], total_seconds: float, cache_hits: int, cache_misses: int,
+                       options: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Manifesto de uma execução de build_module_structure: por submódulo, os
+    tempos de import, enumeração de membros, parse de docstrings e
+    assinaturas, as contagens de entidades e os bytes gravados; mais os
+    totais, o pico de RSS e as opções usadas.
+    """
+    totals = {}
+    for stats in module_stats.values():
+        for key, value in stats.items():
+            totals[key] = totals.get(key, 0) + value
+    return {
+        "library": library_name,
+        "library_version": library_version,
+        "python": sys.version.split()[0],
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "options": options,
+        "total_seconds": round(total_seconds, 6),
+        "peak_rss_kb": peak_rss_kb(),
+        "docstring_cache": {"hits": cache_hits, "misses": cache_misses},
+        "totals": _round_stats(totals),
+        "modules": {name: _round_stats(stats) for name, stats in module_stats.items()},
+        "failed": failures,
+    }
+
+def _installed_version(library_name: str) -> Optional[str]:
+    """Versão da distribuição instalada (sem importar a biblioteca), se houver."""
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        return None
+    try:
+        return version(library_name)
+    except PackageNotFoundError:
+        return None
+
+def build_module_structure(library_name: str, workers: Optional[int] = None,
+                           doc_cache_size: Optional[int] = None,
+                           mro_aware: bool = False, write_json: bool = True,
+                           output_root: str = "output", stream: bool = False,
+                           output_format: str = "json", isolate: bool = False,
+                           module_timeout: Optional[float] = None,
+                           module_memory_mb: Optional[int] = None,
+                           stub_paths: Optional[List[str]] = None, static: bool = False,
+                           resolve_lazy: bool = True, alias_reexports: bool = False,
+                           public_policy: str = "dir") -> Dict[str, Any]:
+    """
+    Extrai a API da biblioteca e de todos os seus submódulos (recursivamente),
+    gravando um JSON por módulo e o index.json em <output_root>/<library_name>.
+    Com write_json=False nada é gravado: os dados ficam só no dicionário
+    devolvido (usado pelo pipeline.py, que carrega o banco em memória).
+
+    Com stream=True cada worker grava o JSON do seu módulo registro a
+    registro (write_module_api) e nada fica em memória: o dicionário
+    devolvido mapeia cada módulo para o nome do seu arquivo. O pico de
+    memória passa a ser o de um módulo, não o da biblioteca inteira.
+
+    output_format="jsonl" grava cada módulo em JSON Lines
+    (<modulo>.jsonl, ver iter_module_records), sempre em streaming; o
+    index.json continua igual. Os loaders aceitam os dois formatos.
+
+    Os submódulos são extraídos em um pool de processos com `workers`
+    processos (padrão: os.cpu_count()); com workers=1 tudo roda no processo
+    atual. Os resultados são coletados sempre na mesma ordem (módulo raiz
+    seguido dos submódulos em ordem alfabética).
+
+    `doc_cache_size` limita o número de entradas do cache de docstrings
+    (0 desativa o cache); as estatísticas do cache são exibidas no final.
+
+    Com mro_aware=True cada método herdado é gravado apenas na classe que o
+    define e as subclasses recebem "inherits_from" (ver extract_classes).
+
+    Com stub_paths (mesmo vazio) as funções sem assinatura introspectável
+    consultam os stubs .pyi instalados e os diretórios de stub_paths (ver
+    configure_stub_signatures) antes da docstring.
+
+    Com static=True nada da biblioteca é importado: os módulos são
+    descobertos no sistema de arquivos e lidos do código-fonte com ast (ver
+    static_api), no mesmo formato de saída e com o mesmo paralelismo.
+
+    Os membros de módulos e classes são lidos sem executar propriedades (ver
+    static_member); os nomes que só existem pelo __getattr__ de módulos
+    preguiçosos são resolvidos como o getattr faria. Com resolve_lazy=False
+    esses nomes são ignorados, para que cada execução só importe os módulos
+    que extrai, e contados em "lazy_skipped" no manifesto.
+
+    Com alias_reexports=True cada função ou classe é extraída uma vez só, no
+    módulo em que é documentada (ver canonical_module); os outros módulos
+    que a reexportam recebem apenas um registro em "aliases", que os loaders
+    gravam como uma referência (tabela Aliases) à entidade do dono. Se o
+    dono não for extraído (falhou, estourou o limite ou ficou de fora) ou
+    não gravar o nome com a mesma public_policy, o registro completo fica
+    no próprio módulo.
+
+    public_policy escolhe quais nomes de cada módulo são extraídos (ver
+    public_surface): "dir" (padrão) mantém tudo o que o dir() mostra,
+    "module" descarta o que foi importado de fora da biblioteca e "all"
+    segue o __all__ quando o módulo tem um.
+
+    Junto do index.json é gravado o manifesto da execução (_manifest.json,
+    ver build_run_manifest) com os tempos e tamanhos de cada submódulo.
+
+    Com isolate=True, ou quando `module_timeout` (segundos) ou
+    `module_memory_mb` é dado, cada submódulo é importado e extraído num
+    processo filho supervisionado com esses limites, em vez do pool (ver
+    _supervise_submodules). Os módulos que travam, estouram o limite ou
+    derrubam o filho ficam de fora do resultado e são listados em "failed"
+    (módulo -> motivo) no index.json.
+
+    O módulo raiz é obrigatório: se ele não puder ser importado o retorno é
+    {"error": motivo}, e se a sua extração falhar a exceção é propagada
+    (RuntimeError com o motivo, no modo supervisionado), sem gravar o
+    index.json.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    from functools import partial
+
     result = {}
+    run_start = time.perf_counter()
     print(f"Processando biblioteca: {library_name}")
     
+    sources = None
     try:
-        main_module = importlib.import_module(library_name)
+        if static:
+            from static_api import find_module_sources
+            module_names, sources = find_module_sources(library_name)
+            version = _installed_version(library_name)
+        else:
+            main_module = importlib.import_module(library_name)
+            version = getattr(main_module, "__version__", None)
     except ImportError as e:
         return {"error": f"Não foi possível importar {library_name}: {str(e)}"}
     
-    output_dir = os.path.join("output", library_name)
-    os.makedirs(output_dir, exist_ok=True)
-    
-    main_structure = extract_module_api(library_name)
-    result[library_name] = main_structure
-    with open(os.path.join(output_dir, f"{library_name}.json"), "w", encoding='utf-8') as f:
-        json.dump(main_structure, f, indent=2, ensure_ascii=False)
+    output_dir = os.path.join(output_root, library_name)
+    if write_json:
+        os.makedirs(output_dir, exist_ok=True)
     
     # Descobre submódulos
-    if hasattr(main_module, '__path__'):
-        package_path = main_module.__path__
-        for _, name, is_pkg in pkgutil.iter_modules(package_path):
-            if name.startswith('_'):
-                continue
-            submodule_name = f"{library_name}.{name}"
-            try:
-                submodule_data = extract_module_api(submodule_name)
-                result[submodule_name] = submodule_data
-                with open(os.path.join(output_dir, f"{name}.json"), "w", encoding='utf-8') as f:
-                    json.dump(submodule_data, f, indent=2, ensure_ascii=False)
-            except Exception as e:
-                print(f"Erro ao processar submódulo {submodule_name}: {str(e)}")
+    if not static:
+        module_names = [library_name]
+        if hasattr(main_module, '__path__'):
+            module_names.extend(iter_submodule_names(library_name, main_module.__path__))
+
+    if doc_cache_size is not None:
+        DOCSTRING_CACHE.maxsize = doc_cache_size
+    if stub_paths is not None:
+        configure_stub_signatures(stub_paths)
+
+    if output_format not in OUTPUT_EXTENSIONS:
+        raise ValueError(f"Formato de saída desconhecido: {output_format}")
+    if public_policy not in PUBLIC_POLICIES:
+        raise ValueError(f"Política de superfície pública desconhecida: {public_policy}")
+    if output_format == "jsonl":
+        stream = True
+    supervised = isolate or module_timeout is not None or module_memory_mb is not None
+    if stream and write_json:
+        extract_task = partial(_stream_submodule, output_dir=output_dir, library_name=library_name,
+                               mro_aware=mro_aware, output_format=output_format, raise_errors=supervised,
+                               sources=sources, resolve_lazy=resolve_lazy, alias_reexports=alias_reexports,
+                               public_policy=public_policy)
+    else:
+        stream = False
+        extract_task = partial(_extract_submodule, mro_aware=mro_aware, raise_errors=supervised, sources=sources,
+                               resolve_lazy=resolve_lazy, alias_reexports=alias_reexports,
+                               public_policy=public_policy, library_name=library_name)
+    workers = workers or os.cpu_count() or 1
+    failures = {}
+    cache_hits = cache_misses = 0
+    module_stats = {}
+    owners_by_module = {}
+    pending = module_names
+    alias_modules = frozenset(module_names) if alias_reexports else None
+    while pending:
+        task = partial(extract_task, alias_modules=alias_modules)
+        if supervised:
+            extracted = _supervise_submodules(task, pending, workers, failures,
+                                              timeout=module_timeout, memory_mb=module_memory_mb)
+            executor = None
+        elif workers == 1 or len(pending) == 1:
+            extracted = map(task, pending)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(pending)),
+                                           initializer=partial(configure_worker, **worker_settings()))
+            extracted = executor.map(task, pending)
+
+        try:
+            # executor.map devolve na ordem de submissão, então a saída é determinística
+            for module_name, module_data, (hits, misses), stats in extracted:
+                cache_hits += hits
+                cache_misses += misses
+                owners_by_module.pop(module_name, None)
+                if module_data is None:
+                    result.pop(module_name, None)
+                    module_stats.pop(module_name, None)
+                    continue
+                owners = stats.pop("alias_owners", None)
+                if owners:
+                    owners_by_module[module_name] = owners
+                result[module_name] = module_data
+                module_stats[module_name] = stats
+                if stream or not write_json:
+                    continue
+                path = os.path.join(output_dir, module_output_filename(module_name, library_name))
+                with open(path, "w", encoding='utf-8') as f:
+                    json.dump(module_data, f, indent=2, ensure_ascii=False)
+                _remove_other_formats(output_dir, module_name, library_name, "json")
+                stats["output_bytes"] = os.path.getsize(path)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        # Um alias cujo dono falhou não teria para onde apontar: os módulos
+        # que têm um são extraídos de novo sem esse dono, com o registro completo
+        alias_modules = frozenset(result)
+        pending = [name for name, owners in owners_by_module.items() if not alias_modules.issuperset(owners)]
+
+    if library_name not in result:
+        # Fora do modo supervisionado a exceção do módulo raiz já foi propagada
+        raise RuntimeError(f"Não foi possível extrair o módulo raiz {library_name}: {failures.get(library_name)}")
+
+    total = cache_hits + cache_misses
+    hit_rate = cache_hits / total if total else 0.0
+    print(f"Cache de docstrings: {cache_hits} acertos, {cache_misses} falhas ({hit_rate:.1%} de acerto)")
     
     # Gera índice global
     index = {
         "library": library_name,
         "modules": list(result.keys())
     }
+    if failures:
+        print(f"{len(failures)} submódulos falharam: " + ", ".join(sorted(failures)))
+        index["failed"] = failures
+    if not write_json:
+        return result
     with open(os.path.join(output_dir, "index.json"), "w", encoding='utf-8') as f:
         json.dump(index, f, indent=2, ensure_ascii=False)
 
+    options = {"workers": workers, "output_format": output_format, "stream": stream, "mro_aware": mro_aware,
+               "supervised": supervised, "module_timeout": module_timeout, "module_memory_mb": module_memory_mb,
+               "stub_paths": stub_paths, "static": static, "resolve_lazy": resolve_lazy,
+               "alias_reexports": alias_reexports, "public_policy": public_policy}
+    manifest = build_run_manifest(library_name, None if version is None else str(version), module_stats, failures,
+                                  time.perf_counter() - run_start, cache_hits, cache_misses, options)
+    with open(os.path.join(output_dir, MANIFEST_FILENAME), "w", encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    print(f"Manifesto da execução gravado em {os.path.join(output_dir, MANIFEST_FILENAME)}")
+
     return result
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print("Uso: python pop_general.py <library_name>")
-        sys.exit(1)
-    library_name = sys.argv[1]
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Gera a documentação JSON de uma biblioteca Python.")
+    parser.add_argument("library_name", help="Nome da biblioteca a documentar")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Número de processos para extrair submódulos (padrão: número de CPUs)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Exibe as mensagens de depuração dos parsers em stderr")
+    parser.add_argument("--mro-methods", action="store_true",
+                        help="Grava cada método herdado só na classe que o define (subclasses recebem inherits_from)")
+    parser.add_argument("--format", choices=sorted(OUTPUT_EXTENSIONS), default="json",
+                        help="Formato dos arquivos por módulo: json (padrão) ou jsonl (um registro por linha)")
+    parser.add_argument("--doc-cache-size", type=int, default=None,
+                        help="Máximo de docstrings parseadas mantidas em cache (0 desativa)")
+    parser.add_argument("--stubs", action="store_true",
+                        help="Usa stubs .pyi instalados para assinaturas de funções compiladas")
+    parser.add_argument("--stub-path", action="append", default=None,
+                        help="Diretório extra de stubs, ex.: um checkout do typeshed (pode repetir; implica --stubs)")
+    parser.add_argument("--static", action="store_true",
+                        help="Lê o código-fonte com ast em vez de importar a biblioteca (não executa nada dela)")
+    parser.add_argument("--skip-lazy", dest="resolve_lazy", action="store_false",
+                        help="Ignora os nomes que só existem pelo __getattr__ de módulos preguiçosos, "
+                             "em vez de importar o que eles carregam")
+    parser.add_argument("--alias-reexports", action="store_true",
+                        help="Extrai cada função/classe só no módulo que a define; os que a reexportam recebem um alias")
+    parser.add_argument("--public", choices=PUBLIC_POLICIES, default="dir",
+                        help="Membros públicos: dir (tudo do dir(), padrão), module (só os definidos na biblioteca) "
+                             "ou all (o __all__ quando existe, senão module)")
+    parser.add_argument("--isolate", action="store_true",
+                        help="Extrai cada submódulo num processo filho supervisionado (um crash não derruba a execução)")
+    parser.add_argument("--module-timeout", type=float, default=None,
+                        help="Tempo máximo em segundos por submódulo (implica --isolate)")
+    parser.add_argument("--module-memory-mb", type=int, default=None,
+                        help="Memória máxima em MB por submódulo (implica --isolate)")
+    args = parser.parse_args()
+    configure_logging(args.verbose)
+    library_name = args.library_name
     try:
-        structure = build_module_structure(library_name)
+        # A linha de comando só grava os arquivos: extrai em streaming
+        structure = build_module_structure(library_name, workers=args.workers,
+                                           doc_cache_size=args.doc_cache_size,
+                                           mro_aware=args.mro_methods, stream=True,
+                                           output_format=args.format, isolate=args.isolate,
+                                           module_timeout=args.module_timeout,
+                                           module_memory_mb=args.module_memory_mb,
+                                           stub_paths=args.stub_path or ([] if args.stubs else None),
+                                           static=args.static, resolve_lazy=args.resolve_lazy,
+                                           alias_reexports=args.alias_reexports, public_policy=args.public)
+        if "error" in structure:
+            print(f"Erro ao gerar documentação para {library_name}: {structure['error']}")
+            sys.exit(1)
         print(f"Documentação gerada com sucesso para {library_name}!")
     except Exception as e:
         print(f"Erro ao gerar documentação para {library_name}: {str(e)}")
-        sys.exit(1)
\ No newline at end of file
+        sys.exit(1)
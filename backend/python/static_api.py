@@ -0,0 +1,200 @@
+"""
+Extração estática da API de um pacote, sem importá-lo.
+
+Em vez de importlib.import_module, cada módulo tem o código-fonte (.py, ou
+o stub .pyi quando só há uma extensão compilada) lido com ast: as
+funções, classes e métodos definidos nele, com assinaturas montadas a
+partir da AST e docstrings passadas pelo mesmo parse_docstring do modo
+normal. O resultado segue o mesmo formato de extract_module_api.
+
+Diferenças em relação à extração com import:
+  - só entram os objetos definidos no próprio arquivo (nomes importados e
+    reexportados, que o dir() do módulo mostraria, ficam de fora);
+  - métodos herdados só são resolvidos para classes base do mesmo módulo;
+  - anotações e defaults aparecem como estão no código, sem avaliação.
+
+Usado por pop_general.build_module_structure(static=True) / --static.
+"""
+import ast
+import importlib.util
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import pop_general
+from stub_signatures import collect_definitions, decorator_names, resolve_relative_import, stub_signature
+
+# Decoradores que transformam o método em atributo (não é um callable no dir() da classe)
+_PROPERTY_DECORATORS = {"property", "cached_property", "setter", "getter", "deleter"}
+
+
+def module_source_path(module_name: str, package_root: str, library_name: str) -> Optional[str]:
+    """
+    Arquivo de código-fonte de `module_name` dentro do pacote em
+    `package_root`: <mod>.py ou <mod>/__init__.py e, sem eles, o stub .pyi.
+    """
+    parts = module_name.split(".")[1:] if module_name != library_name else []
+    base = os.path.join(package_root, *parts)
+    for candidate in (os.path.join(base, "__init__.py"), base + ".py",
+                      os.path.join(base, "__init__.pyi"), base + ".pyi"):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def find_module_sources(library_name: str) -> Tuple[List[str], Dict[str, Optional[str]]]:
+    """
+    Módulos de uma biblioteca (a raiz seguida dos submódulos públicos, na
+    mesma ordem do modo normal) e o arquivo de cada um, sem executar o
+    pacote. Levanta ImportError se a biblioteca não for encontrada.
+    """
+    spec = importlib.util.find_spec(library_name)
+    if spec is None:
+        raise ImportError(f"No module named '{library_name}'")
+    if not spec.submodule_search_locations:
+        origin = spec.origin if spec.origin and spec.origin.endswith((".py", ".pyi")) else None
+        return [library_name], {library_name: origin}
+    package_roots = list(spec.submodule_search_locations)
+    module_names = [library_name] + pop_general.iter_submodule_names(library_name, package_roots)
+    sources = {}
+    for module_name in module_names:
+        sources[module_name] = next(
+            (path for path in (module_source_path(module_name, root, library_name) for root in package_roots)
+             if path is not None), None)
+    return module_names, sources
+
+
+def _signature(node, in_class: bool = False) -> str:
+    start = time.perf_counter()
+    signature = f"{node.name}{stub_signature(node, in_class)}"
+    pop_general.EXTRACTION_STATS.signature_seconds += time.perf_counter() - start
+    return signature
+
+
+def _docstring(node) -> str:
+    return ast.get_docstring(node, clean=False) or ""
+
+
+def _is_method(node) -> bool:
+    if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return False
+    return not _PROPERTY_DECORATORS.intersection(decorator_names(node))
+
+
+def _imported_names(tree, module_name: str, is_package: bool) -> Dict[str, str]:
+    """Nome local -> referência qualificada dos "from X import Y" do módulo."""
+    names = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        source = resolve_relative_import(module_name, is_package, node.level, node.module)
+        if source is None:
+            continue
+        for alias in node.names:
+            if alias.name != "*":
+                names[alias.asname or alias.name] = f"{source}.{alias.name}"
+    return names
+
+
+class StaticModule:
+    """Um módulo lido do código-fonte: a AST e as definições de primeiro nível."""
+
+    def __init__(self, module_name: str, path: str):
+        self.name = module_name
+        self.path = path
+        with open(path, "r", encoding="utf-8") as f:
+            self.tree = ast.parse(f.read(), filename=path)
+        self.definitions = collect_definitions(self.tree.body)
+        self.imports = _imported_names(self.tree, module_name, os.path.basename(path).startswith("__init__."))
+        self.library_root = module_name.split(".")[0]
+
+    def description(self) -> str:
+        return (_docstring(self.tree) or "No description available").strip()
+
+    def public(self, kind):
+        for name in sorted(self.definitions):
+            node = self.definitions[name]
+            if not name.startswith("_") and isinstance(node, kind):
+                yield name, node
+
+    def local_bases(self, node) -> List[ast.ClassDef]:
+        """Classes base definidas no próprio módulo, em profundidade e sem repetição."""
+        found = []
+        stack = list(node.bases)
+        while stack:
+            base = stack.pop(0)
+            if isinstance(base, ast.Name):
+                klass = self.definitions.get(base.id)
+                if isinstance(klass, ast.ClassDef) and klass is not node and klass not in found:
+                    found.append(klass)
+                    stack = list(klass.bases) + stack
+        return found
+
+    def inherited_references(self, node) -> List[str]:
+        """Ancestrais documentados separadamente (o "inherits_from" do modo mro_aware)."""
+        references = [f"{self.name}.{klass.name}" for klass in self.local_bases(node)
+                      if not klass.name.startswith("_")]
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id in self.imports:
+                reference = self.imports[base.id]
+                if reference.startswith(self.library_root + ".") and not any(
+                        part.startswith("_") for part in reference.split(".")):
+                    references.append(reference)
+        return references
+
+    def methods(self, node, mro_aware: bool = False) -> List[Dict]:
+        owners = [node] + [klass for klass in self.local_bases(node)
+                           if not (mro_aware and not klass.name.startswith("_"))]
+        methods = {}
+        for owner in owners:
+            for name, method in collect_definitions(owner.body).items():
+                if name.startswith("_") or name in methods or not _is_method(method):
+                    continue
+                parsed_doc = pop_general.parse_docstring(_docstring(method), self.name)
+                pop_general.EXTRACTION_STATS.parameters += len(parsed_doc.get("parameters", {}))
+                methods[name] = {
+                    "name": name,
+                    "signature": _signature(method, in_class=True),
+                    "documentation": parsed_doc
+                }
+        return [methods[name] for name in sorted(methods)]
+
+    def iter_functions(self):
+        stats = pop_general.EXTRACTION_STATS
+        for name, node in self.public((ast.FunctionDef, ast.AsyncFunctionDef)):
+            start = time.perf_counter()
+            parsed_doc = pop_general.parse_docstring(_docstring(node), self.name)
+            record = {"name": name, "signature": _signature(node), "documentation": parsed_doc}
+            stats.enumeration_seconds += time.perf_counter() - start
+            stats.functions += 1
+            stats.parameters += len(parsed_doc.get("parameters", {}))
+            yield record
+
+    def iter_classes(self, mro_aware: bool = False):
+        stats = pop_general.EXTRACTION_STATS
+        for name, node in self.public(ast.ClassDef):
+            start = time.perf_counter()
+            parsed_doc = pop_general.parse_docstring(_docstring(node), self.name)
+            class_data = {"name": name, "documentation": parsed_doc,
+                          "methods": self.methods(node, mro_aware=mro_aware)}
+            if mro_aware:
+                class_data["inherits_from"] = self.inherited_references(node)
+            stats.enumeration_seconds += time.perf_counter() - start
+            stats.classes += 1
+            stats.methods += len(class_data["methods"])
+            stats.parameters += len(parsed_doc.get("parameters", {}))
+            yield class_data
+
+
+def load_static_module(module_name: str, path: Optional[str]):
+    """(StaticModule, None) ou (None, dicionário de erro), como pop_general.import_api_module."""
+    print(f"Extraindo API (estática) de {module_name}...")
+    if path is None:
+        return None, {"error": f"Sem código-fonte Python para {module_name}"}
+    start = time.perf_counter()
+    try:
+        return StaticModule(module_name, path), None
+    except (OSError, SyntaxError, ValueError) as e:
+        return None, {"error": f"Não foi possível ler {path}: {str(e)}"}
+    finally:
+        pop_general.EXTRACTION_STATS.import_seconds += time.perf_counter() - start
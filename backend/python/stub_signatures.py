@@ -0,0 +1,360 @@
+"""
+Assinaturas a partir de stubs .pyi instalados localmente.
+
+Para callables compilados (numpy, torch, extensões em C/Cython) o
+inspect.signature costuma falhar e a docstring nem sempre traz a
+assinatura. Os stubs .pyi descrevem essas funções em Python puro, então
+podem ser lidos com ast sem importar nada.
+
+Para cada pacote de primeiro nível é montado, uma única vez, um índice
+"módulo.qualname" -> assinatura, a partir de (nesta ordem de prioridade):
+
+  1. um pacote de stubs PEP 561 (<pacote>-stubs) no sys.path;
+  2. os .pyi distribuídos junto do próprio pacote;
+  3. diretórios extras, por exemplo um checkout do typeshed (são aceitos
+     <dir>/<pacote>, <dir>/stdlib/<pacote> e <dir>/stubs/*/<pacote>).
+
+O índice é gravado em disco (cache_dir) com uma impressão digital dos
+arquivos .pyi (caminho, tamanho e mtime); execuções seguintes só o
+recarregam. A consulta é um acesso a dicionário.
+"""
+import ast
+import glob
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Diretórios extras de stubs (separados por os.pathsep) e pasta do cache
+STUB_PATH_ENV = "DYNAM_STUB_PATH"
+STUB_CACHE_ENV = "DYNAM_STUB_CACHE"
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "dynam", "stubs")
+
+# Versão do formato do índice em disco (muda a chave do cache)
+INDEX_FORMAT = 2
+
+
+def _package_locations(package_name: str) -> List[str]:
+    """Diretórios do pacote instalado (ou o arquivo, para módulos simples)."""
+    try:
+        spec = importlib.util.find_spec(package_name)
+    except (ImportError, ValueError):
+        return []
+    if spec is None:
+        return []
+    if spec.submodule_search_locations:
+        return list(spec.submodule_search_locations)
+    if spec.origin and os.path.isfile(spec.origin):
+        stub = os.path.splitext(spec.origin)[0] + ".pyi"
+        return [stub] if os.path.isfile(stub) else []
+    return []
+
+
+def _stub_candidates(directory: str, package_name: str) -> List[str]:
+    """<dir>/<pacote> ou <dir>/<pacote>.pyi, se existirem."""
+    found = []
+    for candidate in (os.path.join(directory, package_name), os.path.join(directory, package_name + ".pyi")):
+        if os.path.exists(candidate):
+            found.append(candidate)
+    return found
+
+
+def find_stub_roots(package_name: str, extra_paths: Optional[List[str]] = None) -> List[str]:
+    """
+    Diretórios (ou arquivos .pyi) com stubs de `package_name`, em ordem de
+    prioridade: <pacote>-stubs, o próprio pacote e os diretórios extras.
+    """
+    roots = []
+    for entry in sys.path:
+        if entry and os.path.isdir(entry):
+            stubs_package = os.path.join(entry, f"{package_name}-stubs")
+            if os.path.isdir(stubs_package):
+                roots.append(stubs_package)
+    roots.extend(_package_locations(package_name))
+    for directory in extra_paths or []:
+        roots.extend(_stub_candidates(directory, package_name))
+        roots.extend(_stub_candidates(os.path.join(directory, "stdlib"), package_name))
+        for distribution in sorted(glob.glob(os.path.join(directory, "stubs", "*"))):
+            roots.extend(_stub_candidates(distribution, package_name))
+    unique = []
+    for root in roots:
+        if root not in unique:
+            unique.append(root)
+    return unique
+
+
+def iter_stub_files(root: str, package_name: str):
+    """(nome do módulo, caminho) de cada .pyi sob `root`."""
+    if os.path.isfile(root):
+        yield package_name, root
+        return
+    for directory, subdirs, files in os.walk(root):
+        subdirs.sort()
+        relative = os.path.relpath(directory, root)
+        parts = [package_name] + ([] if relative == "." else relative.split(os.sep))
+        for filename in sorted(files):
+            if not filename.endswith(".pyi"):
+                continue
+            stem = filename[:-len(".pyi")]
+            module_parts = parts if stem == "__init__" else parts + [stem]
+            yield ".".join(module_parts), os.path.join(directory, filename)
+
+
+def decorator_names(node) -> List[str]:
+    names = []
+    for decorator in node.decorator_list:
+        target = decorator.func if isinstance(decorator, ast.Call) else decorator
+        if isinstance(target, ast.Attribute):
+            names.append(target.attr)
+        elif isinstance(target, ast.Name):
+            names.append(target.id)
+    return names
+
+
+def _format_parameter(arg, default=None, prefix: str = "") -> str:
+    # Mesma formatação de inspect.Parameter: "a=1", "a: int", "a: int = 1"
+    text = prefix + arg.arg
+    if arg.annotation is not None:
+        text += f": {ast.unparse(arg.annotation)}"
+    if default is not None:
+        text += f" = {ast.unparse(default)}" if arg.annotation is not None else f"={ast.unparse(default)}"
+    return text
+
+
+def format_arguments(args) -> str:
+    """Parâmetros de um ast.arguments no formato de str(inspect.signature(...)), sem os parênteses."""
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    params = []
+    for index, (arg, default) in enumerate(zip(positional, defaults)):
+        params.append(_format_parameter(arg, default))
+        if index == len(args.posonlyargs) - 1:
+            params.append("/")
+    if args.vararg is not None:
+        params.append(_format_parameter(args.vararg, prefix="*"))
+    elif args.kwonlyargs:
+        params.append("*")
+    for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+        params.append(_format_parameter(arg, default))
+    if args.kwarg is not None:
+        params.append(_format_parameter(args.kwarg, prefix="**"))
+    return ", ".join(params)
+
+
+def stub_signature(node, in_class: bool = False) -> str:
+    """
+    Parte da assinatura depois do nome ("(a: int, b=...) -> str") de um
+    def de stub, no formato de str(inspect.signature(...)). Em classmethods
+    o primeiro parâmetro sai, como acontece no método ligado à classe.
+    """
+    args = node.args
+    if in_class and "classmethod" in decorator_names(node):
+        args = ast.arguments(
+            posonlyargs=args.posonlyargs[1:],
+            args=args.args[1:] if not args.posonlyargs else args.args,
+            vararg=args.vararg, kwonlyargs=args.kwonlyargs, kw_defaults=args.kw_defaults,
+            kwarg=args.kwarg, defaults=args.defaults,
+        )
+    text = f"({format_arguments(args)})"
+    if node.returns is not None:
+        text += f" -> {ast.unparse(node.returns)}"
+    return text
+
+
+def resolve_relative_import(module_name: str, is_package: bool, level: int, target: Optional[str]) -> Optional[str]:
+    """Módulo absoluto de um "from <level pontos><target> import ..." dentro de `module_name`."""
+    if level == 0:
+        return target
+    base = module_name.split(".")
+    if not is_package:
+        base = base[:-1]
+    if level > 1:
+        if level - 1 > len(base):
+            return None
+        base = base[:len(base) - (level - 1)]
+    return ".".join(base + ([target] if target else []))
+
+
+def collect_definitions(body) -> Dict[str, ast.AST]:
+    """
+    Defs e classes de um bloco, por nome, como ficariam no namespace depois
+    de executado: a última definição vence, exceto que uma @overload não
+    substitui uma definição existente. Nos blocos if/else e try/except
+    entra o primeiro ramo, completado pelos outros.
+    """
+    definitions = {}
+    for node in body:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            if node.name in definitions and "overload" in decorator_names(node):
+                continue
+            definitions[node.name] = node
+        elif isinstance(node, (ast.If, ast.Try)):
+            branches = [node.body, node.orelse]
+            if isinstance(node, ast.Try):
+                branches += [handler.body for handler in node.handlers] + [node.finalbody]
+            for branch in branches:
+                for name, definition in collect_definitions(branch).items():
+                    definitions.setdefault(name, definition)
+    return definitions
+
+
+def _collect_signatures(body, prefix: str, signatures: Dict[str, str], in_class: bool = False) -> None:
+    for name, node in collect_definitions(body).items():
+        if isinstance(node, ast.ClassDef):
+            _collect_signatures(node.body, f"{prefix}.{name}", signatures, in_class=True)
+        else:
+            # Sobrecargas: vale a primeira @overload
+            signatures[f"{prefix}.{name}"] = stub_signature(node, in_class)
+
+
+def parse_stub_file(module_name: str, path: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Assinaturas ("módulo.qualname" -> assinatura) e reexportações
+    ("módulo.nome" -> "origem.nome") de um arquivo .pyi.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    signatures = {}
+    _collect_signatures(tree.body, module_name, signatures)
+    aliases = {}
+    is_package = os.path.basename(path) == "__init__.pyi"
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        source = resolve_relative_import(module_name, is_package, node.level, node.module)
+        if source is None:
+            continue
+        for alias in node.names:
+            if alias.name == "*":
+                continue
+            aliases[f"{module_name}.{alias.asname or alias.name}"] = f"{source}.{alias.name}"
+    return signatures, aliases
+
+
+def _resolve_aliases(signatures: Dict[str, str], aliases: Dict[str, str]) -> None:
+    """Copia a assinatura de cada nome reexportado (seguindo cadeias de reexportação)."""
+    for name, target in aliases.items():
+        seen = {name}
+        while target not in signatures and target in aliases and target not in seen:
+            seen.add(target)
+            target = aliases[target]
+        if target in signatures:
+            signatures.setdefault(name, signatures[target])
+        elif "." in target:
+            # Reexportação de uma classe: copia os métodos dela
+            prefix = target + "."
+            for qualified, signature in list(signatures.items()):
+                if qualified.startswith(prefix):
+                    signatures.setdefault(name + qualified[len(target):], signature)
+
+
+def _fingerprint(files: List[Tuple[str, str]]) -> str:
+    digest = hashlib.sha1(f"{INDEX_FORMAT}".encode("utf-8"))
+    for module_name, path in files:
+        stat = os.stat(path)
+        digest.update(f"{module_name}\0{path}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_stub_index(package_name: str, extra_paths: Optional[List[str]] = None,
+                     cache_dir: Optional[str] = None) -> Dict[str, str]:
+    """
+    Índice "módulo.qualname" -> assinatura dos stubs de um pacote. Com
+    cache_dir o índice é lido de lá quando os .pyi não mudaram, e gravado
+    caso contrário.
+    """
+    files = []
+    for root in find_stub_roots(package_name, extra_paths):
+        files.extend(iter_stub_files(root, package_name))
+    if not files:
+        return {}
+
+    cache_path = None
+    if cache_dir:
+        cache_path = os.path.join(cache_dir, f"{package_name}-{_fingerprint(files)}.json")
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+
+    signatures = {}
+    aliases = {}
+    for module_name, path in files:
+        try:
+            file_signatures, file_aliases = parse_stub_file(module_name, path)
+        except (OSError, SyntaxError, ValueError):
+            continue
+        for name, signature in file_signatures.items():
+            signatures.setdefault(name, signature)
+        for name, target in file_aliases.items():
+            aliases.setdefault(name, target)
+    _resolve_aliases(signatures, aliases)
+
+    if cache_path is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(signatures, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    return signatures
+
+
+class StubSignatureProvider:
+    """
+    Consulta de assinaturas nos stubs. O índice de cada pacote de primeiro
+    nível é montado (ou lido do cache em disco) na primeira consulta.
+    """
+
+    def __init__(self, extra_paths: Optional[List[str]] = None, cache_dir: Optional[str] = DEFAULT_CACHE_DIR):
+        self.extra_paths = list(extra_paths or [])
+        self.cache_dir = cache_dir
+        self._indexes = {}
+
+    def index(self, package_name: str) -> Dict[str, str]:
+        index = self._indexes.get(package_name)
+        if index is None:
+            try:
+                index = build_stub_index(package_name, self.extra_paths, self.cache_dir)
+            except OSError:
+                index = {}
+            self._indexes[package_name] = index
+        return index
+
+    def lookup(self, qualified_name: str) -> Optional[str]:
+        """Assinatura (sem o nome) de "módulo.qualname", ou None."""
+        package_name = qualified_name.split(".", 1)[0]
+        return self.index(package_name).get(qualified_name)
+
+    def signature_for(self, func, module_name: str = "") -> Optional[str]:
+        """
+        Assinatura completa ("nome(...) -> tipo") de `func` pelos stubs:
+        procura "__module__.__qualname__" e, para objetos reexportados,
+        "<módulo extraído>.__qualname__".
+        """
+        name = getattr(func, "__name__", None)
+        qualname = getattr(func, "__qualname__", None) or name
+        if not isinstance(name, str) or not isinstance(qualname, str):
+            return None
+        candidates = []
+        defining_module = getattr(func, "__module__", None)
+        if isinstance(defining_module, str) and defining_module:
+            candidates.append(f"{defining_module}.{qualname}")
+        if module_name:
+            candidates.append(f"{module_name}.{qualname}")
+        for candidate in candidates:
+            signature = self.lookup(candidate)
+            if signature is not None:
+                return f"{name}{signature}"
+        return None
+
+
+def provider_from_environment(extra_paths: Optional[List[str]] = None,
+                              cache_dir: Optional[str] = None) -> StubSignatureProvider:
+    """Provider com os diretórios de DYNAM_STUB_PATH mais `extra_paths` e o cache de DYNAM_STUB_CACHE."""
+    paths = [path for path in os.environ.get(STUB_PATH_ENV, "").split(os.pathsep) if path]
+    paths.extend(extra_paths or [])
+    return StubSignatureProvider(paths, cache_dir or os.environ.get(STUB_CACHE_ENV) or DEFAULT_CACHE_DIR)
@@ -0,0 +1,12 @@
+import sys
+import pytest
+
+@pytest.fixture(autouse=True)
+def reset_connection_pool():
+    """Drop connections pooled by one test so the next test opens its own (mocked) ones."""
+    yield
+    connection = sys.modules.get("data_create.connection")
+    if connection is not None:
+        connection.POOL.close_all()
+        connection.POOL.created = connection.POOL.reused = 0
+        connection.POOL.acquire_seconds = 0.0
@@ -3,31 +3,60 @@ import types
 import builtins
 import MainDatabase
 
-def test_main_calls_clean_and_populate(monkeypatch):
-    calls = []
+def _mock_stages(monkeypatch, calls):
     # Mock modules
     class MockClean:
         @staticmethod
         def clean_table(name):
             calls.append(f"clean:{name}")
+        @staticmethod
+        def reset_tables(names):
+            calls.extend(f"clean:{name}" for name in names)
+        @staticmethod
+        def purge_library(library):
+            calls.append(f"purge:{library}")
     class MockPopNS:
         @staticmethod
-        def populate_namespaces_from_output(path):
-            calls.append(f"popNS:{path}")
+        def populate_namespaces_from_output(path, specific_library=None):
+            calls.append(f"popNS:{path}:{specific_library}")
     class MockPopEntities:
         @staticmethod
-        def populate_entities_from_namespaces(path):
-            calls.append(f"popEntities:{path}")
+        def populate_entities_from_namespaces(path, specific_library=None, record_hashes=True):
+            # The hashes are left for populate_variables to record
+            assert record_hashes is False
+            calls.append(f"popEntities:{path}:{specific_library}")
+            return [(1, f"{specific_library}.mod", f"{specific_library}/mod.json", "h")]
     class MockPopVars:
         @staticmethod
-        def populate_variables(path):
-            calls.append(f"popVars:{path}")
+        def populate_variables(path, specific_library=None, namespaces=None):
+            assert namespaces == [(1, f"{specific_library}.mod", f"{specific_library}/mod.json", "h")]
+            calls.append(f"popVars:{path}:{specific_library}")
     monkeypatch.setattr(MainDatabase, 'clean', MockClean)
     monkeypatch.setattr(MainDatabase, 'popNameSpaces', MockPopNS)
     monkeypatch.setattr(MainDatabase, 'popEntities', MockPopEntities)
     monkeypatch.setattr(MainDatabase, 'popVariables', MockPopVars)
-    MainDatabase.main()
+
+def test_main_calls_clean_and_populate(monkeypatch):
+    calls = []
+    _mock_stages(monkeypatch, calls)
+    MainDatabase.main(full_reload=True)
     assert any("clean:Variables" in c for c in calls)
     assert any("popNS:" in c for c in calls)
     assert any("popEntities:" in c for c in calls)
     assert any("popVars:" in c for c in calls)
+    assert any("clean:ProcessedFiles" in c for c in calls)
+
+def test_main_incremental_does_not_clean(monkeypatch):
+    calls = []
+    _mock_stages(monkeypatch, calls)
+    MainDatabase.main()
+    assert not any(c.startswith("clean:") for c in calls)
+    assert [c.split(":")[0] for c in calls] == ["popNS", "popEntities", "popVars"]
+
+def test_main_library_purges_only_that_library(monkeypatch):
+    calls = []
+    _mock_stages(monkeypatch, calls)
+    MainDatabase.main(full_reload=True, library="numpy")
+    assert not any(c.startswith("clean:") for c in calls)
+    assert calls == ["purge:numpy", "popNS:../output:numpy",
+                     "popEntities:../output:numpy", "popVars:../output:numpy"]
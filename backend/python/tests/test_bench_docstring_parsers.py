@@ -0,0 +1,31 @@
+from benchmarks import bench_docstring_parsers as bench
+
+def test_frozen_corpus_is_usable():
+    corpus = bench.load_corpus()
+    assert len(corpus["docstrings"]) > 1000
+    assert all(isinstance(doc, str) and doc for doc in corpus["docstrings"])
+    assert bench.resolve_callables(corpus["callables"][:20])
+    # The target libraries are sampled, and the corpus records how it was made
+    assert set(corpus["versions"]) == set(bench.LIBRARY_MODULES)
+    assert all(corpus["docstring_counts"][library] > 100 for library in bench.LIBRARY_MODULES)
+    assert corpus["generator"] == bench.FREEZE_COMMAND
+
+def test_run_suite_reports_throughput_and_tail_latency():
+    corpus = {"docstrings": ["Do x.\n\nArgs:\n    x (int): value\n"] * 5, "callables": ["json:dumps"]}
+    results = bench.run_suite(corpus, repeat=1)
+    assert set(results) == set(bench.PARSERS) | {bench.SIGNATURE_BENCHMARK}
+    for r in results.values():
+        assert r["per_second"] > 0
+        assert r["p50_us"] <= r["p95_us"] <= r["p99_us"] <= r["max_us"]
+
+def test_compare_to_baseline_flags_regressions():
+    base = {"per_second": 1000.0, "p99_us": 10.0}
+    baseline = {"results": {"fast": base, "slow": base, "tail": base, "gone": base}}
+    results = {
+        "fast": {"per_second": 900.0, "p99_us": 12.0},
+        "slow": {"per_second": 500.0, "p99_us": 10.0},
+        "tail": {"per_second": 1000.0, "p99_us": 30.0},
+    }
+    regressions = bench.compare_to_baseline(results, baseline, tolerance=0.25, latency_tolerance=0.5)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("slow:") and regressions[1].startswith("tail: p99")
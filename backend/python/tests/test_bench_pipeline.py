@@ -0,0 +1,26 @@
+import pytest
+from benchmarks import bench_pipeline
+from data_create import connection, module_rows, var_pop
+from data_create.sqlite_schema import connect_sqlite
+
+@pytest.mark.parametrize("params", [0, 2])
+@pytest.mark.parametrize("output_format", ["json", "jsonl"])
+def test_loaders_fill_sqlite_standin(tmp_path, monkeypatch, output_format, params):
+    output_dir = str(tmp_path / "output")
+    expected = bench_pipeline.generate_output_tree(output_dir, modules=3, classes=2, methods=2,
+                                                   functions=3, params=params, output_format=output_format)
+    conn = connect_sqlite(str(tmp_path / "bench.db"))
+    monkeypatch.setattr(connection, "POOL", connection.ConnectionPool(config={}, connect=lambda **kwargs: conn))
+    try:
+        results = bench_pipeline.run_stages(conn, output_dir)
+        assert [rows for _, _, rows in results] == [
+            expected["Namespaces"], expected["Classes"] + expected["Functions"], expected["Variables"]
+        ]
+        # Nothing changed: the incremental rerun loads nothing and reads no module file
+        reads = []
+        monkeypatch.setattr(module_rows, "load_module_index", lambda *args: reads.append(args))
+        monkeypatch.setattr(var_pop, "process_jsonl_parameters", lambda *args: reads.append(args))
+        assert [rows for _, _, rows in bench_pipeline.run_stages(conn, output_dir)] == [0, 0, 0]
+        assert reads == []
+    finally:
+        conn.close()
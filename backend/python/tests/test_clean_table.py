@@ -1,5 +1,6 @@
 from unittest.mock import patch, MagicMock
-from data_create.clean_table import clean_table as clean_table_func
+from data_create.clean_table import clean_table as clean_table_func, purge_library, reset_tables
+from data_create import connection
 
 def test_clean_table_success():
     mock_conn = MagicMock()
@@ -14,7 +15,8 @@ def test_clean_table_success():
         mock_cursor.execute.assert_any_call("ALTER TABLE TestTable AUTO_INCREMENT = 1;")
         mock_conn.commit.assert_called_once()
         mock_cursor.close.assert_called_once()
-        mock_conn.close.assert_called()
+        # The connection goes back to the shared pool instead of being closed
+        assert connection.POOL.stats()["idle"] == 1
 
 def test_clean_table_table_not_exist():
     mock_conn = MagicMock()
@@ -25,4 +27,89 @@ def test_clean_table_table_not_exist():
     with patch('mariadb.connect', return_value=mock_conn):
         clean_table_func('NonExistent')
         mock_cursor.execute.assert_called_with("SHOW TABLES LIKE 'NonExistent'")
-        mock_conn.close.assert_called()
+        assert connection.POOL.stats()["idle"] == 1
+
+def test_clean_table_reuses_pooled_connection():
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value.fetchone.return_value = True
+    with patch('mariadb.connect', return_value=mock_conn) as connect:
+        clean_table_func('A')
+        clean_table_func('B')
+        assert connect.call_count == 1
+
+def test_reset_tables_truncates_existing_tables_with_fk_checks_off():
+    mock_conn = MagicMock()
+    mock_cursor = mock_conn.cursor.return_value
+    mock_cursor.fetchall.return_value = [("classes",), ("Namespaces",)]
+    with patch('mariadb.connect', return_value=mock_conn) as connect:
+        reset_tables(["Classes", "Missing", "Namespaces"])
+        statements = [c.args[0] for c in mock_cursor.execute.call_args_list]
+        assert statements == [
+            "SHOW TABLES",
+            "SET FOREIGN_KEY_CHECKS = 0",
+            "TRUNCATE TABLE Classes",
+            "TRUNCATE TABLE Namespaces",
+            "SET FOREIGN_KEY_CHECKS = 1",
+        ]
+        mock_conn.commit.assert_called_once()
+        assert connect.call_count == 1
+
+def test_purge_library_only_deletes_that_library(monkeypatch):
+    from data_create.sqlite_schema import connect_sqlite
+    db = connect_sqlite()
+    db.executescript("""
+        INSERT INTO Namespaces (id, name) VALUES (1, 'lib'), (2, 'lib.sub'), (3, 'other'), (4, 'library');
+        INSERT INTO Classes (id, namespace_id, name) VALUES (1, 2, 'A'), (2, 3, 'B'), (3, 4, 'C');
+        INSERT INTO Functions (id, parent_class_id, parent_namespace_id, name) VALUES
+            (1, 1, NULL, 'method'), (2, NULL, 2, 'func'), (3, 2, NULL, 'other_method');
+        INSERT INTO Variables (class_id, function_id, type, name) VALUES
+            (1, NULL, 'parameter', 'a'), (NULL, 1, 'parameter', 'b'), (NULL, 2, 'parameter', 'c'),
+            (2, NULL, 'parameter', 'd'), (NULL, 3, 'parameter', 'e');
+        INSERT INTO ProcessedFiles (file_path, hash, processed_at) VALUES
+            ('lib/index.json', 'x', 0), ('other/index.json', 'y', 0), ('library/index.json', 'z', 0);
+    """)
+    monkeypatch.setattr(connection, "POOL", connection.ConnectionPool(config={}, connect=lambda **kwargs: db))
+    purge_library("lib")
+    assert [r[0] for r in db.execute("SELECT name FROM Namespaces ORDER BY id")] == ["other", "library"]
+    assert [r[0] for r in db.execute("SELECT name FROM Classes ORDER BY id")] == ["B", "C"]
+    assert [r[0] for r in db.execute("SELECT name FROM Functions")] == ["other_method"]
+    assert [r[0] for r in db.execute("SELECT name FROM Variables ORDER BY name")] == ["d", "e"]
+    assert [r[0] for r in db.execute("SELECT file_path FROM ProcessedFiles ORDER BY file_path")] == [
+        "library/index.json", "other/index.json"]
+
+def test_purge_library_treats_underscore_literally(monkeypatch):
+    import os
+    from data_create.sqlite_schema import connect_sqlite
+    db = connect_sqlite()
+    db.executemany("INSERT INTO Namespaces (name) VALUES (?)",
+                   [("my_lib",), ("my_lib.core",), ("myXlib",), ("myXlib.core",)])
+    db.executemany("INSERT INTO ProcessedFiles (file_path, hash, processed_at) VALUES (?, 'h', 0)",
+                   [(os.path.join("my_lib", "core.json"),), (os.path.join("myXlib", "core.json"),)])
+    monkeypatch.setattr(connection, "POOL", connection.ConnectionPool(config={}, connect=lambda **kwargs: db))
+    purge_library("my_lib")
+    assert [r[0] for r in db.execute("SELECT name FROM Namespaces ORDER BY id")] == ["myXlib", "myXlib.core"]
+    assert [r[0] for r in db.execute("SELECT file_path FROM ProcessedFiles")] == [os.path.join("myXlib", "core.json")]
+
+def test_purge_library_rolls_back_and_releases_on_error():
+    import mariadb
+    mock_conn = MagicMock()
+    mock_cursor = mock_conn.cursor.return_value
+    def failing_execute(sql, params=()):
+        if sql.startswith("DELETE FROM Classes"):
+            raise mariadb.Error("lock wait timeout")
+    mock_cursor.execute.side_effect = failing_execute
+    with patch('mariadb.connect', return_value=mock_conn):
+        purge_library("lib")
+        mock_conn.commit.assert_not_called()
+        mock_conn.rollback.assert_called_once()
+        # The connection still goes back to the pool
+        assert connection.POOL.stats()["idle"] == 1
+
+def test_reset_tables_releases_connection_on_error():
+    import mariadb
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value.execute.side_effect = mariadb.Error("gone")
+    with patch('mariadb.connect', return_value=mock_conn):
+        reset_tables(["Classes"])
+        mock_conn.rollback.assert_called_once()
+        assert connection.POOL.stats()["idle"] == 1
@@ -1,6 +1,6 @@
 from unittest.mock import patch, MagicMock
 import builtins
-from data_create import entity_pop
+from data_create import entity_pop, module_rows
 
 def test_populate_entities_from_namespaces(monkeypatch):
     mock_conn = MagicMock()
@@ -18,6 +18,7 @@ def test_populate_entities_from_namespaces(monkeypatch):
     monkeypatch.setattr(entity_pop.os.path, 'isfile', lambda path: True)
     monkeypatch.setattr(entity_pop.os.path, 'isdir', lambda path: True)
     monkeypatch.setattr(entity_pop.os, 'listdir', lambda path: ['lib'])
+    monkeypatch.setattr(entity_pop, 'file_hash', lambda path: "newhash")
     def fake_json_load(f):
         return {
             "classes": [
@@ -32,7 +33,85 @@ def test_populate_entities_from_namespaces(monkeypatch):
     monkeypatch.setattr(entity_pop.json, 'load', fake_json_load)
     with patch.object(builtins, 'open', lambda *a, **k: MagicMock()):
         entity_pop.populate_entities_from_namespaces(output_dir="/fake")
-    sqls = [call[0][0] for call in mock_cursor.execute.call_args_list]
+    sqls = [call[0][0] for call in mock_cursor.execute.call_args_list + mock_cursor.executemany.call_args_list]
     print('Executed SQLs:', sqls)
     assert any("INSERT INTO Classes" in sql for sql in sqls)
     assert any("INSERT INTO Functions" in sql for sql in sqls)
+
+def test_populate_entities_skips_unchanged_files(monkeypatch):
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    monkeypatch.setattr(entity_pop.mariadb, 'connect', lambda **kwargs: mock_conn)
+    mock_cursor.fetchall.return_value = [(1, 'lib.mod1')]
+    # Stored hash equals the current one
+    mock_cursor.fetchone.return_value = ("samehash",)
+    monkeypatch.setattr(entity_pop.os.path, 'isfile', lambda path: True)
+    monkeypatch.setattr(entity_pop, 'file_hash', lambda path: "samehash")
+    entity_pop.populate_entities_from_namespaces(output_dir="/fake")
+    sqls = [call[0][0] for call in mock_cursor.execute.call_args_list + mock_cursor.executemany.call_args_list]
+    assert not any(sql.startswith("INSERT") or sql.startswith("DELETE") for sql in sqls)
+
+def test_populate_entities_can_leave_hashes_to_var_pop(monkeypatch):
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    monkeypatch.setattr(entity_pop.mariadb, 'connect', lambda **kwargs: mock_conn)
+    mock_cursor.fetchall.return_value = [(1, 'lib.mod1')]
+    mock_cursor.fetchone.return_value = None
+    monkeypatch.setattr(entity_pop.os.path, 'isfile', lambda path: True)
+    monkeypatch.setattr(entity_pop, 'file_hash', lambda path: "newhash")
+    monkeypatch.setattr(entity_pop.json, 'load', lambda f: {"functions": [{"name": "f"}]})
+    with patch.object(builtins, 'open', lambda *a, **k: MagicMock()):
+        reloaded = entity_pop.populate_entities_from_namespaces(output_dir="/fake", record_hashes=False)
+    assert reloaded == [(1, 'lib.mod1', 'lib/mod1.json', "newhash")]
+    sqls = [call[0][0] for call in mock_cursor.execute.call_args_list]
+    assert not any("INTO ProcessedFiles" in sql for sql in sqls)
+
+def test_insert_module_entities_batches_rows():
+    mock_cursor = MagicMock()
+    mock_cursor.fetchall.return_value = [(10, "A"), (11, "B")]
+    data = {
+        "classes": [
+            {"name": "A", "documentation": {"description": "a"}, "methods": [{"name": "m1"}, {"name": "m2"}]},
+            {"name": "B", "methods": [{"name": "m3"}]}
+        ],
+        "functions": [{"name": "f", "signature": "f()", "documentation": {"returns": "int"}}],
+        "aliases": [{"name": "g", "type": "function", "alias_of": "lib.core.g"}]
+    }
+    assert entity_pop.insert_module_entities(mock_cursor, 5, data) == (2, 4)
+    # One multi-row insert per table and a single ID lookup
+    assert mock_cursor.executemany.call_count == 3
+    assert mock_cursor.execute.call_count == 1
+    class_sql, class_rows = mock_cursor.executemany.call_args_list[0][0]
+    assert "INSERT INTO Classes" in class_sql
+    assert class_rows == [(5, "A", "a", None), (5, "B", None, None)]
+    function_sql, function_rows = mock_cursor.executemany.call_args_list[1][0]
+    assert "INSERT INTO Functions" in function_sql
+    assert [(row[0], row[1], row[2]) for row in function_rows] == [
+        (10, None, "m1"), (10, None, "m2"), (11, None, "m3"), (None, 5, "f")
+    ]
+    assert function_rows[3][3:] == ("f()", None, "int", None)
+    alias_sql, alias_rows = mock_cursor.executemany.call_args_list[2][0]
+    assert "INSERT INTO Aliases" in alias_sql
+    assert alias_rows == [(5, "g", "function", "lib.core", "g")]
+
+def test_insert_module_records_streams_in_batches():
+    mock_cursor = MagicMock()
+    mock_cursor.lastrowid = 10
+    records = [
+        {"kind": "namespace", "namespace": "lib.mod"},
+        {"kind": "function", "namespace": "lib.mod", "name": "f", "signature": "f()", "documentation": {}},
+        {"kind": "class", "namespace": "lib.mod", "name": "A", "documentation": {"description": "a"}},
+        {"kind": "parameter", "namespace": "lib.mod", "class": "A", "function": None, "name": "x", "info": {}},
+        {"kind": "method", "namespace": "lib.mod", "class": "A", "name": "m1", "documentation": {"returns": "int"}},
+        {"kind": "method", "namespace": "lib.mod", "class": "A", "name": "m2", "documentation": {}},
+        {"kind": "alias", "namespace": "lib.mod", "name": "B", "type": "class", "alias_of": "lib.core.B"},
+    ]
+    assert entity_pop.insert_module_records(mock_cursor, 5, iter(records), batch_size=2) == (1, 3)
+    mock_cursor.execute.assert_called_once_with(module_rows.CLASS_INSERT, (5, "A", "a", None))
+    batches = [call[0][1] for call in mock_cursor.executemany.call_args_list]
+    assert [[(row[0], row[1], row[2]) for row in batch] for batch in batches] == [
+        [(None, 5, "f"), (10, None, "m1")], [(10, None, "m2")], [(5, "B", "class")]
+    ]
+    assert batches[-1] == [(5, "B", "class", "lib.core", "B")]
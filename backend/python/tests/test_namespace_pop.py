@@ -24,3 +24,14 @@ def test_populate_namespaces_from_output(monkeypatch, tmp_path):
     # Check that insert was called for each module
     calls = [call[0][1][0] for call in mock_cursor.execute.call_args_list if call[0][0].startswith("INSERT INTO")]
     assert "mod1" in calls and "mod2" in calls
+
+def test_sync_library_namespaces_ignores_lookalike_libraries():
+    from data_create.sqlite_schema import connect_sqlite
+    conn = connect_sqlite()
+    cur = conn.cursor()
+    cur.executemany("INSERT INTO Namespaces (name) VALUES (?)",
+                    [("my_lib",), ("my_lib.old",), ("myXlib",), ("myXlib.core",)])
+    # '_' must not match any character: myXlib is another library
+    namespace_pop.sync_library_namespaces(cur, "my_lib", ["my_lib", "my_lib.new"])
+    cur.execute("SELECT name FROM Namespaces ORDER BY name")
+    assert [row[0] for row in cur.fetchall()] == ["myXlib", "myXlib.core", "my_lib", "my_lib.new"]
@@ -0,0 +1,81 @@
+import os
+from unittest.mock import MagicMock
+import pipeline
+
+MODULES = {
+    "lib": {"classes": [], "functions": []},
+    "lib.mod": {
+        "classes": [{"name": "A", "documentation": {"parameters": {"x": {"type": "int", "description": "d"}}}}],
+        "functions": [{"name": "f", "documentation": {"parameters": {"y": {"type": "str", "description": "d"}}}}],
+    },
+}
+
+def _mock_cursor(processed_hash=None):
+    cur = MagicMock()
+    def fetchall():
+        sql = cur.execute.call_args[0][0]
+        if "FROM Namespaces" in sql:
+            return [(1, "lib"), (2, "lib.mod")]
+        if "FROM Classes" in sql:
+            return [(10, "A")]
+        if "FROM Functions" in sql:
+            return [(20, "f", None, None)]
+        return []
+    cur.fetchall.side_effect = fetchall
+    cur.fetchone.return_value = (processed_hash,) if processed_hash else None
+    return cur
+
+def test_load_library_loads_modules_in_memory():
+    cur = _mock_cursor()
+    assert pipeline.load_library(cur, "lib", MODULES) == 1
+    executemany_sqls = [c[0][0] for c in cur.executemany.call_args_list]
+    assert any("INSERT INTO Classes" in sql for sql in executemany_sqls)
+    assert any("INSERT INTO Functions" in sql for sql in executemany_sqls)
+    variables = [c[0][1] for c in cur.execute.call_args_list if "INSERT INTO Variables" in c[0][0]]
+    assert [(row[0], row[1], row[3]) for row in variables] == [(10, None, "x"), (None, 20, "y")]
+    processed = [c[0][1][0] for c in cur.execute.call_args_list if "INSERT INTO ProcessedFiles" in c[0][0]]
+    assert processed == [os.path.join("lib", "index.json"), os.path.join("lib", "mod.json")]
+
+def test_load_library_skips_unchanged_modules():
+    digest = pipeline.json_hash(MODULES["lib.mod"])
+    cur = _mock_cursor(processed_hash=digest)
+    assert pipeline.load_library(cur, "lib", MODULES) == 0
+    assert not cur.executemany.called
+
+def test_load_library_stores_aliases_as_references():
+    modules = {
+        "lib": {"classes": [], "functions": [{"name": "f", "documentation": {}}]},
+        "lib.mod": {"classes": [], "functions": [], "aliases": [{"name": "g", "type": "function", "alias_of": "lib.f"}]},
+    }
+    cur = _mock_cursor()
+    assert pipeline.load_library(cur, "lib", modules) == 1
+    inserts = {c[0][0].split()[2]: c[0][1] for c in cur.executemany.call_args_list}
+    # The owner's function is not copied into lib.mod
+    assert list(inserts) == ["Aliases"]
+    assert inserts["Aliases"] == [(2, "g", "function", "lib", "f")]
+
+def test_load_library_escapes_the_namespace_prefix():
+    cur = _mock_cursor()
+    pipeline.load_library(cur, "my_lib", {"my_lib": {"classes": [], "functions": []}})
+    lookups = [c[0] for c in cur.execute.call_args_list if c[0][0].startswith("SELECT id, name FROM Namespaces")]
+    assert lookups
+    # '_' would match any character (e.g. myXlib) if it were not escaped
+    for sql, params in lookups:
+        assert sql.endswith("LIKE ? ESCAPE '!'")
+        assert params == ("my_lib", "my!_lib.%")
+
+def test_run_pipeline_uses_one_connection(monkeypatch):
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = _mock_cursor()
+    connects = []
+    monkeypatch.setattr(pipeline.mariadb, 'connect', lambda **kwargs: connects.append(kwargs) or mock_conn)
+    extract_kwargs = {}
+    def fake_build(library_name, **kwargs):
+        extract_kwargs.update(kwargs)
+        return MODULES
+    monkeypatch.setattr(pipeline.pop_general, 'build_module_structure', fake_build)
+    assert pipeline.run_pipeline("lib") is True
+    assert len(connects) == 1
+    assert extract_kwargs["write_json"] is False
+    mock_conn.commit.assert_called_once()
+    assert pipeline.connection.pool_stats()["idle"] == 1
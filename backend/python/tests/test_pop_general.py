@@ -48,3 +48,567 @@ def test_get_function_signature():
     assert 'foo' in sig
     assert 'a' in sig
     assert 'b' in sig
+
+def test_get_function_signature_text_signature_matches_inspect():
+    import inspect
+    for func in (len, divmod, str.upper, "x".upper, dict.fromkeys, str.split, int.__add__, (1).__add__):
+        assert get_function_signature(func) == f"{func.__name__}{inspect.signature(func)}"
+
+def test_get_function_signature_builtin_without_text_signature_uses_doc():
+    from pop_general import _signature_from_doc
+    for func in (getattr, iter, next):
+        assert getattr(func, "__text_signature__", None) is None
+        assert get_function_signature(func) == _signature_from_doc(func, "")
+
+def test_signature_cache_is_keyed_by_identity():
+    from pop_general import SignatureCache
+    cache = SignatureCache(maxsize=2)
+    def foo(a):
+        pass
+    def bar(b):
+        pass
+    assert cache.get_or_compute(foo, "") == "foo(a)"
+    assert cache.get_or_compute(foo, "") == "foo(a)"
+    assert cache.get_or_compute(bar, "") == "bar(b)"
+    assert cache.stats() == {"hits": 1, "misses": 2, "size": 2}
+    # Bound methods are fresh objects on each access and are not stored
+    class K:
+        def m(self, x):
+            pass
+    assert cache.get_or_compute(K().m, "") == "m(x)"
+    assert cache.stats()["size"] == 2
+
+def _make_fake_package(root):
+    pkg = root / "fakelib"
+    (pkg / "sub").mkdir(parents=True)
+    (pkg / "__init__.py").write_text('"""Fake lib."""\n')
+    (pkg / "alpha.py").write_text('def f(x):\n    """Do f."""\n    return x\n')
+    (pkg / "_private.py").write_text('')
+    (pkg / "sub" / "__init__.py").write_text('')
+    (pkg / "sub" / "beta.py").write_text('class B:\n    """A class."""\n    def m(self):\n        pass\n')
+    return pkg
+
+@pytest.fixture
+def fake_library(tmp_path, monkeypatch):
+    import sys
+    _make_fake_package(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.startswith("fakelib"):
+            del sys.modules[name]
+
+def test_iter_submodule_names_is_recursive(tmp_path):
+    from pop_general import iter_submodule_names
+    pkg = _make_fake_package(tmp_path)
+    names = iter_submodule_names("fakelib", [str(pkg)])
+    assert names == ["fakelib.alpha", "fakelib.sub", "fakelib.sub.beta"]
+
+def test_module_output_filename():
+    from pop_general import module_output_filename
+    assert module_output_filename("torch", "torch") == "torch.json"
+    assert module_output_filename("torch.nn", "torch") == "nn.json"
+    assert module_output_filename("torch.nn.functional", "torch") == "nn.functional.json"
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_module_structure_writes_all_modules(fake_library, workers):
+    import json
+    from pop_general import build_module_structure
+    result = build_module_structure("fakelib", workers=workers)
+    expected = ["fakelib", "fakelib.alpha", "fakelib.sub", "fakelib.sub.beta"]
+    assert list(result.keys()) == expected
+    out = fake_library / "output" / "fakelib"
+    with open(out / "index.json", encoding="utf-8") as f:
+        assert json.load(f)["modules"] == expected
+    with open(out / "sub.beta.json", encoding="utf-8") as f:
+        assert json.load(f)["classes"][0]["name"] == "B"
+
+def test_build_module_structure_without_json(fake_library):
+    from pop_general import build_module_structure
+    result = build_module_structure("fakelib", workers=1, write_json=False)
+    assert "fakelib.sub.beta" in result
+    assert not (fake_library / "output").exists()
+
+def test_write_module_api_matches_json_dump(fake_library):
+    import json
+    from pop_general import write_module_api, extract_module_api
+    for module_name in ["fakelib.alpha", "fakelib.sub.beta", "fakelib.sub", "fakelib.missing"]:
+        path = fake_library / "streamed.json"
+        write_module_api(module_name, str(path))
+        expected = json.dumps(extract_module_api(module_name), indent=2, ensure_ascii=False)
+        assert path.read_text(encoding="utf-8") == expected
+        assert not (fake_library / "streamed.json.tmp").exists()
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_module_structure_stream(fake_library, workers):
+    import json
+    from pop_general import build_module_structure
+    result = build_module_structure("fakelib", workers=workers, stream=True)
+    assert result["fakelib.sub.beta"] == "sub.beta.json"
+    out = fake_library / "output" / "fakelib"
+    with open(out / "index.json", encoding="utf-8") as f:
+        assert json.load(f)["modules"] == list(result.keys())
+    with open(out / "sub.beta.json", encoding="utf-8") as f:
+        assert json.load(f)["classes"][0]["methods"][0]["name"] == "m"
+
+def test_build_module_structure_isolates_failing_submodules(fake_library):
+    import json
+    from pop_general import build_module_structure
+    pkg = fake_library / "fakelib"
+    (pkg / "hangs.py").write_text('import time\ntime.sleep(60)\n')
+    (pkg / "crashes.py").write_text('import ctypes, faulthandler\nfaulthandler.disable()\nctypes.string_at(0)\n')
+    (pkg / "raises.py").write_text('raise RuntimeError("boom")\n')
+    result = build_module_structure("fakelib", workers=2, module_timeout=3, stream=True)
+    assert list(result.keys()) == ["fakelib", "fakelib.alpha", "fakelib.sub", "fakelib.sub.beta"]
+    with open(fake_library / "output" / "fakelib" / "index.json", encoding="utf-8") as f:
+        index = json.load(f)
+    assert index["modules"] == list(result.keys())
+    assert sorted(index["failed"]) == ["fakelib.crashes", "fakelib.hangs", "fakelib.raises"]
+    assert "tempo limite" in index["failed"]["fakelib.hangs"]
+    assert "SIGSEGV" in index["failed"]["fakelib.crashes"]
+    assert "boom" in index["failed"]["fakelib.raises"]
+
+def test_build_module_structure_isolated_matches_pool(fake_library):
+    from pop_general import build_module_structure
+    expected = build_module_structure("fakelib", workers=1, write_json=False)
+    isolated = build_module_structure("fakelib", workers=2, write_json=False, isolate=True)
+    assert list(isolated.keys()) == list(expected.keys())
+    assert isolated["fakelib.sub.beta"]["classes"][0]["name"] == "B"
+    assert not (fake_library / "output").exists()
+
+def test_supervised_child_applies_the_parent_settings(tmp_path, monkeypatch):
+    import multiprocessing
+    import pop_general
+    monkeypatch.delenv("DYNAM_STUB_PATH", raising=False)
+    saved = pop_general.worker_settings()
+    try:
+        pop_general.configure_stub_signatures([str(tmp_path)], cache_dir=str(tmp_path / "cache"))
+        pop_general.DOCSTRING_CACHE.maxsize = 7
+        settings = pop_general.worker_settings()
+        # Como num filho criado com "spawn", que não herda os globais
+        pop_general.configure_worker(10000)
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        probe = lambda name: (name, pop_general.DOCSTRING_CACHE.maxsize,
+                              pop_general.STUB_SIGNATURES.extra_paths, pop_general.STUB_SIGNATURES.cache_dir)
+        pop_general._supervised_child(sender, probe, "mod", None, settings)
+        assert receiver.recv() == ("ok", ("mod", 7, [str(tmp_path)], str(tmp_path / "cache")))
+    finally:
+        pop_general.configure_worker(**saved)
+
+@pytest.mark.parametrize("stream", [False, True])
+def test_build_module_structure_writes_run_manifest(fake_library, stream):
+    import json
+    from pop_general import build_module_structure, MANIFEST_FILENAME
+    build_module_structure("fakelib", workers=2, stream=stream)
+    out = fake_library / "output" / "fakelib"
+    with open(out / MANIFEST_FILENAME, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert list(manifest["modules"]) == ["fakelib", "fakelib.alpha", "fakelib.sub", "fakelib.sub.beta"]
+    beta = manifest["modules"]["fakelib.sub.beta"]
+    assert (beta["classes"], beta["methods"], beta["functions"]) == (1, 1, 0)
+    assert beta["output_bytes"] == (out / "sub.beta.json").stat().st_size
+    assert manifest["modules"]["fakelib.alpha"]["functions"] == 1
+    for field in ("import_seconds", "enumeration_seconds", "parse_seconds", "signature_seconds"):
+        assert beta[field] >= 0
+    assert manifest["totals"]["methods"] == 1
+    assert manifest["peak_rss_kb"]["self"] > 0
+    assert manifest["failed"] == {}
+
+def test_build_module_structure_static_matches_import_mode(fake_library):
+    from pop_general import build_module_structure
+    static = build_module_structure("fakelib", workers=1, write_json=False, static=True)
+    imported = build_module_structure("fakelib", workers=1, write_json=False)
+    assert list(static.keys()) == list(imported.keys())
+    for module_name in ["fakelib.alpha", "fakelib.sub.beta"]:
+        assert static[module_name] == imported[module_name]
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl"])
+def test_build_module_structure_static_does_not_import(fake_library, output_format):
+    import sys
+    import json
+    from pop_general import build_module_structure
+    pkg = fake_library / "fakelib"
+    (pkg / "heavy.py").write_text(
+        'raise RuntimeError("needs a GPU")\n'
+        'class Model:\n'
+        '    """A model."""\n'
+        '    @property\n'
+        '    def size(self):\n'
+        '        return 1\n'
+        '    @classmethod\n'
+        '    def load(cls, path: str = "m.bin") -> "Model":\n'
+        '        """Load it."""\n'
+    )
+    result = build_module_structure("fakelib", workers=2, static=True, output_format=output_format)
+    assert "fakelib" not in sys.modules
+    assert "fakelib.heavy" in result
+    out = fake_library / "output" / "fakelib"
+    if output_format == "json":
+        with open(out / "heavy.json", encoding="utf-8") as f:
+            model = json.load(f)["classes"][0]
+        assert [m["signature"] for m in model["methods"]] == ["load(path: str = 'm.bin') -> 'Model'"]
+    else:
+        with open(out / "heavy.jsonl", encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        assert [(r["kind"], r.get("name")) for r in records] == [
+            ("namespace", None), ("class", "Model"), ("method", "load")]
+
+def test_cli_static_manifest_counts_match_import_mode(fake_library):
+    import json
+    import os
+    import subprocess
+    import sys
+    import pop_general
+    script = os.path.abspath(pop_general.__file__)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(fake_library), os.path.dirname(script)]))
+    totals = {}
+    for mode in ([], ["--static"]):
+        subprocess.run([sys.executable, script, "fakelib", "--workers", "2", *mode], cwd=fake_library, env=env,
+                       check=True, capture_output=True)
+        with open(fake_library / "output" / "fakelib" / "_manifest.json", encoding="utf-8") as f:
+            manifest = json.load(f)
+        totals[bool(mode)] = ({key: manifest["totals"][key] for key in ("functions", "classes", "methods")},
+                              manifest["docstring_cache"])
+    assert totals[False][0] == {"functions": 1, "classes": 1, "methods": 1}
+    assert totals[True] == totals[False]
+
+def test_root_module_failure_is_not_reported_as_success(fake_library, monkeypatch):
+    import os
+    import subprocess
+    import sys
+    import pop_general
+    script = os.path.abspath(pop_general.__file__)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([str(fake_library), os.path.dirname(script)]))
+    missing = subprocess.run([sys.executable, script, "nosuchlib"], cwd=fake_library, env=env, capture_output=True)
+    assert missing.returncode == 1
+
+    open_module_api = pop_general.open_module_api
+    def failing_root(module_name, *args):
+        if module_name == "fakelib":
+            raise RuntimeError("boom")
+        return open_module_api(module_name, *args)
+    monkeypatch.setattr(pop_general, "open_module_api", failing_root)
+    for options in ({"workers": 1, "write_json": False}, {"workers": 2, "isolate": True},
+                    {"workers": 2, "stream": True}, {"workers": 1, "output_format": "jsonl"}):
+        with pytest.raises(RuntimeError, match="boom"):
+            pop_general.build_module_structure("fakelib", **options)
+    assert not (fake_library / "output" / "fakelib" / "index.json").exists()
+
+def test_iter_module_records_is_flat_and_ordered(fake_library):
+    from pop_general import iter_module_records
+    records = list(iter_module_records("fakelib.sub.beta"))
+    assert [(r["kind"], r.get("class"), r.get("name")) for r in records] == [
+        ("namespace", None, None), ("class", None, "B"), ("method", "B", "m")
+    ]
+    assert records[0]["namespace"] == "fakelib.sub.beta"
+    assert all("parameters" not in r.get("documentation", {}) for r in records)
+
+def test_records_from_module_data_matches_live_records(fake_library):
+    from pop_general import iter_module_records, records_from_module_data, extract_module_api
+    for module_name in ["fakelib.alpha", "fakelib.sub.beta", "fakelib.missing"]:
+        data = extract_module_api(module_name)
+        assert list(records_from_module_data(module_name, data)) == list(iter_module_records(module_name))
+
+def test_build_module_structure_jsonl_replaces_json(fake_library):
+    import json
+    from pop_general import build_module_structure
+    build_module_structure("fakelib", workers=1)
+    out = fake_library / "output" / "fakelib"
+    assert (out / "sub.beta.json").exists()
+    result = build_module_structure("fakelib", workers=1, output_format="jsonl")
+    assert result["fakelib.sub.beta"] == "sub.beta.jsonl"
+    assert not (out / "sub.beta.json").exists()
+    with open(out / "alpha.jsonl", encoding="utf-8") as f:
+        kinds = [json.loads(line)["kind"] for line in f]
+    assert kinds[:2] == ["namespace", "function"]
+
+def test_docstring_cache_hits_and_lru_eviction():
+    from pop_general import DocstringCache
+    calls = []
+    def parser(doc):
+        calls.append(doc)
+        return {"description": doc}
+    cache = DocstringCache(maxsize=2)
+    first = cache.get_or_parse(parser, "a")
+    assert cache.get_or_parse(parser, "a") is first
+    cache.get_or_parse(parser, "b")
+    cache.get_or_parse(parser, "a")  # "a" becomes most recently used
+    cache.get_or_parse(parser, "c")  # evicts "b"
+    cache.get_or_parse(parser, "b")
+    assert calls == ["a", "b", "c", "b"]
+    assert cache.stats() == {"hits": 2, "misses": 4, "size": 2}
+
+def test_parse_docstring_uses_cache():
+    from pop_general import parse_docstring, DOCSTRING_CACHE
+    DOCSTRING_CACHE.clear()
+    doc = "Summary.\n\nParameters\n----------\nx : int\n    Value.\n"
+    first = parse_docstring(doc, "sklearn.base")
+    second = parse_docstring(doc, "sklearn.linear_model")
+    assert first is second
+    assert first["parameters"]["x"]["type"] == "int"
+    # A different parser is a different cache entry
+    parse_docstring(doc, "torch.nn")
+    assert DOCSTRING_CACHE.stats()["hits"] == 1
+    assert DOCSTRING_CACHE.stats()["misses"] == 2
+
+def test_extract_classes_mro_aware(tmp_path, monkeypatch):
+    import importlib
+    import sys
+    pkg = tmp_path / "mrolib"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "base.py").write_text(
+        "class Base:\n"
+        "    def shared(self):\n        '''Shared.'''\n"
+        "class _Hidden:\n"
+        "    def hidden(self):\n        pass\n"
+    )
+    (pkg / "models.py").write_text(
+        "from mrolib.base import Base, _Hidden\n"
+        "class Model(Base, _Hidden):\n"
+        "    def fit(self):\n        pass\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        from pop_general import extract_classes
+        models = importlib.import_module("mrolib.models")
+        full = {c["name"]: c for c in extract_classes(models, "mrolib.models")}
+        assert [m["name"] for m in full["Model"]["methods"]] == ["fit", "hidden", "shared"]
+        assert "inherits_from" not in full["Model"]
+
+        lean = {c["name"]: c for c in extract_classes(models, "mrolib.models", mro_aware=True)}
+        # "shared" is documented on mrolib.base.Base; "hidden" comes from a private base and is kept
+        assert [m["name"] for m in lean["Model"]["methods"]] == ["fit", "hidden"]
+        assert lean["Model"]["inherits_from"] == ["mrolib.base.Base"]
+        assert [m["name"] for m in lean["Base"]["methods"]] == ["shared"]
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("mrolib"):
+                del sys.modules[name]
+
+def test_enumeration_does_not_run_lazy_members(tmp_path, monkeypatch):
+    import importlib
+    import sys
+    (tmp_path / "lazylib.py").write_text(
+        "import functools\n"
+        "CALLS = []\n"
+        "class AvailableIf:\n"
+        "    # Like sklearn's available_if: resolved on the class to a wrapper function\n"
+        "    def __init__(self, fn):\n        self.fn = fn\n"
+        "    def __get__(self, obj, owner=None):\n"
+        "        CALLS.append('descriptor')\n"
+        "        return functools.wraps(self.fn)(lambda *args, **kwargs: self.fn(*args, **kwargs))\n"
+        "class Model:\n"
+        "    @property\n"
+        "    def size(self):\n        CALLS.append('property')\n        return 0\n"
+        "    @classmethod\n"
+        "    def create(cls, n):\n        pass\n"
+        "    @staticmethod\n"
+        "    def helper(x):\n        pass\n"
+        "    def fit(self):\n        pass\n"
+        "    def _proba(self, X):\n        \"Probabilities.\"\n"
+        "    predict_proba = AvailableIf(_proba)\n"
+        "def run():\n    pass\n"
+        "def __getattr__(name):\n"
+        "    if name == 'heavy':\n"
+        "        CALLS.append(name)\n"
+        "        return run\n"
+        "    raise AttributeError(name)\n"
+        "def __dir__():\n"
+        "    return sorted(list(globals()) + ['heavy'])\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        from pop_general import EXTRACTION_STATS, extract_classes, extract_functions
+        lazylib = importlib.import_module("lazylib")
+        before = EXTRACTION_STATS.snapshot()
+        assert [f["name"] for f in extract_functions(lazylib, "lazylib", resolve_lazy=False)] == ["run"]
+        assert EXTRACTION_STATS.since(before)["lazy_skipped"] == 1
+        classes = {c["name"]: c for c in extract_classes(lazylib, "lazylib", resolve_lazy=False)}
+        methods = {m["name"]: m for m in classes["Model"]["methods"]}
+        assert {name: m["signature"] for name, m in methods.items()} == {
+            "create": "create(n)", "fit": "fit(self)", "helper": "helper(x)",
+            "predict_proba": "_proba(self, X)"}
+        assert methods["predict_proba"]["documentation"]["description"] == "Probabilities."
+        # Class descriptors are resolved; properties and the module __getattr__ are not run
+        assert "descriptor" in lazylib.CALLS
+        assert "property" not in lazylib.CALLS and "heavy" not in lazylib.CALLS
+
+        # By default the lazy names are resolved, as getattr would
+        assert [f["name"] for f in extract_functions(lazylib, "lazylib")] == ["heavy", "run"]
+        assert "heavy" in lazylib.CALLS and "property" not in lazylib.CALLS
+    finally:
+        sys.modules.pop("lazylib", None)
+
+def test_lazy_module_attributes_are_extracted_by_default(monkeypatch):
+    import concurrent.futures
+    from pop_general import extract_classes
+    # Back to the state of a fresh import: the executors only exist through
+    # the module's __getattr__ (PEP 562) until first accessed
+    monkeypatch.delattr(concurrent.futures, "ThreadPoolExecutor")
+    monkeypatch.delattr(concurrent.futures, "ProcessPoolExecutor")
+    names = [c["name"] for c in extract_classes(concurrent.futures, "concurrent.futures")]
+    assert "ThreadPoolExecutor" in names and "ProcessPoolExecutor" in names
+    executor = next(c for c in extract_classes(concurrent.futures, "concurrent.futures")
+                    if c["name"] == "ThreadPoolExecutor")
+    assert "submit" in [m["name"] for m in executor["methods"]]
+
+    monkeypatch.delattr(concurrent.futures, "ThreadPoolExecutor")
+    skipped = [c["name"] for c in extract_classes(concurrent.futures, "concurrent.futures", resolve_lazy=False)]
+    assert "ThreadPoolExecutor" not in skipped and "Future" in skipped
+
+@pytest.fixture
+def reexport_library(tmp_path, monkeypatch):
+    import sys
+    pkg = tmp_path / "relib"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("from relib.core import Engine, run\nfrom relib._impl import helper\n")
+    (pkg / "_impl.py").write_text("def helper(x):\n    '''Help.'''\n")
+    (pkg / "core.py").write_text("class Engine:\n    def start(self):\n        pass\ndef run(n):\n    pass\n")
+    (pkg / "api.py").write_text("from relib import helper as assist\nfrom relib.core import Engine\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    yield tmp_path
+    for name in list(sys.modules):
+        if name.startswith("relib"):
+            del sys.modules[name]
+
+def test_alias_reexports_extracts_each_object_once(reexport_library):
+    import json
+    from pop_general import build_module_structure, extract_module_api, write_module_api
+    result = build_module_structure("relib", workers=1, write_json=False, alias_reexports=True)
+    assert [f["name"] for f in result["relib"]["functions"]] == ["helper"]
+    assert result["relib"]["classes"] == []
+    assert result["relib"]["aliases"] == [
+        {"name": "run", "type": "function", "alias_of": "relib.core.run"},
+        {"name": "Engine", "type": "class", "alias_of": "relib.core.Engine"},
+    ]
+    assert result["relib.api"]["aliases"] == [
+        {"name": "assist", "type": "function", "alias_of": "relib.helper"},
+        {"name": "Engine", "type": "class", "alias_of": "relib.core.Engine"},
+    ]
+    assert result["relib.core"]["aliases"] == []
+    assert [c["name"] for c in result["relib.core"]["classes"]] == ["Engine"]
+    assert "aliases" not in build_module_structure("relib", workers=1, write_json=False)["relib"]
+
+    path = reexport_library / "api.json"
+    write_module_api("relib.api", str(path), alias_reexports=True)
+    expected = json.dumps(extract_module_api("relib.api", alias_reexports=True), indent=2, ensure_ascii=False)
+    assert path.read_text(encoding="utf-8") == expected
+
+def test_alias_reexports_jsonl_records(reexport_library):
+    import json
+    from pop_general import build_module_structure
+    build_module_structure("relib", workers=2, output_format="jsonl", alias_reexports=True)
+    out = reexport_library / "output" / "relib"
+    with open(out / "relib.jsonl", encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert [r["kind"] for r in records] == ["namespace", "function", "alias", "alias"]
+    assert records[-1] == {"kind": "alias", "namespace": "relib", "name": "Engine", "type": "class",
+                           "alias_of": "relib.core.Engine"}
+    with open(out / "_manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert manifest["totals"]["aliases"] == 4
+    assert manifest["totals"]["functions"] == 2
+
+def test_alias_falls_back_when_the_owner_does_not_write_the_name(reexport_library, monkeypatch):
+    import pop_general
+    from pop_general import build_module_structure
+    pkg = reexport_library / "relib"
+    (pkg / "core.py").write_text(
+        "__all__ = ['run']\nclass Engine:\n    def start(self):\n        pass\ndef run(n):\n    pass\n"
+        "def _secret(y):\n    pass\n"
+    )
+    (pkg / "api.py").write_text("from relib.core import Engine, _secret as secret\n")
+
+    def names(module_data):
+        return ([f["name"] for f in module_data["functions"]], [c["name"] for c in module_data["classes"]],
+                [a["name"] for a in module_data["aliases"]])
+
+    # The owner never writes a private name
+    result = build_module_structure("relib", workers=1, write_json=False, alias_reexports=True)
+    assert names(result["relib.api"]) == (["secret"], [], ["Engine"])
+    # With --public all, Engine is outside relib.core's __all__
+    result = build_module_structure("relib", workers=1, write_json=False, alias_reexports=True, public_policy="all")
+    assert names(result["relib.core"]) == (["run"], [], [])
+    assert names(result["relib.api"]) == (["secret"], ["Engine"], [])
+    assert names(result["relib"]) == (["helper"], ["Engine"], ["run"])
+
+    # A failed owner: the modules that alias it are extracted again with full records
+    extract_module_api = pop_general.extract_module_api
+    def failing_core(module_name, **kwargs):
+        if module_name == "relib.core":
+            raise RuntimeError("boom")
+        return extract_module_api(module_name, **kwargs)
+    monkeypatch.setattr(pop_general, "extract_module_api", failing_core)
+    result = build_module_structure("relib", workers=1, write_json=False, alias_reexports=True)
+    assert list(result) == ["relib", "relib.api"]
+    assert names(result["relib"]) == (["helper", "run"], ["Engine"], [])
+    assert names(result["relib.api"]) == (["secret"], ["Engine"], [])
+
+def test_public_policies_filter_imported_names(reexport_library):
+    import importlib
+    from pop_general import build_module_structure, extract_classes, extract_functions, public_surface
+    pkg = reexport_library / "relib"
+    (pkg / "tools.py").write_text(
+        "import os\nfrom os.path import join\nfrom typing import Optional\nfrom relib.core import run\n"
+        "def local(x):\n    pass\n"
+    )
+    (pkg / "exported.py").write_text(
+        "from os.path import join\nfrom relib.core import Engine\n__all__ = ['join', 'shown']\n"
+        "def shown():\n    pass\ndef hidden():\n    pass\n"
+    )
+    tools = importlib.import_module("relib.tools")
+    assert [f["name"] for f in extract_functions(tools, "relib.tools")] == ["Optional", "join", "local", "run"]
+    assert [f["name"] for f in extract_functions(tools, "relib.tools", public_policy="module")] == ["local", "run"]
+    # Without __all__, "all" falls back to "module"
+    assert public_surface(tools, "all") == public_surface(tools, "module")
+
+    exported = importlib.import_module("relib.exported")
+    assert public_surface(exported, "all") == (["join", "shown"], False)
+    assert [f["name"] for f in extract_functions(exported, "relib.exported", public_policy="all")] == ["join", "shown"]
+    assert extract_classes(exported, "relib.exported", public_policy="all") == []
+
+    result = build_module_structure("relib", workers=1, write_json=False, public_policy="module")
+    assert [f["name"] for f in result["relib.exported"]["functions"]] == ["hidden", "shown"]
+    assert [c["name"] for c in result["relib.exported"]["classes"]] == ["Engine"]
+    with pytest.raises(ValueError):
+        build_module_structure("relib", write_json=False, public_policy="everything")
+
+def test_parse_generic_docstring_google_sections():
+    from pop_general import parse_generic_docstring
+    doc = ("Summary line.\n\nArgs:\n    x (int): first\n        continued\n    y: second\n\n"
+           "Returns:\n    thing\n\nRaises:\n    ValueError: bad\n")
+    result = parse_generic_docstring(doc)
+    assert result["parameters"]["x"] == {"type": "int", "description": "first\ncontinued"}
+    assert result["returns"].startswith("thing")
+    assert result["raises"] == "ValueError: bad"
+
+def test_tokenize_generic_sections_finds_header_formats():
+    from pop_general import _tokenize_generic_sections
+    doc = "Summary.\n\nNotes\n-----\nText.\nExample: inline\n"
+    occurrences = _tokenize_generic_sections(doc)
+    assert set(occurrences) == {"Notes", "Example"}
+    (notes_line, _, notes_formats), = occurrences["Notes"]
+    assert doc[notes_line:].startswith("Notes")
+    # underlined header (format 1) and "name followed by whitespace" (format 3)
+    assert sorted(notes_formats) == [1, 3]
+    assert doc[notes_formats[1][0]:].startswith("Text.")
+    (_, _, example_formats), = occurrences["Example"]
+    assert sorted(example_formats) == [2]
+    assert doc[example_formats[2][0]:].startswith(" inline")
+
+def test_parsers_are_silent_by_default(capsys):
+    from pop_general import parse_docstring
+    parse_docstring("Silent summary.\n\nParameters\n----------\nx : int\n", "numpy.silent")
+    assert capsys.readouterr().err == ""
+
+def test_parsers_log_debug_when_enabled(caplog):
+    import logging
+    from pop_general import parse_docstring
+    with caplog.at_level(logging.DEBUG, logger="pop_general"):
+        parse_docstring("Verbose summary.\n\nParameters\n----------\nx : int\n", "numpy.verbose")
+    messages = [record.getMessage() for record in caplog.records]
+    assert any("parse_numpy_tensorflow_style" in m for m in messages)
+    assert any(m.startswith("Description before truncation") for m in messages)
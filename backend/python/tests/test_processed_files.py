@@ -0,0 +1,61 @@
+import hashlib
+import os
+from unittest.mock import MagicMock
+from data_create import processed_files
+
+def test_file_hash_matches_sha256(tmp_path):
+    path = tmp_path / "mod.json"
+    path.write_bytes(b'{"classes": []}')
+    assert processed_files.file_hash(str(path)) == hashlib.sha256(b'{"classes": []}').hexdigest()
+
+def test_json_hash_matches_written_file(tmp_path):
+    import json
+    data = {"name": "lib.mod", "functions": [{"name": "f", "signature": "(x='é')"}]}
+    path = tmp_path / "mod.json"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+    assert processed_files.json_hash(data) == processed_files.file_hash(str(path))
+
+def test_namespace_file_key():
+    assert processed_files.namespace_file_key("torch") is None
+    assert processed_files.namespace_file_key("torch.nn") == os.path.join("torch", "nn.json")
+    assert processed_files.namespace_file_key("torch.nn.functional") == os.path.join("torch", "nn.functional.json")
+
+def test_module_file_prefers_json(tmp_path):
+    (tmp_path / "lib").mkdir()
+    assert processed_files.module_file(str(tmp_path), "lib") == (None, None)
+    assert processed_files.module_file(str(tmp_path), "lib.mod")[0] == os.path.join("lib", "mod.json")
+    (tmp_path / "lib" / "mod.jsonl").write_text('{"kind": "namespace"}\n\n{"kind": "class"}\n')
+    file_key, path = processed_files.module_file(str(tmp_path), "lib.mod")
+    assert file_key == os.path.join("lib", "mod.jsonl")
+    assert [r["kind"] for r in processed_files.iter_jsonl_records(path)] == ["namespace", "class"]
+    (tmp_path / "lib" / "mod.json").write_text('{}')
+    assert processed_files.module_file(str(tmp_path), "lib.mod")[0] == os.path.join("lib", "mod.json")
+
+def test_get_processed_hash():
+    cur = MagicMock()
+    cur.fetchone.return_value = ("abc",)
+    assert processed_files.get_processed_hash(cur, "lib/mod.json") == "abc"
+    cur.fetchone.return_value = None
+    assert processed_files.get_processed_hash(cur, "lib/mod.json") is None
+
+def test_mark_processed_replaces_entry():
+    cur = MagicMock()
+    processed_files.mark_processed(cur, "lib/mod.json", "abc")
+    sqls = [call[0][0] for call in cur.execute.call_args_list]
+    assert sqls[0].startswith("DELETE FROM ProcessedFiles")
+    assert sqls[1].startswith("INSERT INTO ProcessedFiles")
+    assert cur.execute.call_args_list[1][0][1][:2] == ("lib/mod.json", "abc")
+
+def test_delete_namespace_entities_removes_children_first():
+    cur = MagicMock()
+    processed_files.delete_namespace_entities(cur, 7)
+    tables = [call[0][0].split()[2] for call in cur.execute.call_args_list]
+    assert tables == ["Variables", "Variables", "Functions", "Classes", "Aliases"]
+
+def test_like_prefix_escapes_wildcards():
+    assert processed_files.like_prefix("my_lib.") == "my!_lib.%"
+    assert processed_files.like_prefix("a%b!") == "a!%b!!%"
+
+def test_alias_target_splits_the_owner_module():
+    assert processed_files.alias_target({"alias_of": "lib.core.Engine"}) == ("lib.core", "Engine")
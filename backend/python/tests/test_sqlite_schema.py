@@ -0,0 +1,11 @@
+from data_create.sqlite_schema import connect_sqlite, create_schema
+
+def test_connect_sqlite_creates_kotlin_tables():
+    conn = connect_sqlite()
+    tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert {"Namespaces", "Classes", "Functions", "Variables", "ProcessedFiles"} <= tables
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(Functions)")]
+    assert columns == ["id", "parent_class_id", "parent_namespace_id", "name", "signature",
+                       "description", "return_type", "example"]
+    # Idempotent
+    create_schema(conn)
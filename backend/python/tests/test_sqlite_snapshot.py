@@ -0,0 +1,96 @@
+import sqlite3
+import pytest
+from benchmarks.bench_pipeline import generate_output_tree
+from data_create import sqlite_snapshot
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl"])
+def test_build_snapshot(tmp_path, output_format):
+    output_dir = str(tmp_path / "output")
+    expected = generate_output_tree(output_dir, modules=2, classes=2, methods=1, functions=2, params=1,
+                                    output_format=output_format)
+    snapshot = str(tmp_path / "docs.db")
+    counts = sqlite_snapshot.build_snapshot(output_dir, snapshot)
+    assert counts == {table: expected[table] for table in counts}
+    conn = sqlite3.connect(snapshot)
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_namespaces_name", "idx_variables_function_id_type"} <= indexes
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+    conn.close()
+    assert not (tmp_path / "docs.db.tmp").exists()
+    # Rebuilding over an existing snapshot is allowed
+    assert sqlite_snapshot.build_snapshot(output_dir, snapshot) == counts
+
+def test_build_snapshot_does_not_mix_lookalike_libraries(tmp_path):
+    output_dir = str(tmp_path / "output")
+    expected = {}
+    for library_name in ("my_lib", "myXlib"):
+        counts = generate_output_tree(output_dir, modules=1, classes=1, methods=1, functions=1, params=1,
+                                      library_name=library_name)
+        expected = {table: expected.get(table, 0) + count for table, count in counts.items()}
+    counts = sqlite_snapshot.build_snapshot(output_dir, str(tmp_path / "docs.db"))
+    assert counts == {table: expected[table] for table in counts}
+
+def test_build_snapshot_keeps_other_databases(tmp_path):
+    other = tmp_path / "kls_database.db"
+    conn = sqlite3.connect(str(other))
+    conn.execute("CREATE TABLE DatabaseMetadata (version INTEGER)")
+    conn.close()
+    (tmp_path / "output").mkdir()
+    with pytest.raises(ValueError):
+        sqlite_snapshot.build_snapshot(str(tmp_path / "output"), str(other))
+    assert sqlite_snapshot.build_snapshot(str(tmp_path / "output"), str(other), force=True)["Namespaces"] == 0
+
+@pytest.mark.parametrize("output_format", ["json", "jsonl"])
+def test_build_snapshot_stores_aliases_as_references(tmp_path, monkeypatch, output_format):
+    import sys
+    from pop_general import build_module_structure
+    pkg = tmp_path / "aliaslib"
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "core.py").write_text(
+        "class Engine:\n    def start(self):\n        pass\n"
+        "def run(n):\n    \"\"\"Run.\n\n    Parameters\n    ----------\n    n : int\n        Steps.\n    \"\"\"\n"
+    )
+    (pkg / "api.py").write_text("from aliaslib.core import Engine, run as go\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.chdir(tmp_path)
+    try:
+        build_module_structure("aliaslib", workers=1, output_format=output_format, alias_reexports=True)
+    finally:
+        for name in list(sys.modules):
+            if name.startswith("aliaslib"):
+                del sys.modules[name]
+    snapshot = str(tmp_path / "docs.db")
+    sqlite_snapshot.build_snapshot(str(tmp_path / "output"), snapshot)
+    conn = sqlite3.connect(snapshot)
+    rows = conn.execute(
+        "SELECT n.name, c.name, f.name, f.signature FROM Functions f "
+        "LEFT JOIN Classes c ON f.parent_class_id = c.id "
+        "JOIN Namespaces n ON n.id = COALESCE(c.namespace_id, f.parent_namespace_id) ORDER BY 1, 2, 3"
+    ).fetchall()
+    # Each alias resolves by name to the owner's entity, which is stored once
+    aliases = conn.execute(
+        "SELECT n.name, a.name, a.type, COALESCE(c.id, f.id) IS NOT NULL FROM Aliases a "
+        "JOIN Namespaces n ON n.id = a.namespace_id "
+        "JOIN Namespaces o ON o.name = a.target_namespace "
+        "LEFT JOIN Classes c ON a.type = 'class' AND c.namespace_id = o.id AND c.name = a.target_name "
+        "LEFT JOIN Functions f ON a.type = 'function' AND f.parent_namespace_id = o.id AND f.name = a.target_name "
+        "ORDER BY 1, 2"
+    ).fetchall()
+    conn.close()
+    assert rows == [
+        ("aliaslib.core", None, "run", "run(n)"),
+        ("aliaslib.core", "Engine", "start", "start(self)"),
+    ]
+    assert aliases == [("aliaslib.api", "Engine", "class", 1), ("aliaslib.api", "go", "function", 1)]
+
+def test_snapshot_does_not_import_mariadb():
+    import os
+    import subprocess
+    import sys
+    code = ("import sys; sys.modules['mariadb'] = None\n"
+            "from data_create import sqlite_snapshot\n"
+            "assert 'data_create.connection' not in sys.modules\n")
+    result = subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(os.path.dirname(__file__)),
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
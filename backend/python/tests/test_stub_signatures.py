@@ -0,0 +1,98 @@
+import stub_signatures
+from stub_signatures import StubSignatureProvider, build_stub_index, parse_stub_file
+
+STUB = '''
+import sys
+from typing import overload
+from ._impl import helper as helper, Engine as Engine
+
+def add(a: int, b: int = ..., /, *, out=None) -> int: ...
+@overload
+def pick(x: int) -> int: ...
+@overload
+def pick(x: str) -> str: ...
+if sys.version_info >= (3, 8):
+    def newer(flag: bool = True) -> None: ...
+try:
+    def fast(n: int) -> int: ...
+except ImportError:
+    def fast(n: int, slow: bool = True) -> int: ...
+
+class Array:
+    def sum(self, axis: int | None = None) -> float: ...
+    @classmethod
+    def zeros(cls, n: int) -> Array: ...
+'''
+
+IMPL_STUB = '''
+def helper(*args: str, **kwargs: object) -> None: ...
+class Engine:
+    def run(self) -> None: ...
+'''
+
+
+def _make_stubbed_package(root, name="stubbed"):
+    pkg = root / name
+    pkg.mkdir()
+    (pkg / "__init__.py").write_text("")
+    (pkg / "__init__.pyi").write_text(STUB)
+    (pkg / "_impl.pyi").write_text(IMPL_STUB)
+    return pkg
+
+
+def test_parse_stub_file_signatures_and_aliases(tmp_path):
+    pkg = _make_stubbed_package(tmp_path)
+    signatures, aliases = parse_stub_file("stubbed", str(pkg / "__init__.pyi"))
+    assert signatures["stubbed.add"] == "(a: int, b: int = ..., /, *, out=None) -> int"
+    assert signatures["stubbed.pick"] == "(x: int) -> int"
+    assert signatures["stubbed.newer"] == "(flag: bool = True) -> None"
+    assert signatures["stubbed.fast"] == "(n: int) -> int"
+    assert signatures["stubbed.Array.sum"] == "(self, axis: int | None = None) -> float"
+    assert signatures["stubbed.Array.zeros"] == "(n: int) -> Array"
+    assert aliases["stubbed.helper"] == "stubbed._impl.helper"
+
+
+def test_build_stub_index_resolves_reexports_and_uses_disk_cache(tmp_path, monkeypatch):
+    _make_stubbed_package(tmp_path)
+    monkeypatch.syspath_prepend(str(tmp_path))
+    cache_dir = tmp_path / "cache"
+    index = build_stub_index("stubbed", cache_dir=str(cache_dir))
+    assert index["stubbed.helper"] == "(*args: str, **kwargs: object) -> None"
+    assert index["stubbed.Engine.run"] == "(self) -> None"
+    assert len(list(cache_dir.iterdir())) == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("stubs parsed again")
+    monkeypatch.setattr(stub_signatures, "parse_stub_file", fail)
+    assert build_stub_index("stubbed", cache_dir=str(cache_dir)) == index
+
+
+def test_typeshed_layout_and_provider_lookup(tmp_path):
+    typeshed = tmp_path / "typeshed"
+    (typeshed / "stubs" / "types-fake").mkdir(parents=True)
+    (typeshed / "stubs" / "types-fake" / "fakeext.pyi").write_text("def compiled(n: int) -> str: ...\n")
+    provider = StubSignatureProvider([str(typeshed)], cache_dir=None)
+
+    def compiled(*args):
+        pass
+    compiled.__module__, compiled.__qualname__ = "fakeext", "compiled"
+    assert provider.signature_for(compiled) == "compiled(n: int) -> str"
+    compiled.__module__ = "elsewhere"
+    assert provider.signature_for(compiled) is None
+    # Re-exported objects are also looked up under the module being extracted
+    assert provider.signature_for(compiled, "fakeext") == "compiled(n: int) -> str"
+
+
+def test_get_function_signature_uses_stubs_for_compiled_callables(tmp_path):
+    import pop_general
+    typeshed = tmp_path / "typeshed"
+    (typeshed / "stdlib").mkdir(parents=True)
+    (typeshed / "stdlib" / "builtins.pyi").write_text("def getattr(o: object, name: str, default=...) -> object: ...\n")
+    try:
+        pop_general.configure_stub_signatures([str(typeshed)], cache_dir=str(tmp_path / "cache"))
+        assert pop_general.get_function_signature(getattr) == "getattr(o: object, name: str, default=...) -> object"
+        # Callables with an introspectable signature are unchanged
+        assert pop_general.get_function_signature(len) == "len(obj, /)"
+    finally:
+        pop_general.configure_stub_signatures(enabled=False)
+    assert pop_general.get_function_signature(getattr).startswith("getattr(object, name")
@@ -1,6 +1,6 @@
 from unittest.mock import patch, MagicMock
 import builtins
-from data_create import var_pop
+from data_create import var_pop, module_rows
 
 def test_populate_variables(monkeypatch):
     mock_conn = MagicMock()
@@ -34,3 +34,123 @@ def test_populate_variables(monkeypatch):
     sqls = [call[0][0] for call in mock_cursor.execute.call_args_list]
     print('Executed SQLs:', sqls)
     assert any("INSERT INTO Variables" in sql for sql in sqls)
+
+def test_build_module_index_keeps_matching_semantics():
+    data = {
+        "classes": [
+            {"name": "A", "methods": [{"name": "m"}]},
+            {"name": "A", "methods": [{"name": "m"}, {"name": "n"}]},
+        ],
+        "functions": [{"name": "f"}, {"name": "f"}],
+    }
+    index = module_rows.build_module_index(data)
+    # First class wins, methods and functions keep every match
+    assert index["classes"]["A"] is data["classes"][0]
+    assert len(index["methods"][("A", "m")]) == 2
+    assert len(index["methods"][("A", "n")]) == 1
+    assert len(index["functions"]["f"]) == 2
+
+def test_populate_variables_loads_each_module_once(monkeypatch):
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    monkeypatch.setattr(var_pop.mariadb, 'connect', lambda **kwargs: mock_conn)
+    mock_cursor.fetchall.side_effect = [
+        [(1, 'A', 'lib.mod'), (2, 'B', 'lib.mod')],
+        [
+            (3, 'm', 1, 'A', 'lib.mod', None, None),
+            (4, 'f', None, None, None, 7, 'lib.mod'),
+            (5, 'g', None, None, None, 8, 'lib.other'),
+        ],
+    ]
+    monkeypatch.setattr(var_pop.os.path, 'isfile', lambda path: True)
+    loads = []
+    def fake_json_load(f):
+        loads.append(f)
+        param = {"p": {"type": "int", "description": "d"}}
+        return {
+            "classes": [
+                {"name": "A", "documentation": {"parameters": param},
+                 "methods": [{"name": "m", "documentation": {"parameters": param}}]},
+                {"name": "B", "documentation": {"parameters": param}},
+            ],
+            "functions": [
+                {"name": "f", "documentation": {"parameters": param}},
+                {"name": "g", "documentation": {"parameters": param}},
+            ],
+        }
+    monkeypatch.setattr(var_pop.json, 'load', fake_json_load)
+    with patch.object(builtins, 'open', lambda *a, **k: MagicMock()):
+        var_pop.populate_variables(output_dir="/fake")
+    # One load per module file, not per entity
+    assert len(loads) == 2
+    inserts = [c[0][1] for c in mock_cursor.execute.call_args_list if "INSERT INTO Variables" in c[0][0]]
+    assert sorted((row[0] or 0, row[1] or 0) for row in inserts) == [
+        (0, 3), (0, 4), (0, 5), (1, 0), (2, 0)
+    ]
+
+def test_populate_variables_records_hashes_after_the_variables(monkeypatch):
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    monkeypatch.setattr(var_pop.mariadb, 'connect', lambda **kwargs: mock_conn)
+    # namespace_entity_rows: classes, then functions of lib.mod
+    mock_cursor.fetchall.side_effect = [[], [(4, 'f', None, None)]]
+    monkeypatch.setattr(var_pop.os.path, 'isfile', lambda path: True)
+    param = {"p": {"type": "int", "description": "d"}}
+    monkeypatch.setattr(var_pop.json, 'load',
+                        lambda f: {"functions": [{"name": "f", "documentation": {"parameters": param}}]})
+    with patch.object(builtins, 'open', lambda *a, **k: MagicMock()):
+        var_pop.populate_variables(output_dir="/fake", namespaces=[(7, 'lib.mod', 'lib/mod.json', "h")])
+    calls = mock_cursor.execute.call_args_list
+    sqls = [c[0][0] for c in calls]
+    marked = [i for i, sql in enumerate(sqls) if "INSERT INTO ProcessedFiles" in sql]
+    assert len(marked) == 1
+    assert calls[marked[0]][0][1][:2] == ('lib/mod.json', "h")
+    assert max(i for i, sql in enumerate(sqls) if "INSERT INTO Variables" in sql) < marked[0]
+    mock_conn.commit.assert_called_once()
+
+def test_populate_variables_failure_records_no_hash(monkeypatch):
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+    monkeypatch.setattr(var_pop.mariadb, 'connect', lambda **kwargs: mock_conn)
+    mock_cursor.fetchall.side_effect = [[], [(4, 'f', None, None)]]
+    monkeypatch.setattr(var_pop.os.path, 'isfile', lambda path: True)
+    def failing_insert(sql, params=()):
+        if "INSERT INTO Variables" in sql:
+            raise var_pop.mariadb.Error("lost connection")
+    mock_cursor.execute.side_effect = failing_insert
+    param = {"p": {"type": "int", "description": "d"}}
+    monkeypatch.setattr(var_pop.json, 'load',
+                        lambda f: {"functions": [{"name": "f", "documentation": {"parameters": param}}]})
+    with patch.object(builtins, 'open', lambda *a, **k: MagicMock()):
+        var_pop.populate_variables(output_dir="/fake", namespaces=[(7, 'lib.mod', 'lib/mod.json', "h")])
+    sqls = [c[0][0] for c in mock_cursor.execute.call_args_list]
+    assert not any("ProcessedFiles" in sql for sql in sqls)
+    mock_conn.commit.assert_not_called()
+
+def test_process_jsonl_parameters_streams_records(tmp_path):
+    import json
+    path = tmp_path / "mod.jsonl"
+    records = [
+        {"kind": "class", "namespace": "lib.mod", "name": "A"},
+        {"kind": "parameter", "namespace": "lib.mod", "class": "A", "function": None, "name": "x",
+         "info": {"type": "int, default=3", "description": "d"}},
+        {"kind": "parameter", "namespace": "lib.mod", "class": "A", "function": "m", "name": "y", "info": {}},
+        {"kind": "parameter", "namespace": "lib.mod", "class": None, "function": "f", "name": "z", "info": {}},
+        {"kind": "parameter", "namespace": "lib.mod", "class": None, "function": "done", "name": "w", "info": {}},
+    ]
+    path.write_text("\n".join(json.dumps(r) for r in records) + "\n", encoding="utf-8")
+    mock_cursor = MagicMock()
+    class_rows = [(1, "A", "lib.mod")]
+    function_rows = [
+        (2, "m", 1, "A", "lib.mod", None, None),
+        (3, "f", None, None, None, 7, "lib.mod"),
+    ]
+    module_rows.process_jsonl_parameters(mock_cursor, str(path), class_rows, function_rows)
+    inserts = [c[0][1] for c in mock_cursor.execute.call_args_list]
+    # "done" already has its Variables (not in function_rows), so "w" is skipped
+    assert [(row[0], row[1], row[3], row[6]) for row in inserts] == [
+        (1, None, "x", "3"), (None, 2, "y", None), (None, 3, "z", None)
+    ]
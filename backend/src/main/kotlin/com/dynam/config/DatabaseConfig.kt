@@ -40,13 +40,14 @@ fun Application.configureDatabases() {
                 SchemaUtils.drop(Users)
                 SchemaUtils.drop(ProcessedFiles)
                 SchemaUtils.drop(Variables)
+                SchemaUtils.drop(Aliases)
                 SchemaUtils.drop(Functions)
                 SchemaUtils.drop(Classes)
                 SchemaUtils.drop(LibraryRequests)  // Drop LibraryRequests table
                 SchemaUtils.drop(Namespaces)
                 
                 // Create tables in order
-                SchemaUtils.create(Namespaces, Classes, Functions, Variables, ProcessedFiles, LibraryRequests, Users)
+                SchemaUtils.create(Namespaces, Classes, Functions, Variables, Aliases, ProcessedFiles, LibraryRequests, Users)
                 println("Database tables recreated successfully")
                 logger.info("Database tables recreated successfully")
                 
@@ -54,7 +55,7 @@ fun Application.configureDatabases() {
                 createDefaultAdminUser(logger)
             } else {
                 // Just create tables if they don't exist
-                SchemaUtils.createMissingTablesAndColumns(Namespaces, Classes, Functions, Variables, ProcessedFiles, LibraryRequests, Users)
+                SchemaUtils.createMissingTablesAndColumns(Namespaces, Classes, Functions, Variables, Aliases, ProcessedFiles, LibraryRequests, Users)
                 println("Database tables verified/created successfully")
                 logger.info("Database tables verified/created successfully")
             }
@@ -75,7 +76,7 @@ fun Application.configureDatabases() {
         try {
             val db = configureSQLiteConnection("jdbc:sqlite:kls_database.db")
             transaction(db) {
-                SchemaUtils.create(Namespaces, Classes, Functions, Variables, ProcessedFiles, LibraryRequests, Users)
+                SchemaUtils.create(Namespaces, Classes, Functions, Variables, Aliases, ProcessedFiles, LibraryRequests, Users)
                 logger.info("Database tables created with SQLite fallback")
             }
             
@@ -122,22 +123,11 @@ private fun populateDatabaseWithPythonScripts(logger: org.slf4j.Logger) {
         // 1. Clean tables - though we've already cleaned them in Kotlin, this is optional
         // executePythonScript(workingDir, "data_create/clean_table.py", "clean_table.clean_all()", logger)
         
-        // 2. Populate namespaces
+        // 2. Populate namespaces, entities (classes and functions) and variables
+        //    in a single interpreter instead of one process per stage
         executePythonModule(workingDir, 
-            "data_create.namespace_pop", 
-            "populate_namespaces_from_output('../output')", 
-            logger)
-        
-        // 3. Populate entities (classes and functions)
-        executePythonModule(workingDir, 
-            "data_create.entity_pop", 
-            "populate_entities_from_namespaces('../output')", 
-            logger)
-        
-        // 4. Populate variables
-        executePythonModule(workingDir, 
-            "data_create.var_pop", 
-            "populate_variables('../output')", 
+            "MainDatabase", 
+            "main()", 
             logger)
         
         logger.info("Database population completed successfully")
@@ -2,6 +2,7 @@ package com.dynam.controllers
 
 import com.dynam.dtos.table.Class
 import com.dynam.dtos.table.Function
+import com.dynam.repositories.AliasRepository
 import com.dynam.repositories.NamespaceRepository
 import com.dynam.repositories.ClassRepository
 import com.dynam.repositories.FunctionRepository
@@ -23,6 +24,7 @@ class LibraryApiController {
     private val namespaceRepository = NamespaceRepository()
     private val classRepository = ClassRepository()
     private val functionRepository = FunctionRepository()
+    private val aliasRepository = AliasRepository()
     private val libraryRequestRepository = LibraryRequestRepository()
     private val logger = LoggerFactory.getLogger(LibraryApiController::class.java)
 
@@ -74,8 +76,11 @@ class LibraryApiController {
             val response = namespaces.map { namespace ->
                 NamespaceContent(
                     name = namespace.name,
-                    classes = classRepository.getByNamespace(namespace.id),
-                    functions = functionRepository.getDirectNamespaceFunctions(namespace.id)
+                    // Re-exported entities are stored once, under their owner namespace
+                    classes = classRepository.getByNamespace(namespace.id) +
+                        aliasRepository.getClassesByNamespace(namespace.id),
+                    functions = functionRepository.getDirectNamespaceFunctions(namespace.id) +
+                        aliasRepository.getFunctionsByNamespace(namespace.id)
                 )
             }
             call.respond(response)
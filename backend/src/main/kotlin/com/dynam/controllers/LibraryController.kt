@@ -113,70 +113,20 @@ class LibraryController {
                 )
                 return
             }
-            call.application.log.info("Generating documentation for $libraryName")
-            val docProcess = ProcessBuilder("python3", "python/pop_general.py", libraryName)
+            call.application.log.info("Generating documentation for $libraryName and populating database")
+            // One interpreter and one database connection for extract -> namespaces -> entities -> variables.
+            // --write-json keeps ./output in sync, since startup repopulation reads it.
+            val pipelineProcess = ProcessBuilder("python3", "python/pipeline.py", libraryName, "--write-json")
+                .directory(File("."))
                 .redirectErrorStream(true)
                 .start()
-            val docReader = BufferedReader(InputStreamReader(docProcess.inputStream))
-            val docOutput = StringBuilder()
-            while (docReader.readLine().also { line = it } != null) {
-                docOutput.append(line).append("\n")
+            val pipelineReader = BufferedReader(InputStreamReader(pipelineProcess.inputStream))
+            val pipelineOutput = StringBuilder()
+            while (pipelineReader.readLine().also { line = it } != null) {
+                pipelineOutput.append(line).append("\n")
             }
-            val docExitCode = docProcess.waitFor()
-            if (docExitCode == 0) {
-                call.application.log.info("Populating database with $libraryName data")
-                val workingDir = File(".")
-                val namespaceProcess = ProcessBuilder(
-                    "python3", "-c",
-                    "import sys; sys.path.append('./python'); from data_create import namespace_pop; namespace_pop.populate_namespaces_from_output('./output', specific_library='$libraryName')"
-                ).directory(workingDir).redirectErrorStream(true).start()
-                val namespaceReader = BufferedReader(InputStreamReader(namespaceProcess.inputStream))
-                val namespaceOutput = StringBuilder()
-                while (namespaceReader.readLine().also { line = it } != null) {
-                    namespaceOutput.append(line).append("\n")
-                }
-                if (namespaceProcess.waitFor() != 0) {
-                    call.application.log.error("Failed to populate namespaces: $namespaceOutput")
-                    call.respond(
-                        HttpStatusCode.InternalServerError,
-                        ApiResponses.error("Failed to populate database namespaces: $namespaceOutput")
-                    )
-                    return
-                }
-                val entityProcess = ProcessBuilder(
-                    "python3", "-c",
-                    "import sys; sys.path.append('./python'); from data_create import entity_pop; entity_pop.populate_entities_from_namespaces('./output', specific_library='$libraryName')"
-                ).directory(workingDir).redirectErrorStream(true).start()
-                val entityReader = BufferedReader(InputStreamReader(entityProcess.inputStream))
-                val entityOutput = StringBuilder()
-                while (entityReader.readLine().also { line = it } != null) {
-                    entityOutput.append(line).append("\n")
-                }
-                if (entityProcess.waitFor() != 0) {
-                    call.application.log.error("Failed to populate entities: $entityOutput")
-                    call.respond(
-                        HttpStatusCode.InternalServerError,
-                        ApiResponses.error("Failed to populate database entities: $entityOutput")
-                    )
-                    return
-                }
-                val varProcess = ProcessBuilder(
-                    "python3", "-c",
-                    "import sys; sys.path.append('./python'); from data_create import var_pop; var_pop.populate_variables('./output', specific_library='$libraryName')"
-                ).directory(workingDir).redirectErrorStream(true).start()
-                val varReader = BufferedReader(InputStreamReader(varProcess.inputStream))
-                val varOutput = StringBuilder()
-                while (varReader.readLine().also { line = it } != null) {
-                    varOutput.append(line).append("\n")
-                }
-                if (varProcess.waitFor() != 0) {
-                    call.application.log.error("Failed to populate variables: $varOutput")
-                    call.respond(
-                        HttpStatusCode.InternalServerError,
-                        ApiResponses.error("Failed to populate database variables: $varOutput")
-                    )
-                    return
-                }
+            val pipelineExitCode = pipelineProcess.waitFor()
+            if (pipelineExitCode == 0) {
                 libraryRequestRepository.updateAcceptanceStatus(requestId, true)
                 call.application.log.info("Library $libraryName documented and populated in database successfully")
                 call.respond(
@@ -190,7 +140,7 @@ class LibraryController {
                 call.application.log.error("Failed to document library: $libraryName")
                 call.respond(
                     HttpStatusCode.InternalServerError,
-                    ApiResponses.error("Failed to document library: $docOutput")
+                    ApiResponses.error("Failed to document library: $pipelineOutput")
                 )
             }
         } catch (e: Exception) {
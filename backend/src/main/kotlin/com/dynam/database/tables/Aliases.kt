@@ -0,0 +1,19 @@
+package com.dynam.database.tables
+
+import org.jetbrains.exposed.sql.Table
+
+/**
+ * A class or function re-exported by a namespace (pop_general --alias-reexports).
+ * It is stored once, in its owner namespace; the alias refers to it by name.
+ */
+object Aliases : Table() {
+    val id = integer("id").autoIncrement()
+    val namespaceId = integer("namespace_id").references(Namespaces.id)
+    val name = text("name")
+    // "class" or "function"
+    val type = varchar("type", 255)
+    val targetNamespace = text("target_namespace")
+    val targetName = text("target_name")
+
+    override val primaryKey = PrimaryKey(id)
+}
@@ -0,0 +1,62 @@
+package com.dynam.repositories
+
+import com.dynam.config.dbQuery
+import com.dynam.database.tables.Aliases
+import com.dynam.database.tables.Classes
+import com.dynam.database.tables.Functions
+import com.dynam.database.tables.Namespaces
+import com.dynam.dtos.table.Class
+import com.dynam.dtos.table.Function
+import org.jetbrains.exposed.sql.*
+
+/**
+ * Resolves the aliases of a namespace to the entities of their owner
+ * namespaces. The entities keep the owner's IDs (so their details and
+ * variables are read from the owner) and take the alias name.
+ */
+class AliasRepository {
+    private val owners = Namespaces.alias("owners")
+
+    suspend fun getClassesByNamespace(namespaceId: Int): List<Class> = dbQuery {
+        Aliases
+            .join(owners, JoinType.INNER, additionalConstraint = { owners[Namespaces.name] eq Aliases.targetNamespace })
+            .join(Classes, JoinType.INNER, additionalConstraint = {
+                (Classes.namespaceId eq owners[Namespaces.id]) and (Classes.name eq Aliases.targetName)
+            })
+            .selectAll()
+            .where { (Aliases.namespaceId eq namespaceId) and (Aliases.type eq "class") }
+            .map {
+                Class(
+                    id = it[Classes.id],
+                    namespaceId = it[Classes.namespaceId],
+                    name = it[Aliases.name],
+                    description = it[Classes.description],
+                    signature = it[Classes.signature],
+                    returnType = it[Classes.returnType],
+                    example = it[Classes.example]
+                )
+            }
+    }
+
+    suspend fun getFunctionsByNamespace(namespaceId: Int): List<Function> = dbQuery {
+        Aliases
+            .join(owners, JoinType.INNER, additionalConstraint = { owners[Namespaces.name] eq Aliases.targetNamespace })
+            .join(Functions, JoinType.INNER, additionalConstraint = {
+                (Functions.parentNamespaceId eq owners[Namespaces.id]) and (Functions.name eq Aliases.targetName)
+            })
+            .selectAll()
+            .where { (Aliases.namespaceId eq namespaceId) and (Aliases.type eq "function") }
+            .map {
+                Function(
+                    id = it[Functions.id],
+                    parentClassId = it[Functions.parentClassId],
+                    parentNamespaceId = it[Functions.parentNamespaceId],
+                    name = it[Aliases.name],
+                    signature = it[Functions.signature],
+                    description = it[Functions.description],
+                    returnType = it[Functions.returnType],
+                    example = it[Functions.example]
+                )
+            }
+    }
+}
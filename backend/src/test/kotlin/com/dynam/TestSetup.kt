@@ -37,6 +37,7 @@ abstract class DatabaseTest {
                 Classes,
                 Functions,
                 Variables,
+                Aliases,
                 ProcessedFiles,
                 LibraryRequests,
                 Users
@@ -80,6 +80,20 @@ class TableSchemaTest {
         }
     }
 
+    @Test
+    fun `Aliases table has expected columns`() {
+        transaction(db) {
+            SchemaUtils.createMissingTablesAndColumns(Namespaces, Aliases)
+            val columns = Aliases.columns.map { it.name }
+            assertTrue("id" in columns)
+            assertTrue("namespace_id" in columns)
+            assertTrue("name" in columns)
+            assertTrue("type" in columns)
+            assertTrue("target_namespace" in columns)
+            assertTrue("target_name" in columns)
+        }
+    }
+
     @Test
     fun `Namespaces table has expected columns`() {
         transaction(db) {
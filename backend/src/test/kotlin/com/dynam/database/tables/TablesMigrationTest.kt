@@ -21,7 +21,7 @@ class TablesMigrationTest {
         db = Database.connect("jdbc:sqlite::memory:", driver = "org.sqlite.JDBC")
         transaction(db) {
             SchemaUtils.create(
-                Users, Classes, Variables, Functions, Namespaces, LibraryRequests, ProcessedFiles
+                Users, Classes, Variables, Functions, Aliases, Namespaces, LibraryRequests, ProcessedFiles
             )
         }
     }
@@ -30,7 +30,7 @@ class TablesMigrationTest {
     fun tearDown() {
         transaction(db) {
             SchemaUtils.drop(
-                Users, Classes, Variables, Functions, Namespaces, LibraryRequests, ProcessedFiles
+                Users, Classes, Variables, Functions, Aliases, Namespaces, LibraryRequests, ProcessedFiles
             )
         }
     }
@@ -42,6 +42,7 @@ class TablesMigrationTest {
             assertTrue(Users.selectAll().toList() != null)
             assertTrue(Classes.selectAll().toList() != null)
             assertTrue(Variables.selectAll().toList() != null)
+            assertTrue(Aliases.selectAll().toList() != null)
             assertTrue(Functions.selectAll().toList() != null)
             assertTrue(Namespaces.selectAll().toList() != null)
             assertTrue(LibraryRequests.selectAll().toList() != null)
@@ -52,15 +53,15 @@ class TablesMigrationTest {
     @Test
     fun `dropping tables should not throw`() {
         transaction(db) {
-            SchemaUtils.drop(Users, Classes, Variables, Functions, Namespaces, LibraryRequests, ProcessedFiles)
+            SchemaUtils.drop(Users, Classes, Variables, Functions, Aliases, Namespaces, LibraryRequests, ProcessedFiles)
         }
     }
 
     @Test
     fun `tables can be recreated after drop`() {
         transaction(db) {
-            SchemaUtils.drop(Users, Classes, Variables, Functions, Namespaces, LibraryRequests, ProcessedFiles)
-            SchemaUtils.create(Users, Classes, Variables, Functions, Namespaces, LibraryRequests, ProcessedFiles)
+            SchemaUtils.drop(Users, Classes, Variables, Functions, Aliases, Namespaces, LibraryRequests, ProcessedFiles)
+            SchemaUtils.create(Users, Classes, Variables, Functions, Aliases, Namespaces, LibraryRequests, ProcessedFiles)
             assertTrue(Users.selectAll().toList() != null)
             assertTrue(Classes.selectAll().toList() != null)
             assertTrue(Variables.selectAll().toList() != null)
@@ -0,0 +1,75 @@
+package com.dynam.repositories
+
+import com.dynam.DatabaseTest
+import com.dynam.database.tables.Aliases
+import com.dynam.database.tables.Classes
+import com.dynam.database.tables.Functions
+import com.dynam.database.tables.Namespaces
+import org.jetbrains.exposed.sql.insert
+import kotlin.test.*
+
+class AliasRepositoryTest : DatabaseTest() {
+    private lateinit var repo: AliasRepository
+    private var ownerId: Int = 0
+    private var aliasingId: Int = 0
+    private var classId: Int = 0
+    private var functionId: Int = 0
+
+    @BeforeTest
+    fun setUpRepo() {
+        repo = AliasRepository()
+        org.jetbrains.exposed.sql.transactions.transaction(db) {
+            ownerId = Namespaces.insert { it[name] = "lib.core" } get Namespaces.id
+            aliasingId = Namespaces.insert { it[name] = "lib" } get Namespaces.id
+            classId = Classes.insert {
+                it[namespaceId] = ownerId
+                it[name] = "Engine"
+                it[description] = "An engine"
+            } get Classes.id
+            functionId = Functions.insert {
+                it[parentNamespaceId] = ownerId
+                it[name] = "run"
+                it[signature] = "run(n)"
+            } get Functions.id
+            Aliases.insert {
+                it[Aliases.namespaceId] = aliasingId
+                it[Aliases.name] = "Engine"
+                it[Aliases.type] = "class"
+                it[Aliases.targetNamespace] = "lib.core"
+                it[Aliases.targetName] = "Engine"
+            }
+            Aliases.insert {
+                it[Aliases.namespaceId] = aliasingId
+                it[Aliases.name] = "go"
+                it[Aliases.type] = "function"
+                it[Aliases.targetNamespace] = "lib.core"
+                it[Aliases.targetName] = "run"
+            }
+        }
+    }
+
+    @Test
+    fun testClassAliasResolvesToTheOwnerClass() = runTest {
+        val found = repo.getClassesByNamespace(aliasingId)
+        assertEquals(1, found.size)
+        assertEquals(classId, found[0].id)
+        assertEquals(ownerId, found[0].namespaceId)
+        assertEquals("Engine", found[0].name)
+        assertEquals("An engine", found[0].description)
+    }
+
+    @Test
+    fun testFunctionAliasTakesTheAliasName() = runTest {
+        val found = repo.getFunctionsByNamespace(aliasingId)
+        assertEquals(1, found.size)
+        assertEquals(functionId, found[0].id)
+        assertEquals("go", found[0].name)
+        assertEquals("run(n)", found[0].signature)
+    }
+
+    @Test
+    fun testOwnerNamespaceHasNoAliases() = runTest {
+        assertTrue(repo.getClassesByNamespace(ownerId).isEmpty())
+        assertTrue(repo.getFunctionsByNamespace(ownerId).isEmpty())
+    }
+}